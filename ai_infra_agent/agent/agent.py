@@ -5,14 +5,26 @@ import datetime # Import datetime for timestamp
 import re # Import re for regex operations
 import secrets # Import secrets for secure random string generation
 import string # Import string for character sets
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
 
 from langchain_core.language_models import BaseLanguageModel
 from langchain.schema import Generation, LLMResult
 
 from ai_infra_agent.state.manager import StateManager
 from ai_infra_agent.infrastructure.tool_factory import ToolFactory
+from ai_infra_agent.infrastructure.tool_cache import cache_scope
 from ai_infra_agent.agent.prompt_builder import PromptBuilder
+from ai_infra_agent.agent.prompt_cache import cache_hinted_input, cached_prompt_tokens, prefix_cache_key
+from ai_infra_agent.agent.plan_cache import PlanCache, plan_cache_key
+from ai_infra_agent.agent.plan_stream import IncrementalPlanParser, PLAN_STEPS_KEY, chunk_text
+from ai_infra_agent.agent.tool_pool import ToolExecutionPool
+from ai_infra_agent.agent.llm_pool import LLMClientPool, api_key_fingerprint
+from ai_infra_agent.agent.llm_limiter import LLMConcurrencyLimiter
+from ai_infra_agent.agent.prompt_archive import PromptArchive
+from ai_infra_agent.agent.llm_hedging import LatencyTracker, LLMTarget, hedged
+from ai_infra_agent.agent.plan_validator import PlanValidator, validation_error, summarize as summarize_validation
+from ai_infra_agent.agent.structured_output import StructuredPlanOutput, decode_plan, decode_step
 from ai_infra_agent.core.logging import logger
 from ai_infra_agent.services.discovery.scanner import DiscoveryScanner # Import DiscoveryScanner
 from ai_infra_agent.core.config import settings # Import settings
@@ -29,7 +41,7 @@ class StateAwareAgent:
     The AI agent that understands the infrastructure state and processes user requests.
     """
 
-    def __init__(self, settings, state_manager: StateManager, tool_factory: ToolFactory, logger, scanner: DiscoveryScanner, user_credentials: Dict[str, Any] = None, llm: BaseLanguageModel = None):
+    def __init__(self, settings, state_manager: StateManager, tool_factory: ToolFactory, logger, scanner: DiscoveryScanner, user_credentials: Dict[str, Any] = None, llm: BaseLanguageModel = None, tool_pool: Optional[ToolExecutionPool] = None, plan_cache: Optional[PlanCache] = None, llm_pool: Optional[LLMClientPool] = None, prompt_builder: Optional[PromptBuilder] = None, llm_limiter: Optional[LLMConcurrencyLimiter] = None, prompt_archive: Optional[PromptArchive] = None, latency_tracker: Optional[LatencyTracker] = None, plan_validator: Optional[PlanValidator] = None, structured_output: Optional[StructuredPlanOutput] = None):
         """
         Initializes the StateAwareAgent.
 
@@ -40,6 +52,15 @@ class StateAwareAgent:
             logger: The logger instance.
             scanner (DiscoveryScanner): The scanner for discovering AWS resources.
             llm (BaseLanguageModel, optional): The language model to use. If None, it will be initialized based on settings.
+            tool_pool (ToolExecutionPool, optional): Admits tool calls fairly across users. If None, tools run immediately.
+            plan_cache (PlanCache, optional): Reuses plans for repeated requests. If None, every request goes to the LLM.
+            llm_pool (LLMClientPool, optional): Shares LLM clients across agents. If None, the agent creates its own client.
+            prompt_builder (PromptBuilder, optional): A shared prompt builder. If None, the agent creates its own.
+            llm_limiter (LLMConcurrencyLimiter, optional): Limits concurrent LLM calls per provider and key. If None, calls are not limited.
+            prompt_archive (PromptArchive, optional): Archives the prompts sent to the LLM. If None, prompts are not kept.
+            latency_tracker (LatencyTracker, optional): Records LLM latencies, which set the hedging delay. If None, the agent tracks its own.
+            plan_validator (PlanValidator, optional): Validates generated plans and drives their repair. If None, plans are returned as generated.
+            structured_output (StructuredPlanOutput, optional): Makes the LLM return plans through a forced tool call. If None, plans are parsed from the response text.
         """
         self.settings = settings
         self.state_manager = state_manager
@@ -47,6 +68,13 @@ class StateAwareAgent:
         self.logger = logger
         self.scanner = scanner  # Store the scanner instance
         self.user_credentials = user_credentials or {}
+        self.tool_pool = tool_pool
+        self.plan_cache = plan_cache
+        self.llm_limiter = llm_limiter
+        self.prompt_archive = prompt_archive
+        self.latency_tracker = latency_tracker or LatencyTracker()
+        self.plan_validator = plan_validator
+        self.structured_output = structured_output
 
         # Configure tool factory with user's AWS config if present
         try:
@@ -56,20 +84,77 @@ class StateAwareAgent:
         except Exception:
             self.logger.debug("Tool factory does not support set_aws_config or failed to set config")
 
+        # Identifies the API key for pooling and rate limiting without holding the key itself.
+        self._llm_key = api_key_fingerprint(self._llm_api_key())
         if llm:
             self.llm = llm
+        elif llm_pool is not None:
+            self.llm = llm_pool.get(self._llm_pool_key(), self._initialize_llm)
         else:
             self.llm = self._initialize_llm()
+        self.primary_llm = LLMTarget(self.settings.provider, self.settings.model, self.llm, self._llm_key)
+        self.hedge_llm = self._initialize_hedge_llm(llm_pool)
+        if self.structured_output is not None:
+            for target in filter(None, (self.primary_llm, self.hedge_llm)):
+                target.planner = self.structured_output.bind(target.provider, target.llm)
 
-        self.prompt_builder = PromptBuilder()
+        self.prompt_builder = prompt_builder or PromptBuilder()
         self.logger.info("StateAwareAgent initialized.")
 
-    def _initialize_llm(self) -> BaseLanguageModel:
+    def _llm_api_key(self, provider: Optional[str] = None) -> Optional[str]:
         """
-        Initializes the appropriate LLM based on settings.
+        Returns the API key for a provider (by default the configured one), or None if the provider does not use one.
+        Gemini prefers the user's own Google API key over the environment.
         """
-        provider = self.settings.provider
-        model_name = self.settings.model
+        provider = provider or self.settings.provider
+        if provider == "gemini":
+            api_key = None
+            try:
+                api_key = self.user_credentials.get("google", {}).get("api_key") if self.user_credentials else None
+            except Exception:
+                api_key = None
+            return api_key or os.getenv("GOOGLE_API_KEY")
+        if provider == "openai":
+            return os.getenv("OPENAI_API_KEY")
+        if provider == "claude":
+            return os.getenv("ANTHROPIC_API_KEY")
+        return None
+
+    def _llm_pool_key(self, provider: Optional[str] = None, model: Optional[str] = None) -> LLMClientPool.Key:
+        """Identifies the LLM client this agent needs; agents with equal keys can share a client."""
+        provider = provider or self.settings.provider
+        region = settings.aws.region if provider == "bedrock" else None
+        return (
+            provider,
+            model or self.settings.model,
+            self.settings.temperature,
+            self.settings.max_tokens,
+            region,
+            api_key_fingerprint(self._llm_api_key(provider)),
+        )
+
+    def _initialize_hedge_llm(self, llm_pool: Optional[LLMClientPool]) -> Optional[LLMTarget]:
+        """
+        Initializes the LLM slow primary calls are hedged with, if a hedge provider or model is configured.
+        """
+        provider = getattr(self.settings, "hedge_provider", None) or self.settings.provider
+        model = getattr(self.settings, "hedge_model", None) or self.settings.model
+        if (provider, model) == (self.settings.provider, self.settings.model):
+            return None
+        create = lambda: self._initialize_llm(provider, model)
+        try:
+            llm = llm_pool.get(self._llm_pool_key(provider, model), create) if llm_pool is not None else create()
+        except Exception as e:
+            self.logger.warning(f"Could not initialize the hedge LLM {provider}:{model}, hedging is disabled: {e}")
+            return None
+        return LLMTarget(provider, model, llm, api_key_fingerprint(self._llm_api_key(provider)))
+
+    def _initialize_llm(self, provider: Optional[str] = None, model_name: Optional[str] = None) -> BaseLanguageModel:
+        """
+        Initializes the appropriate LLM based on settings, or for the given provider and model.
+        """
+        provider = provider or self.settings.provider
+        model_name = model_name or self.settings.model
         temperature = self.settings.temperature
         max_tokens = self.settings.max_tokens
 
@@ -78,13 +163,7 @@ class StateAwareAgent:
 
         if provider == "gemini":
             # Prefer per-user Google API key from credentials; fallback to env var
-            api_key = None
-            try:
-                api_key = self.user_credentials.get("google", {}).get("api_key") if self.user_credentials else None
-            except Exception:
-                api_key = None
-            if not api_key:
-                api_key = os.getenv("GOOGLE_API_KEY")
+            api_key = self._llm_api_key(provider)
             if not api_key:
                 self.logger.error("GOOGLE_API_KEY not found in user credentials or environment. Gemini LLM cannot be initialized.")
                 raise ValueError("GOOGLE_API_KEY is required for Gemini provider.")
@@ -95,7 +174,7 @@ class StateAwareAgent:
                 google_api_key=api_key,
             )
         elif provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = self._llm_api_key(provider)
             if not api_key:
                 self.logger.error("OPENAI_API_KEY not found in environment variables. OpenAI LLM cannot be initialized.")
                 raise ValueError("OPENAI_API_KEY is required for OpenAI provider.")
@@ -106,7 +185,7 @@ class StateAwareAgent:
                 api_key=api_key
             )
         elif provider == "claude":
-            api_key = os.getenv("ANTHROPIC_API_KEY")
+            api_key = self._llm_api_key(provider)
             if not api_key:
                 self.logger.error("ANTHROPIC_API_KEY not found in environment variables. Claude LLM cannot be initialized.")
                 raise ValueError("ANTHROPIC_API_KEY is required for Claude provider.")
@@ -144,7 +223,7 @@ class StateAwareAgent:
                     return "simple_mock"
             return SimpleMockLLM()
 
-    def _resolve_placeholders(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def resolve_placeholders(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Resolves placeholders in the parameters dictionary.
         Handles {{timestamp}} and {{random_string}}.
@@ -173,88 +252,338 @@ class StateAwareAgent:
         Returns:
             Dict[str, Any]: The execution plan generated by the LLM.
         """
+        cache_key, cached_plan, static_prefix, dynamic_suffix = await self._prepare_request(request)
+        if cached_plan is not None:
+            return cached_plan
+
+        # 3. Interact with the LLM; a slow or failing primary LLM is hedged with the secondary one
+        primary = lambda: self._generate_plan(self.primary_llm, static_prefix, dynamic_suffix)
+        if self.hedge_llm is None:
+            plan = await primary()
+        else:
+            secondary = lambda: self._generate_plan(self.hedge_llm, static_prefix, dynamic_suffix)
+            plan, winner = await hedged(primary, secondary, self._hedge_delay(), lambda result: "error" not in result)
+            if winner == "secondary":
+                logger.info(f"The hedge LLM {self.hedge_llm.name} returned the plan first.")
+        plan = await self._validate_plan(plan)
+
+        if cache_key is not None:
+            self.plan_cache.put(cache_key, request, plan)
+
+        # 4. Return the plan
+        return plan
+
+    async def stream_request(self, request: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Processes a user request like process_request, but streams the LLM response and
+        yields each plan step as soon as it has been generated.
+
+        Args:
+            request (str): The user's request in natural language.
+
+        Yields:
+            Dict[str, Any]: Events: {"type": "step", "index", "step"} for every step, then
+                            {"type": "plan", "plan"} with the complete plan, or {"type": "error", "error"}.
+        """
+        cache_key, cached_plan, static_prefix, dynamic_suffix = await self._prepare_request(request)
+        if cached_plan is not None:
+            for index, step in enumerate(cached_plan.get(PLAN_STEPS_KEY) or []):
+                yield {"type": "step", "index": index, "step": step}
+            yield {"type": "plan", "plan": cached_plan, "cached": True}
+            return
+
+        # Streams are not hedged: once steps have been sent to the client, the plan cannot change.
+        parser = IncrementalPlanParser(self.logger)
+        structured = self.primary_llm.planner is not None
+        llm_input, invoke_kwargs = self._llm_input(self.primary_llm, static_prefix, dynamic_suffix)
+        try:
+            async for chunk in self._astream_llm(self.primary_llm, llm_input, invoke_kwargs):
+                # A structured plan streams as the partial JSON arguments of the plan tool call.
+                text = StructuredPlanOutput.chunk_text(chunk) if structured else chunk_text(getattr(chunk, "content", chunk))
+                base_index = parser.steps_emitted
+                for offset, step in enumerate(parser.feed(text)):
+                    yield {"type": "step", "index": base_index + offset, "step": decode_step(step)}
+            plan = self._parse_plan(parser.text)
+            if structured and "error" not in plan:
+                plan = decode_plan(plan)
+        except Exception as e:
+            logger.error(f"An error occurred during LLM streaming: {e}")
+            plan = {"error": str(e)}
+        # Repaired steps replace the streamed ones in the final plan event.
+        plan = await self._validate_plan(plan)
+
+        if cache_key is not None:
+            self.plan_cache.put(cache_key, request, plan)
+        if "error" in plan:
+            yield {"type": "error", "error": plan}
+        else:
+            yield {"type": "plan", "plan": plan, "cached": False}
+
+    async def _discover_state(self) -> None:
+        """
+        Discovers the user's resources and makes them the current state.
+
+        When discovery takes longer than the discovery deadline, the state last discovered for
+        the same account and region is used instead, if it is recent enough; the discovery
+        keeps running in the background and refreshes that state for the next request.
+        """
+        scope = cache_scope(self.user_credentials.get("aws") or {})
+        discovery = asyncio.ensure_future(self.scanner.scan_aws_resources())
+        deadline = getattr(self.settings, "discovery_deadline_seconds", None)
+        fallback = None
+        if deadline is not None:
+            fallback = self.state_manager.last_discovered_state(
+                scope, getattr(self.settings, "discovery_fallback_max_age_seconds", 900)
+            )
+        if fallback is None:
+            self.state_manager.set_discovered_state(await discovery, scope=scope)
+            self.logger.info("Automatic AWS resource discovery completed.")
+            return
+        try:
+            # Shielded, so the discovery is not cancelled when the deadline passes.
+            discovered_infra_state = await asyncio.wait_for(asyncio.shield(discovery), timeout=deadline)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                f"AWS resource discovery did not finish within {deadline:.1f}s; using the last discovered state."
+            )
+            discovery.add_done_callback(lambda done: self._remember_discovery(scope, done))
+            self.state_manager.set_discovered_state(fallback)
+            return
+        self.state_manager.set_discovered_state(discovered_infra_state, scope=scope)
+        self.logger.info("Automatic AWS resource discovery completed.")
+
+    def _remember_discovery(self, scope: Tuple[str, str], discovery: "asyncio.Future[Any]") -> None:
+        """Keeps the result of a discovery that finished after its deadline for the next request."""
+        if discovery.cancelled() or discovery.exception() is not None:
+            return
+        self.state_manager.remember_discovered_state(scope, discovery.result())
+
+    async def _generate_plan(self, target: LLMTarget, static_prefix: str, dynamic_suffix: str) -> Dict[str, Any]:
+        """
+        Sends the prompt to one LLM and parses its plan.
+
+        Returns:
+            Dict[str, Any]: The plan, or a dict with an "error" key.
+        """
+        llm_input, invoke_kwargs = self._llm_input(target, static_prefix, dynamic_suffix)
+        try:
+            started = time.monotonic()
+            llm_response_obj = await self._ainvoke_llm(target, llm_input, invoke_kwargs, target.planner)
+            self.latency_tracker.record(target.name, time.monotonic() - started)
+            cached_tokens = cached_prompt_tokens(llm_response_obj)
+            if cached_tokens:
+                logger.info(f"LLM served {cached_tokens} prompt tokens from its prompt cache.")
+            if target.planner is not None:
+                plan = StructuredPlanOutput.extract(llm_response_obj)
+                if plan is not None:
+                    return plan
+                logger.warning(f"{target.name} did not call the plan tool; parsing its plan from the response text.")
+            return self._parse_plan(chunk_text(llm_response_obj.content))
+        except Exception as e:
+            logger.error(f"An error occurred during LLM interaction with {target.name}: {e}")
+            return {"error": str(e)}
+
+    async def _validate_plan(self, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validates a generated plan locally. Invalid steps are sent back to the LLM for repair,
+        up to the configured number of attempts.
+
+        Returns:
+            Dict[str, Any]: The valid (possibly repaired) plan, or an error listing the invalid steps.
+        """
+        if self.plan_validator is None or "error" in plan:
+            return plan
+        invalid_steps = self.plan_validator.validate(plan)
+        for attempt in range(getattr(self.settings, "plan_repair_attempts", 1)):
+            if not invalid_steps:
+                break
+            logger.warning(f"Plan failed validation, repairing {len(invalid_steps)} step(s): {summarize_validation(invalid_steps)}")
+            repaired = await self._repair_plan(plan, invalid_steps)
+            if "error" in repaired:
+                break
+            plan = self.plan_validator.merge_repaired_steps(plan, repaired)
+            invalid_steps = self.plan_validator.validate(plan)
+        if invalid_steps:
+            logger.error(f"Plan failed validation: {summarize_validation(invalid_steps, limit=None)}")
+            return validation_error(invalid_steps)
+        return plan
+
+    async def _repair_plan(self, plan: Dict[str, Any], invalid_steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Asks the primary LLM to fix only the invalid steps of a plan. Returns the corrected steps."""
+        repair_prompt = self.plan_validator.repair_prompt(plan, invalid_steps)
+        try:
+            llm_response_obj = await self._ainvoke_llm(self.primary_llm, repair_prompt, {})
+            return self._parse_plan(chunk_text(llm_response_obj.content))
+        except Exception as e:
+            logger.error(f"An error occurred while repairing the plan: {e}")
+            return {"error": str(e)}
+
+    def _hedge_delay(self) -> float:
+        """
+        Returns how long the primary LLM may take before it is hedged: the configured
+        percentile of its recent latencies, or the initial delay until enough are known.
+        """
+        delay = self.latency_tracker.percentile(
+            self.primary_llm.name,
+            getattr(self.settings, "hedge_percentile", 0.95),
+            min_samples=getattr(self.settings, "hedge_min_samples", 20),
+        )
+        if delay is None:
+            delay = getattr(self.settings, "hedge_initial_delay_seconds", 15.0)
+        return max(delay, getattr(self.settings, "hedge_min_delay_seconds", 2.0))
+
+    def _llm_input(self, target: LLMTarget, static_prefix: str, dynamic_suffix: str) -> Tuple[Any, Dict[str, Any]]:
+        """Builds the input and extra invoke arguments for an LLM, with its provider's prompt-caching hints."""
+        if getattr(self.settings, "prompt_cache_enabled", True):
+            return cache_hinted_input(target.provider, target.model, static_prefix, dynamic_suffix)
+        return static_prefix + dynamic_suffix, {}
+
+    async def _ainvoke_llm(self, target: LLMTarget, llm_input: Any, invoke_kwargs: Dict[str, Any],
+                           runnable: Optional[Any] = None) -> Any:
+        """
+        Calls an LLM through its native async API, within the limiter's concurrency limits and the LLM deadline.
+        'runnable' replaces the target's client, e.g. with its structured planner.
+        """
+        runnable = runnable or target.llm
+        call = lambda: runnable.ainvoke(llm_input, **invoke_kwargs)
+        if self.llm_limiter is not None:
+            limited_call = call
+            call = lambda: self.llm_limiter.invoke(target.provider, target.key, limited_call)
+        deadline = getattr(self.settings, "llm_deadline_seconds", None)
+        if deadline is None:
+            return await call()
+        try:
+            return await asyncio.wait_for(call(), timeout=deadline)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"The LLM did not return a plan within {deadline:.0f}s.") from None
+
+    async def _astream_llm(self, target: LLMTarget, llm_input: Any, invoke_kwargs: Dict[str, Any]) -> AsyncIterator[Any]:
+        """
+        Streams an LLM response through its native async API, within the limiter's concurrency limits.
+        The whole stream, including the wait for each chunk, must finish within the LLM deadline.
+        """
+        runnable = target.planner or target.llm
+        open_stream = lambda: runnable.astream(llm_input, **invoke_kwargs)
+        stream = open_stream() if self.llm_limiter is None else self.llm_limiter.stream(target.provider, target.key, open_stream)
+        deadline = getattr(self.settings, "llm_deadline_seconds", None)
+        if deadline is None:
+            async for chunk in stream:
+                yield chunk
+            return
+        expires_at = time.monotonic() + deadline
+        chunks = stream.__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), timeout=max(0.0, expires_at - time.monotonic()))
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"The LLM did not finish streaming the plan within {deadline:.0f}s.") from None
+                yield chunk
+        finally:
+            if hasattr(chunks, "aclose"):
+                await chunks.aclose()
+
+    async def _prepare_request(self, request: str) -> Tuple[Optional[PlanCache.CacheKey], Optional[Dict[str, Any]], str, str]:
+        """
+        Discovers the current state and builds the prompt for a request.
+
+        Returns:
+            Tuple: The plan cache key (or None), the cached plan on a cache hit (or None),
+                   and the static prefix and dynamic suffix of the prompt.
+        """
         logger.info(f"Processing request: '{request}'")
 
         # 0. Perform a fresh discovery before processing the request
         self.logger.info("Triggering automatic AWS resource discovery before processing request...")
-        discovered_infra_state = await self.scanner.scan_aws_resources()
-        self.state_manager.set_discovered_state(discovered_infra_state)
-        self.logger.info("Automatic AWS resource discovery completed.")
+        await self._discover_state()
 
         # 1. Gather context
         # Get formatted current state from StateManager (now includes discovered state)
         current_state_formatted = self.state_manager.get_current_state_formatted()
         logger.debug(f"Formatted current state:\n{current_state_formatted}")
 
-        # Get formatted tool definitions from PromptBuilder
-        tools_context = self.prompt_builder.tools_context_template
-        logger.debug(f"Formatted tool definitions:\n{tools_context}") # Corrected f-string
+        # A plan generated for the same request against the same state is reused without calling the LLM
+        cache_key = None
+        if self.plan_cache is not None:
+            prompt_key = f"{self.settings.provider}:{self.settings.model}:{prefix_cache_key(self.prompt_builder.static_prefix)}"
+            cache_key = plan_cache_key(cache_scope(self.user_credentials.get("aws") or {}), prompt_key, self.state_manager.state)
+            cached_plan = self.plan_cache.get(cache_key, request)
+            if cached_plan is not None:
+                logger.info("Serving the plan from the plan cache, skipping the LLM call.")
+                return cache_key, cached_plan, "", ""
 
-        # 2. Build the prompt
-        prompt = self.prompt_builder.build(
-            request=request,
-            tools_context=tools_context,
-            current_state_formatted=current_state_formatted
-        )
-        logger.debug(f"Generated Prompt:\n{prompt}\n")
+        # 2. Build the prompt: a static prefix, identical for every request, followed by the state and request
+        static_prefix, dynamic_suffix = self.prompt_builder.build_parts(request, current_state_formatted)
 
-        # 3. Interact with the LLM
-        try:
-            logger.info("Sending prompt to LLM...")
-            # Log the full prompt to a file for debugging
-            with open("llm_request.log", "w", encoding="utf-8") as f:
-                f.write(prompt)
-            logger.debug("Full LLM prompt saved to llm_request.log")
-            # Run the synchronous LLM call in a separate thread
-            llm_response_obj = await asyncio.to_thread(self.llm.invoke, prompt)
-            llm_response = llm_response_obj.content
-            logger.debug(f"Raw LLM response:\n{llm_response}") # Added debug log for raw response
-            try:
-                # Remove markdown code block if present
-                json_match = re.search(r"```json\s*(.*?)\s*```", llm_response, re.DOTALL)
-                if json_match:
-                    cleaned_llm_response = json_match.group(1)
-                    logger.debug("Removed markdown code block from LLM response.")
-                else:
-                    cleaned_llm_response = llm_response
-                    logger.debug("No markdown code block found in LLM response.")
-
-                plan = json.loads(cleaned_llm_response)
-                logger.debug(f"Parsed LLM plan:\n{json.dumps(plan, indent=2)}") # Added debug log for parsed plan
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to decode LLM response into JSON: {e}")
-                logger.error(f"Problematic LLM response content: {llm_response[:500]}...") # Log first 500 chars
-                plan = {"error": "LLM returned invalid JSON.", "details": str(e)}
-        except Exception as e:
-            logger.error(f"An error occurred during LLM interaction: {e}")
-            plan = {"error": str(e)}
+        # The full prompt is written to the archive in the background, if it is sampled
+        if self.prompt_archive is not None:
+            prompt_id = self.prompt_archive.record(static_prefix, dynamic_suffix, {
+                "request": request,
+                "provider": self.settings.provider,
+                "model": self.settings.model,
+                "user_id": self.user_credentials.get("user_id"),
+            })
+            if prompt_id:
+                logger.debug(f"Prompt archived as {prompt_id}")
 
+        logger.info(f"Sending prompt to LLM ({len(static_prefix) + len(dynamic_suffix)} characters)...")
+        return cache_key, None, static_prefix, dynamic_suffix
 
-        # 4. Return the plan (no complex validation in MVP)
-        return plan
+    def _parse_plan(self, llm_response: str) -> Dict[str, Any]:
+        """Parses the LLM response into a plan, or an error dict if it is not valid JSON."""
+        logger.debug(f"Raw LLM response:\n{llm_response}") # Added debug log for raw response
+        try:
+            # Remove markdown code block if present
+            json_match = re.search(r"```json\s*(.*?)\s*```", llm_response, re.DOTALL)
+            if json_match:
+                cleaned_llm_response = json_match.group(1)
+                logger.debug("Removed markdown code block from LLM response.")
+            else:
+                cleaned_llm_response = llm_response
+                logger.debug("No markdown code block found in LLM response.")
+
+            plan = json.loads(cleaned_llm_response)
+            logger.debug(f"Parsed LLM plan:\n{json.dumps(plan, indent=2)}") # Added debug log for parsed plan
+            return plan
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode LLM response into JSON: {e}")
+            logger.error(f"Problematic LLM response content: {llm_response[:500]}...") # Log first 500 chars
+            return {"error": "LLM returned invalid JSON.", "details": str(e)}
 
     async def execute_tool(self, tool_name: str, **kwargs) -> Dict[str, Any]:
         """
         Executes a specific tool by name.
-        The user_aws_config is expected to be passed in kwargs.
+        The user_aws_config is expected to be passed in kwargs. An optional 'connection'
+        (AWSConnectionContext) makes the tool share the AWS clients of the caller's plan or request.
+        'compensation=True' marks a rollback call, which bypasses the tool pool: rollbacks run
+        their waves in parallel and may wait minutes for instances to terminate, and a rollback
+        rejected by the pool would leave resources behind. They are bounded by the plan's size.
         """
         self.logger.info(f"Executing tool '{tool_name}' with params: {kwargs}")
         
         user_aws_config = kwargs.pop("user_aws_config", None)
+        connection = kwargs.pop("connection", None)
+        compensation = kwargs.pop("compensation", False)
         if user_aws_config is None:
             self.logger.error(f"user_aws_config not provided for tool '{tool_name}'")
             raise ValueError(f"user_aws_config is required for tool '{tool_name}'")
 
         # Resolve placeholders in remaining kwargs before executing the tool
-        resolved_kwargs = self._resolve_placeholders(kwargs)
+        resolved_kwargs = self.resolve_placeholders(kwargs)
         self.logger.debug(f"Resolved tool parameters: {resolved_kwargs}")
 
-        tool = self.tool_factory.get_tool(tool_name, user_aws_config)
+        tool = self.tool_factory.get_tool(tool_name, user_aws_config, connection=connection)
         
-        # The tool's execute method is synchronous, so we run it in an executor
-        # to avoid blocking the asyncio event loop.
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, lambda: tool.execute(**resolved_kwargs))
+        # Tools call AWS natively when they can; otherwise their synchronous execute
+        # runs on the AWS thread pool so the event loop is never blocked.
+        if self.tool_pool is not None and not compensation:
+            result = await self.tool_pool.run(
+                self.user_credentials.get("user_id"), lambda: tool.aexecute(**resolved_kwargs)
+            )
+        else:
+            result = await tool.aexecute(**resolved_kwargs)
         if isinstance(result, dict) and "error" in result:
             err = result.get("error")
             self.logger.error(f"Tool '{tool_name}' execution failed with error: {err}")
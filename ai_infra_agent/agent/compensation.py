@@ -0,0 +1,285 @@
+import asyncio
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Set
+
+from loguru import logger
+
+from ai_infra_agent.agent.tool_pool import ToolPoolRejectedError
+
+# Errors that mean AWS has not finished releasing a dependent resource yet, so the
+# deletion is retried (e.g. a security group still used by a terminating instance).
+RETRYABLE_ERRORS = (
+    "DependencyViolation",
+    "InvalidGroup.InUse",
+    "ResourceInUse",
+    "InvalidDBSubnetGroupStateFault",
+    "InvalidDBInstanceState",
+    "IncorrectState",
+)
+
+# Errors that mean the resource is already gone, which is the goal of a compensation.
+ALREADY_DELETED_ERRORS = ("NotFound", "NoSuchBucket", "DBInstanceNotFound", "DBSubnetGroupNotFoundFault")
+
+
+class CompensationAction:
+    """An inverse action that undoes the effect of one completed plan step."""
+
+    def __init__(self, step_id: str, step_name: str, tool_name: str, params: Dict[str, Any], resource_ids: List[str]):
+        """
+        Args:
+            step_id (str): The ID of the step being undone.
+            step_name (str): The display name of the step being undone.
+            tool_name (str): The tool that performs the inverse action.
+            params (Dict[str, Any]): The parameters for the inverse tool.
+            resource_ids (List[str]): The IDs of the resources removed by the action.
+        """
+        self.step_id = step_id
+        self.step_name = step_name
+        self.tool_name = tool_name
+        self.params = params
+        self.resource_ids = resource_ids
+        self.status = "pending"
+        self.error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stepId": self.step_id,
+            "step": self.step_name,
+            "tool": self.tool_name,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class CompensationEngine:
+    """
+    Records an inverse action for every completed step that created or attached something,
+    and undoes them when a later step fails.
+
+    Teardown runs in reverse dependency order: an action only runs once every action
+    undoing a step that depended on it has finished. Actions whose dependents are done
+    run together in parallel waves. Deletions that fail because AWS is still releasing a
+    dependency are retried with backoff; if an action fails for good, everything it
+    depends on is skipped rather than attempted and left half-deleted.
+    """
+
+    def __init__(self, logger: logger, max_attempts: int = 6, retry_delay: float = 5.0):
+        """
+        Args:
+            logger: The logger instance.
+            max_attempts (int): How many times a retryable deletion is attempted.
+            retry_delay (float): The initial delay between attempts, in seconds. It doubles after each attempt.
+        """
+        self.logger = logger
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self.actions: Dict[str, CompensationAction] = {}
+        self._order: List[str] = []
+        self._dependents: Dict[str, Set[str]] = {}
+        self._inverses: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Optional[Dict[str, Any]]]] = {}
+        self._init_inverses()
+
+    def _init_inverses(self):
+        """Registers how the result of each mutating tool is turned into its inverse action."""
+        self._register_inverse("create-ec2-instance", lambda params, result: {
+            "tool": "terminate-ec2-instance",
+            "params": {"instance_ids": [i["InstanceId"] for i in result.get("Instances", [])], "wait": True},
+            "resource_ids": [i["InstanceId"] for i in result.get("Instances", [])],
+        } if result.get("Instances") else None)
+        self._register_inverse("launch-ec2-fleet", lambda params, result: {
+            "tool": "terminate-ec2-instance",
+            "params": {"instance_ids": list(result["InstanceIds"]), "wait": True},
+            "resource_ids": list(result["InstanceIds"]),
+        } if result.get("InstanceIds") else None)
+        self._register_inverse("create-volume", lambda params, result: {
+            "tool": "delete-volume", "params": {"volume_id": result["VolumeId"]}, "resource_ids": [result["VolumeId"]],
+        } if result.get("VolumeId") else None)
+        self._register_inverse("create-key-pair", lambda params, result: {
+            "tool": "delete-key-pair", "params": {"key_name": result["key_name"]}, "resource_ids": [],
+        } if result.get("key_name") else None)
+        self._register_inverse("create-vpc", lambda params, result: {
+            "tool": "delete-vpc", "params": {"vpc_id": result["vpc_id"]}, "resource_ids": [result["vpc_id"]],
+        } if result.get("vpc_id") else None)
+        self._register_inverse("create-internet-gateway", lambda params, result: {
+            "tool": "delete-internet-gateway",
+            "params": {"internet_gateway_id": result["internet_gateway_id"]},
+            "resource_ids": [result["internet_gateway_id"]],
+        } if result.get("internet_gateway_id") else None)
+        self._register_inverse("attach-internet-gateway", lambda params, result: {
+            "tool": "detach-internet-gateway",
+            "params": {"internet_gateway_id": params.get("internet_gateway_id"), "vpc_id": params.get("vpc_id")},
+            "resource_ids": [],
+        } if params.get("internet_gateway_id") and params.get("vpc_id") else None)
+        self._register_inverse("create-public-subnet", lambda params, result: {
+            "tool": "delete-subnet", "params": {"subnet_id": result["subnet_id"]}, "resource_ids": [result["subnet_id"]],
+        } if result.get("subnet_id") else None)
+        self._register_inverse("create-security-group", lambda params, result: {
+            "tool": "delete-security-group", "params": {"group_id": result["groupId"]}, "resource_ids": [result["groupId"]],
+        } if result.get("groupId") else None)
+        self._register_inverse("create-db-subnet-group", lambda params, result: {
+            "tool": "delete-db-subnet-group",
+            "params": {"db_subnet_group_name": result["DBSubnetGroupName"]},
+            "resource_ids": [result["DBSubnetGroupName"]],
+        } if result.get("DBSubnetGroupName") else None)
+        self._register_inverse("create-db-instance", lambda params, result: {
+            "tool": "delete-db-instance",
+            "params": {"db_instance_identifier": result["DBInstanceIdentifier"], "skip_final_snapshot": True, "wait": True},
+            "resource_ids": [result["DBInstanceIdentifier"]],
+        } if result.get("DBInstanceIdentifier") else None)
+        self._register_inverse("create-load-balancer", lambda params, result: {
+            "tool": "delete-load-balancer",
+            "params": {"load_balancer_arn": result["LoadBalancerArn"]},
+            "resource_ids": [result["LoadBalancerArn"]],
+        } if result.get("LoadBalancerArn") else None)
+        self._register_inverse("create-s3-bucket", lambda params, result: {
+            "tool": "delete-s3-bucket", "params": {"bucket_name": result["bucket_name"]}, "resource_ids": [result["bucket_name"]],
+        } if result.get("bucket_name") else None)
+
+    def _register_inverse(self, tool_name: str, builder: Callable[[Dict[str, Any], Dict[str, Any]], Optional[Dict[str, Any]]]):
+        """Helper to register the inverse action builder of a tool."""
+        self._inverses[tool_name] = builder
+
+    def record(self, step: Dict[str, Any], tool_name: str, params: Dict[str, Any], result: Any) -> Optional[CompensationAction]:
+        """
+        Records the inverse action of a completed step, if its tool has one.
+
+        Args:
+            step (Dict[str, Any]): The completed plan step.
+            tool_name (str): The tool the step called.
+            params (Dict[str, Any]): The resolved parameters the tool was called with.
+            result (Any): The tool's result.
+
+        Returns:
+            Optional[CompensationAction]: The recorded action, or None if the step needs no compensation.
+        """
+        builder = self._inverses.get(tool_name)
+        if builder is None or not isinstance(result, dict):
+            return None
+        try:
+            inverse = builder(params, result)
+        except (KeyError, TypeError) as e:
+            self.logger.warning(f"Could not build the compensation for step '{step.get('id')}': {e}")
+            return None
+        if not inverse:
+            return None
+
+        action = CompensationAction(
+            step_id=step["id"],
+            step_name=step.get("name", step["id"]),
+            tool_name=inverse["tool"],
+            params=inverse["params"],
+            resource_ids=inverse.get("resource_ids", []),
+        )
+        self.actions[action.step_id] = action
+        self._order.append(action.step_id)
+        return action
+
+    def plan_waves(self, dependencies: Dict[str, Set[str]]) -> List[List[CompensationAction]]:
+        """
+        Groups the recorded actions into waves that can run in parallel, in reverse dependency order.
+
+        Args:
+            dependencies (Dict[str, Set[str]]): For each plan step ID, the step IDs it directly depends on.
+                                                Steps without compensation are followed through transitively.
+
+        Returns:
+            List[List[CompensationAction]]: The waves, first to last.
+        """
+        recorded = set(self.actions)
+
+        def recorded_ancestors(step_id: str) -> Set[str]:
+            found, stack, seen = set(), list(dependencies.get(step_id, ())), set()
+            while stack:
+                current = stack.pop()
+                if current in seen:
+                    continue
+                seen.add(current)
+                if current in recorded:
+                    found.add(current)
+                else:
+                    stack.extend(dependencies.get(current, ()))
+            return found
+
+        # dependents[x] = recorded steps that depend on x and must therefore be undone before x.
+        dependents: Dict[str, Set[str]] = {step_id: set() for step_id in recorded}
+        for step_id in recorded:
+            for ancestor in recorded_ancestors(step_id):
+                if ancestor != step_id:
+                    dependents[ancestor].add(step_id)
+
+        waves: List[List[CompensationAction]] = []
+        remaining = list(reversed(self._order))
+        done: Set[str] = set()
+        while remaining:
+            wave = [step_id for step_id in remaining if dependents[step_id] <= done]
+            if not wave:
+                # A dependency cycle should not happen; fall back to strict reverse order.
+                wave = [remaining[0]]
+            waves.append([self.actions[step_id] for step_id in wave])
+            done.update(wave)
+            remaining = [step_id for step_id in remaining if step_id not in done]
+        self._dependents = dependents
+        return waves
+
+    async def compensate(self, dependencies: Dict[str, Set[str]],
+                         run_tool: Callable[[str, Dict[str, Any]], Awaitable[Any]],
+                         on_update: Optional[Callable[[CompensationAction], Awaitable[None]]] = None) -> List[CompensationAction]:
+        """
+        Undoes every recorded step in reverse dependency order.
+
+        Args:
+            dependencies (Dict[str, Set[str]]): For each plan step ID, the step IDs it directly depends on.
+            run_tool (Callable): Coroutine function executing a tool by name with the given parameters.
+            on_update (Callable, optional): Coroutine function called whenever an action finishes.
+
+        Returns:
+            List[CompensationAction]: All actions with their final status.
+        """
+        waves = self.plan_waves(dependencies)
+        self.logger.warning(f"Compensating {len(self.actions)} step(s) in {len(waves)} wave(s).")
+        failed: Set[str] = set()
+
+        for wave in waves:
+            runnable = []
+            for action in wave:
+                blocked_by = self._dependents.get(action.step_id, set()) & failed
+                if blocked_by:
+                    action.status = "skipped"
+                    action.error = f"Not attempted because the compensation of {sorted(blocked_by)} failed."
+                    failed.add(action.step_id)
+                    if on_update:
+                        await on_update(action)
+                else:
+                    runnable.append(action)
+
+            await asyncio.gather(*(self._run_action(action, run_tool, on_update) for action in runnable))
+            failed.update(action.step_id for action in runnable if action.status == "failed")
+
+        return [self.actions[step_id] for step_id in reversed(self._order)]
+
+    async def _run_action(self, action: CompensationAction, run_tool: Callable[[str, Dict[str, Any]], Awaitable[Any]],
+                          on_update: Optional[Callable[[CompensationAction], Awaitable[None]]]) -> None:
+        """Runs one inverse action, retrying while AWS is still releasing its dependencies."""
+        delay = self.retry_delay
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await run_tool(action.tool_name, dict(action.params))
+                action.status = "completed"
+                break
+            except Exception as e:
+                message = str(e)
+                if any(code in message for code in ALREADY_DELETED_ERRORS):
+                    action.status = "completed"
+                    break
+                retryable = isinstance(e, ToolPoolRejectedError) or any(code in message for code in RETRYABLE_ERRORS)
+                if attempt < self.max_attempts and retryable:
+                    self.logger.info(f"Compensation '{action.tool_name}' for step '{action.step_id}' is waiting on a "
+                                     f"dependency (attempt {attempt}/{self.max_attempts}), retrying in {delay:.0f}s.")
+                    await asyncio.sleep(delay)
+                    delay *= 2
+                    continue
+                action.status = "failed"
+                action.error = message
+                self.logger.error(f"Compensation '{action.tool_name}' for step '{action.step_id}' failed: {message}")
+                break
+        if on_update:
+            await on_update(action)
@@ -0,0 +1,140 @@
+import asyncio
+import bisect
+import threading
+from collections import deque
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple, TypeVar
+
+from loguru import logger
+
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.runnables import Runnable
+
+T = TypeVar("T")
+
+# Upper bounds, in seconds, of the latency histogram buckets; the last bucket is open-ended.
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60)
+
+
+class LLMTarget:
+    """One provider and model the agent can send a prompt to."""
+
+    def __init__(self, provider: str, model: str, llm: BaseLanguageModel, key: str, planner: Optional[Runnable] = None):
+        """
+        Args:
+            provider (str): The LLM provider.
+            model (str): The model.
+            llm (BaseLanguageModel): The client.
+            key (str): The fingerprint of the API key, for rate limiting.
+            planner (Runnable, optional): The client bound to the structured plan output. If None, plans are generated as text.
+        """
+        self.provider = provider
+        self.model = model
+        self.llm = llm
+        self.key = key
+        self.planner = planner
+
+    @property
+    def name(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+
+class LatencyTracker:
+    """
+    Tracks the recent latencies of each LLM target: a sliding window of samples for
+    percentiles, and a cumulative histogram for the metrics route.
+    """
+
+    def __init__(self, window: int = 256):
+        """
+        Args:
+            window (int): The number of recent samples percentiles are computed from.
+        """
+        self.window = max(1, window)
+        self._samples: Dict[str, deque] = {}
+        self._histograms: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Records the latency of a successful call to a target."""
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self.window)).append(seconds)
+            histogram = self._histograms.setdefault(name, [0] * (len(LATENCY_BUCKETS) + 1))
+            histogram[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def percentile(self, name: str, fraction: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Returns a percentile of a target's recent latencies, in seconds.
+
+        Args:
+            name (str): The target's name.
+            fraction (float): The percentile as a fraction, e.g. 0.95.
+            min_samples (int): The number of samples needed for a meaningful value.
+
+        Returns:
+            float: The percentile, or None if there are fewer than min_samples samples.
+        """
+        with self._lock:
+            samples = sorted(self._samples.get(name) or ())
+        if not samples or len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the percentiles and histogram of every target, for the metrics route."""
+        with self._lock:
+            names = list(self._samples)
+            histograms = {name: list(histogram) for name, histogram in self._histograms.items()}
+        labels = [f"le_{bound}s" for bound in LATENCY_BUCKETS] + ["inf"]
+        snapshot = {}
+        for name in names:
+            snapshot[name] = {
+                "samples": len(self._samples[name]),
+                "p50_s": self.percentile(name, 0.5),
+                "p95_s": self.percentile(name, 0.95),
+                "p99_s": self.percentile(name, 0.99),
+                "histogram": dict(zip(labels, histograms[name])),
+            }
+        return snapshot
+
+
+async def hedged(primary: Callable[[], Awaitable[T]], secondary: Callable[[], Awaitable[T]], delay: float,
+                 is_valid: Callable[[T], bool]) -> Tuple[T, str]:
+    """
+    Runs the primary call, and also the secondary one if the primary has not returned a valid
+    result within the delay or fails sooner. The first valid result wins, and the other call is
+    cancelled. Both calls are cancelled if the caller is.
+
+    Args:
+        primary (Callable): Coroutine function for the primary call.
+        secondary (Callable): Coroutine function for the hedge call.
+        delay (float): How long the primary may take before it is hedged, in seconds.
+        is_valid (Callable): Whether a result is acceptable.
+
+    Returns:
+        Tuple[T, str]: The winning result and "primary" or "secondary". If neither result is
+                       valid, the primary's result is returned.
+    """
+    first = asyncio.ensure_future(primary())
+    pending = {first}
+    try:
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done and _valid_result(first, is_valid):
+            return first.result(), "primary"
+
+        logger.info("Primary LLM failed." if done else f"Primary LLM has not answered within {delay:.1f}s; hedging.")
+        second = asyncio.ensure_future(secondary())
+        pending = {second} if done else {first, second}
+        while pending:
+            done_now, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done_now:
+                if _valid_result(task, is_valid):
+                    return task.result(), "primary" if task is first else "secondary"
+    finally:
+        for task in pending:
+            task.cancel()
+    # Neither call produced a valid result; report the primary's error.
+    return first.result(), "primary"
+
+
+def _valid_result(task: "asyncio.Future[Any]", is_valid: Callable[[Any], bool]) -> bool:
+    return not task.cancelled() and task.exception() is None and is_valid(task.result())
@@ -0,0 +1,240 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Dict, Any, Optional, Callable, Awaitable, AsyncIterator, Tuple, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# Error codes and messages providers use when a request is throttled.
+_RATE_LIMIT_CODES = {"ThrottlingException", "TooManyRequestsException", "ServiceQuotaExceededException"}
+_RATE_LIMIT_MARKERS = ("rate limit", "rate_limit", "ratelimit", "too many requests", "resource_exhausted",
+                       "resource exhausted", "overloaded", "quota exceeded", "throttl")
+
+
+class LLMLimiterRejectedError(RuntimeError):
+    """Raised when an LLM call waited too long for a concurrency slot."""
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """Returns whether an error from any of the LLM providers means the request was throttled."""
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if status in (429, 529):
+        return True
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):  # botocore ClientError
+        code = response.get("Error", {}).get("Code")
+        if code in _RATE_LIMIT_CODES:
+            return True
+    elif getattr(response, "status_code", None) in (429, 529):
+        return True
+    message = str(error).lower()
+    return "429" in message or any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Returns the delay a provider asked for in its Retry-After header, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after")))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMConcurrencyLimiter:
+    """
+    Concurrency control and rate-limit backoff for native async LLM calls, shared by every agent.
+
+    At most 'per_provider' calls to one provider and 'per_key' calls with one API key run at
+    once; further calls wait in line instead of holding a thread. When a provider throttles a
+    call, the call is retried with exponential backoff and jitter (or after the provider's
+    Retry-After), and every other call with the same key waits out the same cooldown, so
+    a burst of requests backs off together instead of hammering the provider.
+    """
+
+    def __init__(self, logger: logger, per_provider: int = 64, per_key: int = 16, queue_timeout: float = 60.0,
+                 max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 30.0):
+        """
+        Args:
+            logger: The logger instance.
+            per_provider (int): The maximum number of calls to one provider running at once.
+            per_key (int): The maximum number of calls with one API key running at once.
+            queue_timeout (float): How long a call may wait for a slot, in seconds.
+            max_retries (int): How often a throttled call is retried.
+            base_delay (float): The first backoff delay, in seconds; doubled on every retry.
+            max_delay (float): The longest backoff delay, in seconds.
+        """
+        self.logger = logger
+        self.per_provider = max(1, per_provider)
+        self.per_key = max(1, min(per_key, self.per_provider))
+        self.queue_timeout = queue_timeout
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._provider_slots: Dict[str, asyncio.Semaphore] = {}
+        self._key_slots: Dict[Tuple[str, str], asyncio.Semaphore] = {}
+        self._cooldown_until: Dict[Tuple[str, str], float] = {}
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.throttled = 0
+        self.rejected = 0
+        self._wait_times: deque = deque(maxlen=1024)
+
+    async def invoke(self, provider: str, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs an LLM call within the provider's and key's limits, retrying it when it is throttled.
+
+        Args:
+            provider (str): The LLM provider.
+            key (str): Identifies the API key, e.g. its fingerprint.
+            call (Callable): Coroutine function performing the call, such as llm.ainvoke.
+
+        Returns:
+            Whatever the call returns.
+
+        Raises:
+            LLMLimiterRejectedError: If the call waited longer than the queue timeout for a slot.
+        """
+        attempt = 0
+        while True:
+            async with self._slot(provider, key):
+                try:
+                    return await call()
+                except Exception as e:
+                    if not is_rate_limited(e) or attempt >= self.max_retries:
+                        raise
+                    delay = self._throttled(provider, key, e, attempt)
+            attempt += 1
+            self.logger.warning(f"{provider} rate-limited the LLM call; retrying in {delay:.1f}s (attempt {attempt}/{self.max_retries}).")
+
+    async def stream(self, provider: str, key: str, open_stream: Callable[[], AsyncIterator[T]]) -> AsyncIterator[T]:
+        """
+        Streams an LLM call within the provider's and key's limits. A throttled stream is
+        retried as long as it has not produced any output yet.
+
+        Args:
+            provider (str): The LLM provider.
+            key (str): Identifies the API key, e.g. its fingerprint.
+            open_stream (Callable): Returns the stream, such as lambda: llm.astream(prompt).
+
+        Yields:
+            The chunks of the stream.
+        """
+        attempt = 0
+        while True:
+            started = False
+            async with self._slot(provider, key):
+                try:
+                    async for chunk in open_stream():
+                        started = True
+                        yield chunk
+                    return
+                except Exception as e:
+                    if started or not is_rate_limited(e) or attempt >= self.max_retries:
+                        raise
+                    delay = self._throttled(provider, key, e, attempt)
+            attempt += 1
+            self.logger.warning(f"{provider} rate-limited the LLM stream; retrying in {delay:.1f}s (attempt {attempt}/{self.max_retries}).")
+
+    def _throttled(self, provider: str, key: str, error: BaseException, attempt: int) -> float:
+        """Records a throttled call and starts the key's cooldown. Returns the backoff delay."""
+        self.throttled += 1
+        delay = retry_after_seconds(error)
+        if delay is None:
+            # Full jitter keeps callers throttled at the same moment from retrying in lockstep.
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        delay = min(delay, self.max_delay)
+        until = time.monotonic() + delay
+        self._cooldown_until[(provider, key)] = max(until, self._cooldown_until.get((provider, key), 0.0))
+        return delay
+
+    def _slot(self, provider: str, key: str) -> "_LimiterSlot":
+        provider_slots = self._provider_slots.get(provider)
+        if provider_slots is None:
+            provider_slots = self._provider_slots[provider] = asyncio.Semaphore(self.per_provider)
+        key_slots = self._key_slots.get((provider, key))
+        if key_slots is None:
+            key_slots = self._key_slots[(provider, key)] = asyncio.Semaphore(self.per_key)
+        return _LimiterSlot(self, provider, key, provider_slots, key_slots)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns queue depth, in-flight calls, throttling and wait-time statistics."""
+        waits = sorted(self._wait_times)
+
+        def percentile(fraction: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(fraction * len(waits)))] * 1000, 1)
+
+        now = time.monotonic()
+        return {
+            "per_provider": self.per_provider,
+            "per_key": self.per_key,
+            "queue_depth": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+            "cooling_down_keys": sum(1 for until in self._cooldown_until.values() if until > now),
+            "wait_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "max": percentile(1.0)},
+        }
+
+
+class _LimiterSlot:
+    """Holds a provider slot and a key slot for the duration of one LLM call."""
+
+    def __init__(self, limiter: LLMConcurrencyLimiter, provider: str, key: str,
+                 provider_slots: asyncio.Semaphore, key_slots: asyncio.Semaphore):
+        self.limiter = limiter
+        self.provider = provider
+        self.key = key
+        self.provider_slots = provider_slots
+        self.key_slots = key_slots
+        self.acquired_key = self.acquired_provider = False
+
+    async def __aenter__(self) -> None:
+        limiter = self.limiter
+        enqueued = time.monotonic()
+        deadline = enqueued + limiter.queue_timeout
+        limiter.waiting += 1
+        try:
+            # A throttled key is waited out without holding any slot.
+            cooldown = limiter._cooldown_until.get((self.provider, self.key), 0.0) - time.monotonic()
+            if cooldown > 0:
+                await asyncio.sleep(cooldown)
+            # The key's slot is taken first, so a key at its limit does not hold a provider slot.
+            await asyncio.wait_for(self.key_slots.acquire(), timeout=max(0.0, deadline - time.monotonic()))
+            self.acquired_key = True
+            await asyncio.wait_for(self.provider_slots.acquire(), timeout=max(0.0, deadline - time.monotonic()))
+            self.acquired_provider = True
+        except asyncio.TimeoutError:
+            self._release()
+            limiter.rejected += 1
+            raise LLMLimiterRejectedError(
+                f"LLM call waited more than {limiter.queue_timeout:.0f}s for a {self.provider} slot. Please retry later."
+            ) from None
+        except BaseException:
+            self._release()
+            raise
+        finally:
+            limiter.waiting -= 1
+        limiter._wait_times.append(time.monotonic() - enqueued)
+        limiter.running += 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.limiter.running -= 1
+        self.limiter.completed += 1
+        self._release()
+
+    def _release(self) -> None:
+        if self.acquired_provider:
+            self.provider_slots.release()
+            self.acquired_provider = False
+        if self.acquired_key:
+            self.key_slots.release()
+            self.acquired_key = False
@@ -0,0 +1,89 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from loguru import logger
+
+from langchain_core.language_models import BaseLanguageModel
+
+
+def api_key_fingerprint(secret: Optional[str]) -> str:
+    """Returns a short fingerprint of an API key, so pool keys never hold the key itself."""
+    if not secret:
+        return ""
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+
+class LLMClientPool:
+    """
+    A bounded, thread-safe pool of LLM clients shared across agents.
+
+    Every agent used to create its own client, and with it a new HTTP connection pool, so
+    each request paid for new TLS connections to the provider. Clients are pooled by
+    provider, model, generation settings and a fingerprint of the API key, so requests
+    made with the same key reuse warm connections, while different keys never share a
+    client. Clients idle for longer than the TTL, and the least recently used clients
+    beyond max_clients, are dropped.
+    """
+
+    Key = Tuple[Any, ...]
+
+    def __init__(self, logger: logger, max_clients: int = 64, idle_ttl_seconds: float = 900):
+        """
+        Args:
+            logger: The logger instance.
+            max_clients (int): The maximum number of pooled clients.
+            idle_ttl_seconds (float): How long an unused client is kept.
+        """
+        self.logger = logger
+        self.max_clients = max(1, max_clients)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._clients: "OrderedDict[LLMClientPool.Key, Tuple[BaseLanguageModel, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Key, create: Callable[[], BaseLanguageModel]) -> BaseLanguageModel:
+        """
+        Returns the pooled client for a key, creating it on first use.
+
+        Args:
+            key (Key): Identifies the client: provider, model, settings and key fingerprint.
+            create (Callable[[], BaseLanguageModel]): Creates the client on a miss.
+
+        Returns:
+            BaseLanguageModel: The client.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._clients.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._clients[key] = (entry[0], now)
+                self._clients.move_to_end(key)
+                return entry[0]
+            self.misses += 1
+            # Created under the lock, so concurrent requests for a new key share one client.
+            client = create()
+            self._clients[key] = (client, now)
+            while len(self._clients) > self.max_clients:
+                evicted_key, _ = self._clients.popitem(last=False)
+                self.logger.debug(f"Evicted LLM client {evicted_key[:2]} from the pool.")
+            self.logger.info(f"Pooled a new LLM client for {key[:2]} ({len(self._clients)} pooled).")
+            return client
+
+    def _evict_idle(self, now: float) -> None:
+        for key in [k for k, (_, last_used) in self._clients.items() if now - last_used > self.idle_ttl_seconds]:
+            del self._clients[key]
+            self.logger.debug(f"Evicted idle LLM client {key[:2]} from the pool.")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._clients), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,204 @@
+import copy
+import difflib
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from ai_infra_agent.state.schemas import InfrastructureState
+
+# Properties that change without changing what a plan should do, e.g. a subnet's free IP count
+# drops whenever an instance is launched. They are left out of the state fingerprint.
+_VOLATILE_PROPERTIES = {"availableipaddresscount"}
+
+# Tokens that carry a value (sizes, instance types, CIDRs, IDs, names with digits). Near-duplicate
+# requests must agree on all of them, so "t3.micro" never matches "t3.large".
+_VALUE_TOKEN = re.compile(r"\S*[\d./:_-]\S*|\"[^\"]*\"|'[^']*'")
+
+# Words that carry no meaning for the plan; near-duplicate requests may differ in them freely.
+_FILLER_WORDS = {
+    "a", "an", "the", "please", "me", "my", "i", "want", "would", "like", "to", "can", "you", "could",
+    "new", "with", "for", "in", "of", "and", "on", "using", "some", "just",
+}
+
+# Words that introduce a name. The word after them is a value even without digits, so
+# "a bucket named finance" never matches "a bucket named marketing".
+_NAMING_WORDS = {"named", "called", "name", "names", "tagged", "label", "labeled", "labelled"}
+
+# Words between a naming word and the name itself, e.g. "name it finance", "called as finance".
+_NAME_LEAD_WORDS = {"it", "is", "as", "be", "them"}
+
+# Words that decide what a plan does; near-duplicate requests must agree on all of them.
+_ACTION_WORDS = {
+    "create", "delete", "remove", "terminate", "destroy", "start", "stop", "reboot", "launch", "add",
+    "attach", "detach", "modify", "update", "resize", "list", "describe", "tag", "untag", "enable", "disable",
+    "public", "private", "not", "no", "without",
+}
+
+
+def normalize_request(request: str) -> str:
+    """Normalizes a request so that differences in case, spacing and trailing punctuation do not matter."""
+    return re.sub(r"\s+", " ", request).strip().rstrip(".!?").strip().lower()
+
+
+def state_fingerprint(state: InfrastructureState) -> str:
+    """
+    Returns a fingerprint of the parts of the infrastructure state a plan depends on:
+    every resource's ID, type, status, properties and tags, except volatile properties.
+    """
+    def stable(properties: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            k: v for k, v in properties.items()
+            if str(k).lower().replace("_", "") not in _VOLATILE_PROPERTIES
+        }
+
+    canonical = json.dumps(
+        sorted(
+            [resource_id, r.type, r.status, stable(r.properties), r.tags]
+            for resource_id, r in state.resources.items()
+        ),
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PlanCache:
+    """
+    A bounded, thread-safe cache of the plans the LLM generated.
+
+    A plan is reused for the same normalized request, against the same state fingerprint,
+    for the same user and region and the same prompt (a changed template or tool set
+    changes the prompt key). Plans are stored as the LLM returned them, so placeholders
+    such as '{{timestamp}}' stay symbolic and are resolved anew when the plan is executed.
+
+    Optionally, a request that is only a near duplicate of a cached one (e.g. "create an
+    ec2 instance t3.micro" vs. "create a t3.micro ec2 instance") also matches, as long as
+    both contain exactly the same values: sizes, types, CIDRs, IDs, quoted strings, and the
+    names following "named", "called" or "name".
+    """
+
+    CacheKey = Tuple[Tuple[str, str], str, str]  # scope, prompt key, state fingerprint
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600, similarity_threshold: Optional[float] = None):
+        """
+        Args:
+            max_entries (int): The maximum number of cached plans; the least recently used are evicted first.
+            ttl_seconds (float): How long a plan is reused.
+            similarity_threshold (float, optional): The minimum similarity (0-1) of a near-duplicate request.
+                                                    If None, only identical normalized requests match.
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        # Plans are grouped by key, then indexed by normalized request.
+        self._entries: "OrderedDict[PlanCache.CacheKey, Dict[str, Tuple[Dict[str, Any], float]]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey, request: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns a copy of the cached plan for a request, or None.
+
+        Args:
+            key (CacheKey): The user scope, prompt key and state fingerprint.
+            request (str): The user's request.
+
+        Returns:
+            Dict[str, Any]: The cached plan, or None on a miss.
+        """
+        normalized = normalize_request(request)
+        now = time.monotonic()
+        with self._lock:
+            plans = self._entries.get(key)
+            if plans is not None:
+                self._drop_expired(plans, now)
+            entry = plans.get(normalized) if plans else None
+            if entry is None and plans and self.similarity_threshold is not None:
+                entry = self._near_duplicate(plans, normalized)
+                if entry is not None:
+                    self.near_hits += 1
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            plan = entry[0]
+        # Callers resolve and mutate plans, so every hit gets its own copy.
+        return copy.deepcopy(plan)
+
+    def put(self, key: CacheKey, request: str, plan: Dict[str, Any]) -> None:
+        """Caches a copy of a generated plan. Plans reporting an error are not cached."""
+        if not isinstance(plan, dict) or "error" in plan:
+            return
+        stored = copy.deepcopy(plan)
+        with self._lock:
+            plans = self._entries.setdefault(key, {})
+            if normalize_request(request) not in plans:
+                self._size += 1
+            plans[normalize_request(request)] = (stored, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while self._size > self.max_entries and self._entries:
+                oldest_key = next(iter(self._entries))
+                oldest = self._entries[oldest_key]
+                oldest.pop(next(iter(oldest)))
+                self._size -= 1
+                if not oldest:
+                    del self._entries[oldest_key]
+
+    def _drop_expired(self, plans: Dict[str, Tuple[Dict[str, Any], float]], now: float) -> None:
+        for request in [r for r, (_, expires_at) in plans.items() if expires_at <= now]:
+            del plans[request]
+            self._size -= 1
+
+    def _near_duplicate(self, plans: Dict[str, Tuple[Dict[str, Any], float]],
+                        normalized: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Finds the most similar cached request that has exactly the same values and actions."""
+        values, actions, words = _request_terms(normalized)
+        best, best_ratio = None, self.similarity_threshold
+        for cached_request, entry in plans.items():
+            cached_values, cached_actions, cached_words = _request_terms(cached_request)
+            if cached_values != values or cached_actions != actions:
+                continue
+            # Word order is ignored: "create an ec2 instance t3.micro" matches "create a t3.micro ec2 instance".
+            ratio = difflib.SequenceMatcher(None, words, cached_words).ratio()
+            if ratio >= best_ratio:
+                best, best_ratio = entry, ratio
+        return best
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": self._size, "hits": self.hits, "near_hits": self.near_hits, "misses": self.misses}
+
+
+def _request_terms(normalized: str) -> Tuple[List[str], List[str], List[str]]:
+    """Splits a normalized request into its sorted values, action words and remaining content words."""
+    values = _VALUE_TOKEN.findall(normalized)
+    words = []
+    naming = False
+    for word in re.findall(r"[a-z]+", _VALUE_TOKEN.sub(" ", normalized)):
+        if naming and word not in _FILLER_WORDS and word not in _NAME_LEAD_WORDS:
+            values.append(word)
+            naming = False
+        elif word in _NAMING_WORDS:
+            naming = True
+        elif word not in _FILLER_WORDS:
+            words.append(word)
+    actions = sorted(w for w in words if w in _ACTION_WORDS)
+    return sorted(values), actions, sorted(w for w in words if w not in _ACTION_WORDS)
+
+
+def plan_cache_key(scope: Tuple[str, str], prompt_key: str, state: InfrastructureState) -> PlanCache.CacheKey:
+    """Builds the cache key of a plan from the user scope, the prompt key and the state."""
+    return scope, prompt_key, state_fingerprint(state)
@@ -1,13 +1,22 @@
 import asyncio
 import re
 import json
+import uuid
 from datetime import date, datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from fastapi import WebSocket
 from loguru import logger
 
 from ai_infra_agent.agent.agent import StateAwareAgent
+from ai_infra_agent.agent.compensation import CompensationAction, CompensationEngine
+from ai_infra_agent.agent.plan_optimizer import PlanOptimizer
+from ai_infra_agent.agent.plan_references import prune_to_paths, referenced_result_paths, step_dependencies
+from ai_infra_agent.agent.progress import PROTOCOL_COMPACT, PROTOCOL_LEGACY, ProgressChannel, project_result
+from ai_infra_agent.agent.result_store import ResultStore
+from ai_infra_agent.agent.simulation import PlanSimulator
+from ai_infra_agent.core.config import settings
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 from ai_infra_agent.state.schemas import ResourceState
 
 # --- Helper Functions ---
@@ -50,7 +59,9 @@ class PlanExecutor:
     managing the execution context, and sending real-time updates via WebSocket.
     """
 
-    def __init__(self, agent: StateAwareAgent, websocket: WebSocket, logger: logger):
+    def __init__(self, agent: StateAwareAgent, websocket: WebSocket, logger: logger,
+                 execution_id: Optional[str] = None, protocol: str = PROTOCOL_LEGACY,
+                 result_store: Optional[ResultStore] = None, dry_run: bool = False):
         """
         Initializes the PlanExecutor.
 
@@ -58,15 +69,163 @@ class PlanExecutor:
             agent (StateAwareAgent): The agent instance, used to execute tools.
             websocket (WebSocket): The active WebSocket connection for sending updates.
             logger: The logger instance.
+            execution_id (str, optional): The ID of this execution, used to fetch step results later.
+            protocol (str): The progress protocol, either "legacy" (full results in every message)
+                            or "compact" (projected step deltas sent through a bounded queue).
+            result_store (ResultStore, optional): Where full step results are kept for on-demand retrieval.
+            dry_run (bool): Simulate the plan against the discovered state instead of calling AWS.
         """
         self.agent = agent
         self.websocket = websocket
         self.logger = logger
+        # Only the parts of each result that later steps reference; full results go to the result store.
         self.context: Dict[str, Any] = {}
+        # The step outputs of the final message: full results on the legacy protocol, summaries on the compact one.
+        self.outputs: Dict[str, Any] = {}
+        self._referenced_paths: Dict[str, List[List[str]]] = {}
+        self.optimizer = PlanOptimizer(logger)
+        self.execution_id = execution_id or uuid.uuid4().hex
+        self.protocol = protocol if protocol in (PROTOCOL_LEGACY, PROTOCOL_COMPACT) else PROTOCOL_LEGACY
+        self.result_store = result_store
+        self.channel = (
+            ProgressChannel(websocket, logger, serializer=json_serializer)
+            if self.protocol == PROTOCOL_COMPACT else None
+        )
+        self.dry_run = dry_run
+        # One set of AWS clients for the whole plan, shared by every tool it calls.
+        self.connection = AWSConnectionContext(logger, agent.user_credentials.get("aws") or {})
+        self.rollback_on_failure = settings.execution.rollback_on_failure and not dry_run
+        self.compensation = CompensationEngine(
+            logger,
+            max_attempts=settings.execution.rollback_max_attempts,
+            retry_delay=settings.execution.rollback_retry_delay,
+        )
+        self.simulator: Optional[PlanSimulator] = None
+        if dry_run:
+            self.simulator = PlanSimulator(
+                state=agent.state_manager.state,
+                logger=logger,
+                tool_factory=agent.tool_factory,
+                user_aws_config=agent.user_credentials.get("aws"),
+                check_permissions=getattr(agent.settings, "dry_run_permission_checks", False),
+            )
+
+    async def _send_update(self, data: Dict[str, Any], coalesce_key: Optional[str] = None,
+                           droppable: bool = False) -> None:
+        """
+        Sends a JSON message to the client. With the compact protocol the message goes
+        through the bounded progress channel; otherwise it is sent directly.
+        """
+        if self.channel is not None:
+            await self.channel.publish(data, coalesce_key=coalesce_key, droppable=droppable)
+        else:
+            await self.websocket.send_text(json.dumps(data, default=json_serializer))
+
+    async def _send_step_update(self, step_id: str, step_name: str, status: str,
+                                tool_name: str = "", result: Any = None) -> None:
+        """
+        Sends the status of a single step in the format of the active protocol.
+
+        Args:
+            step_id (str): The ID of the step.
+            step_name (str): The display name of the step.
+            status (str): One of "running", "completed" or "failed".
+            tool_name (str): The tool the step called, used to project its result.
+            result (Any): The step result, or the error details of a failed step.
+        """
+        if self.channel is None:
+            if status == "running":
+                await self._send_update({
+                    "status": "Executing Step",
+                    "step": step_name,
+                    "message": f"Executing step: {step_name}"
+                })
+            else:
+                await self._send_update({
+                    "status": "Step Completed" if status == "completed" else "Step Failed",
+                    "step": step_name,
+                    "result": result
+                })
+            return
+
+        message = {"type": "step", "stepId": step_id, "status": status}
+        if status == "completed":
+            message["result"] = project_result(tool_name, result)
+        elif status == "failed":
+            message["result"] = result
+        await self._send_update(message, coalesce_key=f"step:{step_id}", droppable=status == "running")
 
-    async def _send_update(self, data: Dict[str, Any]) -> None:
-        """Sends a JSON message to the client via WebSocket using the custom serializer."""
-        await self.websocket.send_text(json.dumps(data, default=json_serializer))
+    def _remember_result(self, step_id: str, result: Any, summary: Any) -> None:
+        """
+        Keeps only the fields of a step result that later steps reference in the live context,
+        plus its output for the final message: the full result for legacy clients, which expect
+        it unchanged, and the compact summary on the compact protocol.
+        """
+        paths = self._referenced_paths.get(step_id.lower().replace("_", ""))
+        if paths is not None:
+            self.context[step_id] = prune_to_paths(result, paths)
+        self.outputs[step_id] = result if self.channel is None else summary
+
+    async def _send_rollback_update(self, action: CompensationAction) -> None:
+        """Reports the outcome of a single compensation action."""
+        if self.channel is not None:
+            await self._send_update({"type": "rollback", **action.to_dict()})
+        else:
+            await self._send_update({
+                "status": f"Rollback Step {action.status.capitalize()}",
+                "step": action.step_name,
+                "result": action.to_dict(),
+            })
+
+    async def _rollback(self, execution_plan: List[Dict[str, Any]], failed_step_name: str) -> None:
+        """Undoes the completed steps of a failed plan in reverse dependency order."""
+        dependencies: Dict[str, Any] = {}
+        for step in execution_plan:
+            for plan_step in [step] + list(step.get("coalescedSteps") or []):
+                if plan_step.get("id"):
+                    dependencies[plan_step["id"]] = step_dependencies(plan_step)
+
+        await self._send_update({
+            "status": "Rolling Back",
+            "message": f"Step '{failed_step_name}' failed. Rolling back {len(self.compensation.actions)} completed step(s).",
+        })
+
+        async def run_tool(tool_name: str, params: Dict[str, Any]) -> Any:
+            return await self.agent.execute_tool(
+                tool_name, user_aws_config=self.agent.user_credentials.get("aws"),
+                connection=self.connection, compensation=True, **params
+            )
+
+        actions = await self.compensation.compensate(dependencies, run_tool, on_update=self._send_rollback_update)
+        for action in actions:
+            if action.status == "completed":
+                for resource_id in action.resource_ids:
+                    self.agent.state_manager.remove_resource(resource_id)
+
+        incomplete = [a for a in actions if a.status != "completed"]
+        await self._send_update({
+            "status": "Rollback Completed" if not incomplete else "Rollback Incomplete",
+            "message": (
+                "All completed steps were rolled back." if not incomplete
+                else f"{len(incomplete)} step(s) could not be rolled back and need manual cleanup."
+            ),
+            "rollback": [a.to_dict() for a in actions],
+        })
+
+    def _store_result(self, step_ids: List[str], result: Any) -> None:
+        """Serializes a step result once and keeps it for on-demand retrieval by step ID."""
+        if self.result_store is None:
+            return
+        try:
+            serialized = json.dumps(result, default=json_serializer)
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"Could not serialize result of steps {step_ids} for the result store: {e}")
+            return
+        user_id = (self.agent.user_credentials or {}).get("user_id")
+        for step_id in step_ids:
+            if not self.result_store.put(self.execution_id, step_id, serialized, user_id=user_id):
+                self.logger.warning(f"Execution '{self.execution_id}' belongs to another user; not storing the result of step '{step_id}'.")
+                return
 
     def _get_value_from_context(self, path: str) -> Any:
         """
@@ -78,7 +237,6 @@ class PlanExecutor:
 
         value = self.context
         for i, key in enumerate(keys):
-            self.logger.debug(f"Current value: {value}, Current key: {key}")
             try:
                 if isinstance(value, list) and key.isdigit():
                     value = value[int(key)]
@@ -90,7 +248,6 @@ class PlanExecutor:
                         if isinstance(d_key, str) and d_key.lower().replace("_", "") == normalized_key:
                             value = d_val
                             found = True
-                            self.logger.debug(f"Found match for key '{key}' with dict key '{d_key}'")
                             break
                     if not found:
                         raise KeyError(f"Key '{key}' not found in dict with keys: {list(value.keys())}")
@@ -168,6 +325,12 @@ class PlanExecutor:
         Transforms the result of a creation tool into a ResourceState object and saves it.
         This is a simplified implementation and should be expanded.
         """
+        if tool_name == "launch-ec2-fleet":
+            # A fleet is saved as one resource per instance, like separate create-ec2-instance steps.
+            for instance in result.get("Instances", []):
+                self._update_state_after_creation("create-ec2-instance", {"Instances": [instance]})
+            return
+
         resource_type = "unknown"
         resource_id = None
         resource_name = ""
@@ -210,9 +373,30 @@ class PlanExecutor:
         Args:
             execution_plan (List[Dict[str, Any]]): The list of steps to execute.
         """
-        await self._send_update({"status": "Executing", "message": "Plan execution started"})
+        try:
+            await self._run_plan(execution_plan)
+        finally:
+            if self.channel is not None:
+                await self.channel.close()
+            await self.connection.aclose()
+            self.logger.info(f"AWS calls for execution '{self.execution_id}': {self.connection.stats()}")
+
+    async def _run_plan(self, execution_plan: List[Dict[str, Any]]) -> None:
+        """Executes the steps of a plan in order and reports progress to the client."""
+        await self._send_update({
+            "status": "Executing",
+            "message": "Plan simulation started" if self.dry_run else "Plan execution started",
+            "executionId": self.execution_id,
+            "dryRun": self.dry_run,
+        })
         self.logger.info("Plan execution started. Processing steps...")
 
+        execution_plan = self.optimizer.optimize(execution_plan)
+        # Step IDs are matched case-insensitively, like every other context lookup.
+        self._referenced_paths = {}
+        for ref_step_id, paths in referenced_result_paths(execution_plan).items():
+            self._referenced_paths.setdefault(ref_step_id.lower().replace("_", ""), []).extend(paths)
+
         for step in execution_plan:
             step_id = step.get("id")
             step_name = step.get("name", "Unnamed Step")
@@ -224,39 +408,45 @@ class PlanExecutor:
                 raise ValueError(f"Step is missing required fields 'id' or 'mcpTool': {step}")
 
             self.logger.info(f"--- Preparing to execute step: '{step_name}' (ID: {step_id}) ---")
-            await self._send_update({
-                "status": "Executing Step",
-                "step": step_name,
-                "message": f"Executing step: {step_name}"
-            })
+            original_steps = step.get("coalescedSteps") or [step]
+            for original_step in original_steps:
+                await self._send_step_update(original_step["id"], original_step.get("name", step_name), "running")
 
             try:
                 # 1. Resolve parameters for the current step
                 resolved_params = self._resolve_placeholders_recursively(tool_params)
                 self.logger.info(f"Executing tool '{tool_name}' with resolved params: {resolved_params}")
                 
-                # 2. Execute the tool via the agent
-                result = await self.agent.execute_tool(
-                    tool_name, 
-                    user_aws_config=self.agent.user_credentials.get("aws"),
-                    **resolved_params
-                )
+                # 2. Execute the tool via the agent, or simulate it in dry-run mode
+                if self.simulator is not None:
+                    result = self.simulator.simulate(tool_name, self.agent.resolve_placeholders(resolved_params))
+                else:
+                    result = await self.agent.execute_tool(
+                        tool_name,
+                        user_aws_config=self.agent.user_credentials.get("aws"),
+                        connection=self.connection,
+                        **resolved_params
+                    )
                 
-                # 3. Store the result in the context for subsequent steps
-                self.context[step_id] = result
-                self.logger.info(f"Step '{step_name}' completed. Result stored in context for ID '{step_id}'.")
-                self.logger.debug(f"Context after step '{step_id}': {self.context}")
+                # 3. Store the result in the context for subsequent steps.
+                # A batched step fans its result back out to every step it replaced.
+                await asyncio.to_thread(self._store_result, [s["id"] for s in original_steps], result)
+                summary = project_result(tool_name, result)
+                if self.rollback_on_failure:
+                    self.compensation.record(step, tool_name, resolved_params, result)
+                for original_step in original_steps:
+                    original_id = original_step["id"]
+                    original_name = original_step.get("name", step_name)
+                    self._remember_result(original_id, result, summary)
+                    self.logger.info(f"Step '{original_name}' completed. Result stored in context for ID '{original_id}'.")
 
-                # 4. If a resource was created, update the main state
-                if action == "create":
-                    self._update_state_after_creation(tool_name, result)
+                    # 4. If a resource was created, update the main state (never for simulated resources)
+                    if action == "create" and not self.dry_run:
+                        self._update_state_after_creation(original_step.get("mcpTool", tool_name), result)
 
-                # 5. Send success update to the client
-                await self._send_update({
-                    "status": "Step Completed",
-                    "step": step_name,
-                    "result": result
-                })
+                    # 5. Send success update to the client
+                    await self._send_step_update(original_id, original_name, "completed", tool_name, result)
+                self.logger.debug(f"Context after step '{step_id}' holds {len(self.context)} projected step result(s).")
 
             except Exception as e:
                 self.logger.error(f"Execution failed at step '{step_name}': {e}", exc_info=True)
@@ -269,20 +459,41 @@ class PlanExecutor:
                     except (IndexError, json.JSONDecodeError):
                         pass # Fallback to just the error string if parsing fails
 
-                await self._send_update({
-                    "status": "Step Failed",
-                    "step": step_name,
-                    "result": error_details # Send error_details instead of just str(e)
-                })
+                for original_step in original_steps:
+                    await self._send_step_update(
+                        original_step["id"], original_step.get("name", step_name), "failed",
+                        tool_name, error_details # Send error_details instead of just str(e)
+                    )
+                if self.rollback_on_failure and self.compensation.actions:
+                    try:
+                        await self._rollback(execution_plan, step_name)
+                    except Exception as rollback_error:
+                        self.logger.error(f"Rollback after step '{step_name}' failed: {rollback_error}", exc_info=True)
                 # Re-raise the exception to stop the entire plan execution
                 raise
 
-        # Construct the final, formal completion message
+        # Construct the final, formal completion message.
+        # Compact clients get step summaries and fetch full results by step ID from the result store.
+        outputs = dict(self.outputs)
         final_result = {
             "type": "execution_completed",
             "status": "success",
             "message": "All plan steps executed successfully.",
-            "outputs": self.context  # Include all step results
+            "executionId": self.execution_id,
+            "outputs": outputs
         }
+        if not self.dry_run:
+            final_result["awsCalls"] = self.connection.summary()
+        if self.simulator is not None:
+            permission_checks = await self.simulator.collect_permission_checks()
+            denied = [check for check in permission_checks if not check.get("allowed")]
+            final_result.update({
+                "dryRun": True,
+                "message": (
+                    "Plan simulation succeeded." if not denied
+                    else f"Plan simulation succeeded, but {len(denied)} permission check(s) failed."
+                ),
+                "permissionChecks": permission_checks,
+            })
         await self._send_update(final_result)
         self.logger.info("Plan execution finished successfully and final result sent.")
\ No newline at end of file
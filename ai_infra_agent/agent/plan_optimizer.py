@@ -0,0 +1,169 @@
+import json
+from typing import Dict, Any, List, Tuple
+
+from loguru import logger
+
+from ai_infra_agent.agent.plan_references import step_dependencies
+
+
+class CoalescingRule:
+    """
+    Describes how adjacent steps calling the same single-item tool can be merged
+    into one step calling a batched tool.
+    """
+
+    def __init__(self, tool_name: str, batch_tool_name: str, group_params: Tuple[str, ...],
+                 item_params: Tuple[str, ...], items_param: str, max_batch_size: int):
+        """
+        Args:
+            tool_name (str): The single-item tool whose steps can be merged.
+            batch_tool_name (str): The batched tool that replaces the merged steps.
+            group_params (Tuple[str, ...]): Parameters that must be identical for steps to be merged.
+                                            They are passed through unchanged to the batched tool.
+            item_params (Tuple[str, ...]): Per-step parameters collected into the batched tool's item list.
+            items_param (str): The name of the batched tool's item list parameter.
+            max_batch_size (int): The maximum number of steps merged into one call.
+        """
+        self.tool_name = tool_name
+        self.batch_tool_name = batch_tool_name
+        self.group_params = group_params
+        self.item_params = item_params
+        self.items_param = items_param
+        self.max_batch_size = max_batch_size
+
+    def group_key(self, step: Dict[str, Any]) -> str:
+        """Returns a key that is equal for steps which may share a batched call."""
+        params = step.get("toolParameters", {}) or {}
+        return json.dumps(
+            [step.get("action", ""), [params.get(name) for name in self.group_params]],
+            sort_keys=True,
+            default=str,
+        )
+
+    def accepts(self, step: Dict[str, Any]) -> bool:
+        """Checks that a step only uses parameters this rule knows how to carry over."""
+        if step.get("mcpTool") != self.tool_name or not step.get("id"):
+            return False
+        params = step.get("toolParameters", {}) or {}
+        if not isinstance(params, dict):
+            return False
+        known = set(self.group_params) | set(self.item_params)
+        return set(params.keys()) <= known and all(params.get(name) is not None for name in self.group_params)
+
+
+class PlanOptimizer:
+    """
+    Rewrites an execution plan before it runs by merging compatible adjacent steps
+    into a single batched AWS call.
+
+    A merged step keeps the original steps under 'coalescedSteps' so the PlanExecutor
+    can fan the batched result back out to every original step ID, keeping
+    '{{step-id.field}}' placeholders working.
+    """
+
+    def __init__(self, logger: logger):
+        self.logger = logger
+        self._rules: Dict[str, CoalescingRule] = {}
+        self._init_rules()
+
+    def _init_rules(self):
+        """Registers the coalescing rules for the tools that have a batched counterpart."""
+        self._register_rule(CoalescingRule(
+            tool_name="add-security-group-ingress-rule",
+            batch_tool_name="add-security-group-ingress-rules",
+            group_params=("group_id",),
+            item_params=("protocol", "from_port", "to_port", "cidr_block"),
+            items_param="rules",
+            max_batch_size=50,
+        ))
+        self._register_rule(CoalescingRule(
+            tool_name="add-security-group-egress-rule",
+            batch_tool_name="add-security-group-egress-rules",
+            group_params=("group_id",),
+            item_params=("protocol", "from_port", "to_port", "cidr_block"),
+            items_param="rules",
+            max_batch_size=50,
+        ))
+
+    def _register_rule(self, rule: CoalescingRule):
+        """Helper to register a coalescing rule."""
+        self._rules[rule.tool_name] = rule
+
+    def optimize(self, execution_plan: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Returns a new plan in which runs of adjacent, independent steps calling the same
+        coalescible tool with the same group parameters are replaced by one batched step.
+
+        Args:
+            execution_plan (List[Dict[str, Any]]): The plan steps, in execution order.
+
+        Returns:
+            List[Dict[str, Any]]: The optimized plan. Steps that cannot be merged are returned unchanged.
+        """
+        optimized: List[Dict[str, Any]] = []
+        group: List[Dict[str, Any]] = []
+        rule: CoalescingRule = None
+
+        def flush():
+            if not group:
+                return
+            if len(group) == 1:
+                optimized.append(group[0])
+            else:
+                optimized.append(self._merge(rule, group))
+            group.clear()
+
+        for step in execution_plan:
+            step_rule = self._rules.get(step.get("mcpTool")) if isinstance(step, dict) else None
+            if step_rule and step_rule.accepts(step):
+                if group and self._can_extend(rule, group, step_rule, step):
+                    group.append(step)
+                    continue
+                flush()
+                rule = step_rule
+                group.append(step)
+            else:
+                flush()
+                optimized.append(step)
+        flush()
+
+        if len(optimized) != len(execution_plan):
+            self.logger.info(f"Plan optimizer merged {len(execution_plan)} steps into {len(optimized)}.")
+        return optimized
+
+    def _can_extend(self, rule: CoalescingRule, group: List[Dict[str, Any]],
+                    step_rule: CoalescingRule, step: Dict[str, Any]) -> bool:
+        """Checks whether a step can join the current group of mergeable steps."""
+        if step_rule is not rule or len(group) >= rule.max_batch_size:
+            return False
+        if rule.group_key(step) != rule.group_key(group[0]):
+            return False
+        group_ids = {s["id"] for s in group}
+        return not (step_dependencies(step) & group_ids)
+
+    def _merge(self, rule: CoalescingRule, group: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Builds the batched step that replaces a group of mergeable steps."""
+        first_params = group[0].get("toolParameters", {})
+        merged_params = {name: first_params[name] for name in rule.group_params}
+        merged_params[rule.items_param] = [
+            {name: s["toolParameters"][name] for name in rule.item_params if name in s["toolParameters"]}
+            for s in group
+        ]
+
+        group_ids = [s["id"] for s in group]
+        depends_on = []
+        for s in group:
+            for dep in sorted(step_dependencies(s)):
+                if dep not in depends_on and dep not in group_ids:
+                    depends_on.append(dep)
+
+        self.logger.debug(f"Merging steps {group_ids} into a single '{rule.batch_tool_name}' call.")
+        return {
+            "id": f"batch-{group_ids[0]}",
+            "name": f"{group[0].get('name', rule.tool_name)} (+{len(group) - 1} merged)",
+            "action": group[0].get("action", ""),
+            "mcpTool": rule.batch_tool_name,
+            "toolParameters": merged_params,
+            "dependsOn": depends_on,
+            "coalescedSteps": list(group),
+        }
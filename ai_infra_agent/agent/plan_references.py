@@ -0,0 +1,109 @@
+import re
+from typing import Any, Dict, Iterator, List, Set
+
+# Matches both "{{step-id.field}}" and the single-brace "{step-id.field}" form
+# that the PlanExecutor also accepts.
+PLACEHOLDER_PATTERN = re.compile(r"\{\{([^{}]+?)\}\}|\{([^{}]+?)\}")
+
+# Placeholders that are generated at execution time rather than read from a step result.
+BUILTIN_PLACEHOLDERS = {"timestamp", "random_string"}
+
+
+def split_path(path: str) -> List[str]:
+    """
+    Splits a placeholder path into its keys.
+    Example: "step-id.subnets[0].subnet_id" -> ["step-id", "subnets", "0", "subnet_id"]
+    """
+    return [k for k in re.split(r'\.|\[|\]', path.strip()) if k]
+
+
+def iter_placeholder_paths(data: Any) -> Iterator[str]:
+    """
+    Recursively yields every placeholder path found in strings inside a data structure.
+    """
+    if isinstance(data, dict):
+        for value in data.values():
+            yield from iter_placeholder_paths(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from iter_placeholder_paths(item)
+    elif isinstance(data, str):
+        for match in PLACEHOLDER_PATTERN.finditer(data):
+            path = (match.group(1) or match.group(2) or "").strip()
+            if path and path not in BUILTIN_PLACEHOLDERS:
+                yield path
+
+
+def referenced_step_ids(data: Any) -> Set[str]:
+    """
+    Returns the IDs of all steps referenced by placeholders inside a data structure.
+    """
+    step_ids = set()
+    for path in iter_placeholder_paths(data):
+        keys = split_path(path)
+        if keys:
+            step_ids.add(keys[0])
+    return step_ids
+
+
+def step_dependencies(step: dict) -> Set[str]:
+    """
+    Returns every step ID a plan step depends on, combining its explicit 'dependsOn'
+    list with the steps referenced by placeholders in its 'toolParameters'.
+    """
+    depends_on = step.get("dependsOn") or []
+    if isinstance(depends_on, str):
+        depends_on = [depends_on]
+    return set(depends_on) | referenced_step_ids(step.get("toolParameters", {}))
+
+
+def referenced_result_paths(execution_plan: List[dict]) -> Dict[str, List[List[str]]]:
+    """
+    Collects, for every step ID, the paths into its result that other steps reference.
+    Example: "{{step-vpc.subnets[0].subnet_id}}" -> {"step-vpc": [["subnets", "0", "subnet_id"]]}
+    An empty path means the whole result is referenced.
+    """
+    paths: Dict[str, List[List[str]]] = {}
+    for step in execution_plan:
+        if not isinstance(step, dict):
+            continue
+        for path in iter_placeholder_paths(step.get("toolParameters", {})):
+            keys = split_path(path)
+            if keys:
+                paths.setdefault(keys[0], []).append(keys[1:])
+    return paths
+
+
+def _normalize_key(key: str) -> str:
+    # Same normalization as the PlanExecutor's case-insensitive context lookup.
+    return key.lower().replace("_", "")
+
+
+def prune_to_paths(value: Any, paths: List[List[str]]) -> Any:
+    """
+    Returns a copy of a step result that only keeps the parts reachable through the given paths.
+    Keys are matched case- and underscore-insensitively, like the PlanExecutor's lookup.
+    """
+    if not paths or any(not path for path in paths):
+        return value
+
+    if isinstance(value, dict):
+        by_key: Dict[str, List[List[str]]] = {}
+        for path in paths:
+            by_key.setdefault(_normalize_key(path[0]), []).append(path[1:])
+        pruned = {}
+        for key, item in value.items():
+            if isinstance(key, str) and _normalize_key(key) in by_key:
+                pruned[key] = prune_to_paths(item, by_key[_normalize_key(key)])
+        return pruned
+
+    if isinstance(value, list):
+        by_index: Dict[int, List[List[str]]] = {}
+        for path in paths:
+            if path[0].isdigit():
+                by_index.setdefault(int(path[0]), []).append(path[1:])
+        # Keep positions stable up to the highest referenced index.
+        length = min(len(value), max(by_index) + 1) if by_index else 0
+        return [prune_to_paths(value[i], by_index[i]) if i in by_index else None for i in range(length)]
+
+    return value
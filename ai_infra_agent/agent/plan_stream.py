@@ -0,0 +1,122 @@
+import json
+from typing import Dict, Any, List, Optional
+
+from loguru import logger
+
+# The key of the plan's step list, as required by the decision template.
+PLAN_STEPS_KEY = "executionPlan"
+
+
+def chunk_text(content: Any) -> str:
+    """
+    Returns the text of a streamed message chunk. Most providers stream plain strings;
+    some (e.g. Claude) stream lists of content blocks.
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            block if isinstance(block, str) else str(block.get("text", ""))
+            for block in content if isinstance(block, (str, dict))
+        )
+    return ""
+
+
+class IncrementalPlanParser:
+    """
+    Parses a plan while the LLM is still generating it, and returns each step of its
+    'executionPlan' array as soon as the step's JSON object is complete.
+
+    The parser scans every character once, tracking strings, escapes and nesting, so it
+    never re-parses the text it has already seen. Anything before the first '{' (such as
+    a markdown code fence) is ignored.
+    """
+
+    def __init__(self, logger: logger):
+        """
+        Args:
+            logger: The logger instance.
+        """
+        self.logger = logger
+        self.text = ""
+        self._position = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._keys: List[Optional[str]] = []
+        self._steps_depth: Optional[int] = None
+        self._step_start: Optional[int] = None
+        self.steps_emitted = 0
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Adds the next chunk of the LLM response.
+
+        Args:
+            chunk (str): The streamed text.
+
+        Returns:
+            List[Dict[str, Any]]: The steps completed by this chunk, in plan order.
+        """
+        self.text += chunk
+        completed: List[Dict[str, Any]] = []
+        text = self.text
+        for position in range(self._position, len(text)):
+            char = text[position]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    self._last_string = text[self._string_start:position + 1]
+                continue
+            if char == '"':
+                self._in_string = True
+                self._string_start = position
+            elif char == ":" and self._stack and self._stack[-1] == "{":
+                self._keys[-1] = self._decode_key(self._last_string)
+            elif char in "{[":
+                if not self._stack and char == "[":
+                    continue  # Only a top-level object is a plan.
+                is_steps = (char == "[" and len(self._stack) == 1 and self._keys[-1] == PLAN_STEPS_KEY)
+                if char == "{" and self._steps_depth is not None and len(self._stack) == self._steps_depth:
+                    self._step_start = position
+                self._stack.append(char)
+                self._keys.append(None)
+                if is_steps:
+                    self._steps_depth = len(self._stack)
+            elif char in "}]" and self._stack:
+                self._stack.pop()
+                self._keys.pop()
+                if char == "}" and self._step_start is not None and len(self._stack) == self._steps_depth:
+                    step = self._decode_step(text[self._step_start:position + 1])
+                    self._step_start = None
+                    if step is not None:
+                        completed.append(step)
+                elif char == "]" and self._steps_depth is not None and len(self._stack) < self._steps_depth:
+                    self._steps_depth = None
+        self._position = len(text)
+        self.steps_emitted += len(completed)
+        return completed
+
+    @staticmethod
+    def _decode_key(raw: Optional[str]) -> Optional[str]:
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def _decode_step(self, raw: str) -> Optional[Dict[str, Any]]:
+        try:
+            step = json.loads(raw)
+        except ValueError as e:
+            # The full response is parsed again at the end, which reports the error.
+            self.logger.debug(f"Could not parse a streamed plan step: {e}")
+            return None
+        return step if isinstance(step, dict) else None
@@ -0,0 +1,191 @@
+import json
+from typing import Dict, Any, List, Optional, Tuple
+
+from loguru import logger
+
+from ai_infra_agent.agent.plan_references import BUILTIN_PLACEHOLDERS, PLACEHOLDER_PATTERN, split_path
+from ai_infra_agent.agent.plan_stream import PLAN_STEPS_KEY
+from ai_infra_agent.infrastructure.tool_schemas import ToolSchemaRegistry
+
+
+def _normalize_step_id(step_id: Any) -> str:
+    # Same normalization as the PlanExecutor's case-insensitive context lookup.
+    return str(step_id).lower().replace("_", "")
+
+
+def _placeholders(data: Any) -> List[Tuple[str, bool]]:
+    """Returns every (placeholder path, uses double braces) in the strings of a data structure."""
+    found = []
+    if isinstance(data, dict):
+        for value in data.values():
+            found.extend(_placeholders(value))
+    elif isinstance(data, list):
+        for item in data:
+            found.extend(_placeholders(item))
+    elif isinstance(data, str):
+        for match in PLACEHOLDER_PATTERN.finditer(data):
+            path = (match.group(1) or match.group(2) or "").strip()
+            if path and path not in BUILTIN_PLACEHOLDERS:
+                found.append((path, match.group(1) is not None))
+    return found
+
+
+class PlanValidator:
+    """
+    Checks a plan locally, in milliseconds, before it is returned or executed: every step
+    names a registered tool, its parameters match the tool's schema, and every dependency
+    and '{{step-id.field}}' reference points at a step that runs earlier in the plan.
+
+    The checks use the tool schemas derived once from the tool registry, so nothing is
+    looked up per request. Problems are reported per step, so only the invalid steps need
+    to be repaired.
+    """
+
+    def __init__(self, logger: logger, tool_schemas: ToolSchemaRegistry):
+        """
+        Args:
+            logger: The logger instance.
+            tool_schemas (ToolSchemaRegistry): The schemas of the registered tools.
+        """
+        self.logger = logger
+        self.tool_schemas = tool_schemas
+
+    def validate(self, plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Validates a plan.
+
+        Args:
+            plan (Dict[str, Any]): The plan, with its steps under 'executionPlan'.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per invalid step, {"index", "stepId", "errors"}; empty if the plan is valid.
+                                  Problems with the plan as a whole have index None.
+        """
+        steps = plan.get(PLAN_STEPS_KEY) if isinstance(plan, dict) else None
+        if not isinstance(steps, list):
+            return [{"index": None, "stepId": None, "errors": [f"The plan has no '{PLAN_STEPS_KEY}' list."]}]
+
+        invalid: List[Dict[str, Any]] = []
+        all_ids = {_normalize_step_id(step.get("id")) for step in steps if isinstance(step, dict) and step.get("id")}
+        earlier_ids: set = set()
+        for index, step in enumerate(steps):
+            errors = self._step_errors(step, all_ids, earlier_ids)
+            step_id = step.get("id") if isinstance(step, dict) else None
+            if errors:
+                invalid.append({"index": index, "stepId": step_id, "errors": errors})
+            if step_id:
+                earlier_ids.add(_normalize_step_id(step_id))
+        return invalid
+
+    def _step_errors(self, step: Any, all_ids: set, earlier_ids: set) -> List[str]:
+        if not isinstance(step, dict):
+            return ["The step is not an object."]
+        errors = []
+        step_id = step.get("id")
+        tool_name = step.get("mcpTool")
+        if not step_id:
+            errors.append("The step has no 'id'.")
+        elif _normalize_step_id(step_id) in earlier_ids:
+            errors.append(f"Step ID '{step_id}' is used by an earlier step.")
+        if not tool_name:
+            errors.append("The step has no 'mcpTool'.")
+
+        params = step.get("toolParameters")
+        if params is None:
+            params = {}
+        if not isinstance(params, dict):
+            errors.append("'toolParameters' is not an object.")
+        elif tool_name:
+            errors.extend(self.tool_schemas.validate_params(tool_name, params))
+
+        depends_on = step.get("dependsOn") or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        for dependency in depends_on:
+            errors.extend(self._reference_errors("depends on", str(dependency), all_ids, earlier_ids))
+        if isinstance(params, dict):
+            for path, double_braces in _placeholders(params):
+                keys = split_path(path)
+                # "{...}" is also how scripts and policies use braces, so it only counts as a
+                # reference when it names a step; "{{...}}" is always a reference.
+                if keys and (double_braces or _normalize_step_id(keys[0]) in all_ids):
+                    errors.extend(self._reference_errors(f"references '{{{{{path}}}}}' of", keys[0], all_ids, earlier_ids))
+        return errors
+
+    @staticmethod
+    def _reference_errors(relation: str, referenced_id: str, all_ids: set, earlier_ids: set) -> List[str]:
+        normalized = _normalize_step_id(referenced_id)
+        if normalized in earlier_ids:
+            return []
+        if normalized in all_ids:
+            return [f"The step {relation} step '{referenced_id}', which runs after it."]
+        return [f"The step {relation} step '{referenced_id}', which does not exist."]
+
+    def repair_prompt(self, plan: Dict[str, Any], invalid_steps: List[Dict[str, Any]]) -> str:
+        """
+        Builds a short prompt asking the LLM to fix only the invalid steps of a plan.
+
+        It contains the invalid steps with their problems, the schemas of the tools they use,
+        and the IDs and tools of the other steps, so references can be corrected.
+
+        Args:
+            plan (Dict[str, Any]): The plan.
+            invalid_steps (List[Dict[str, Any]]): The result of validate.
+
+        Returns:
+            str: The repair prompt.
+        """
+        steps = plan.get(PLAN_STEPS_KEY) or []
+        broken = [steps[entry["index"]] for entry in invalid_steps if entry["index"] is not None]
+        problems = [{"stepId": entry["stepId"], "errors": entry["errors"]} for entry in invalid_steps]
+        tool_names = {step.get("mcpTool") for step in broken if isinstance(step, dict)}
+        schemas = [self.tool_schemas.get(name) for name in sorted(filter(None, tool_names)) if self.tool_schemas.get(name)]
+        outline = [
+            {"id": step.get("id"), "mcpTool": step.get("mcpTool")}
+            for step in steps if isinstance(step, dict)
+        ]
+        unknown_tools = [name for name in tool_names if not name or self.tool_schemas.get(name) is None]
+        # Only needed to replace a tool that does not exist, so the full list is left out otherwise.
+        registered = (
+            f"REGISTERED TOOLS:\n{json.dumps([schema['name'] for schema in self.tool_schemas.schemas()])}\n\n"
+            if unknown_tools else ""
+        )
+        return (
+            "Some steps of an AWS execution plan failed validation. Fix only these steps.\n\n"
+            f"PLAN OUTLINE (steps in execution order):\n{json.dumps(outline)}\n\n"
+            f"INVALID STEPS:\n{json.dumps(broken, default=str)}\n\n"
+            f"PROBLEMS:\n{json.dumps(problems)}\n\n"
+            f"SCHEMAS OF THE TOOLS USED:\n{json.dumps(schemas, default=str)}\n\n"
+            f"{registered}"
+            "Rules: keep each step's 'id'; use only registered tools and the parameters of their schemas; a step "
+            "may only reference ('{{step-id.field}}') or depend on steps that come before it in the outline.\n"
+            f'Respond with JSON only: {{"{PLAN_STEPS_KEY}": [the corrected steps]}}'
+        )
+
+    @staticmethod
+    def merge_repaired_steps(plan: Dict[str, Any], repaired: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns a copy of the plan whose steps are replaced by the repaired steps with the same ID.
+        """
+        replacements = {
+            _normalize_step_id(step.get("id")): step
+            for step in (repaired.get(PLAN_STEPS_KEY) or []) if isinstance(step, dict) and step.get("id")
+        }
+        steps = [
+            replacements.get(_normalize_step_id(step.get("id")), step) if isinstance(step, dict) else step
+            for step in plan.get(PLAN_STEPS_KEY) or []
+        ]
+        return {**plan, PLAN_STEPS_KEY: steps}
+
+
+def validation_error(invalid_steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Builds the error returned in place of a plan that failed validation."""
+    return {"error": "The generated plan failed validation.", "invalidSteps": invalid_steps}
+
+
+def summarize(invalid_steps: List[Dict[str, Any]], limit: Optional[int] = 3) -> str:
+    """Returns a one-line summary of validation problems, for logs and error messages."""
+    messages = [f"{entry['stepId'] or 'plan'}: {error}" for entry in invalid_steps for error in entry["errors"]]
+    shown = messages if limit is None else messages[:limit]
+    more = len(messages) - len(shown)
+    return "; ".join(shown) + (f" (and {more} more)" if more else "")
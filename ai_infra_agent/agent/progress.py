@@ -0,0 +1,210 @@
+import asyncio
+import itertools
+import json
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable
+
+from fastapi import WebSocket
+from loguru import logger
+
+# Progress protocols understood by the execution WebSocket.
+# "legacy" sends the full raw result of every step; "compact" sends step deltas
+# with projected results and lets the client fetch full results by step ID.
+PROTOCOL_LEGACY = "legacy"
+PROTOCOL_COMPACT = "compact"
+
+# Maximum nesting depth kept by the generic result projection.
+_MAX_PROJECTION_DEPTH = 2
+
+
+def _project_ec2_instances(result: Dict[str, Any]) -> Dict[str, Any]:
+    instances = result.get("Instances", [])
+    return {
+        "instance_ids": [i.get("InstanceId") for i in instances],
+        "instances": [
+            {
+                "instance_id": i.get("InstanceId"),
+                "instance_type": i.get("InstanceType"),
+                "state": (i.get("State") or {}).get("Name"),
+                "private_ip_address": i.get("PrivateIpAddress"),
+                "subnet_id": i.get("SubnetId"),
+            }
+            for i in instances
+        ],
+    }
+
+
+def _project_key_pair(result: Dict[str, Any]) -> Dict[str, Any]:
+    # The private key can only be retrieved once, so it must reach the client.
+    return {"key_name": result.get("key_name"), "key_material": result.get("key_material")}
+
+
+def _project_rule_change(result: Dict[str, Any]) -> Dict[str, Any]:
+    response = result.get("response") or {}
+    return {
+        "success": result.get("success", False),
+        "rule_ids": [r.get("SecurityGroupRuleId") for r in response.get("SecurityGroupRules", [])],
+    }
+
+
+# Tool-specific projections for tools that return raw boto3 responses.
+# Tools not listed here use the generic projection.
+RESULT_PROJECTIONS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "create-ec2-instance": _project_ec2_instances,
+    "launch-ec2-fleet": lambda result: {**_project_ec2_instances(result), "placement": result.get("placement", [])},
+    "create-key-pair": _project_key_pair,
+    "add-security-group-ingress-rule": _project_rule_change,
+    "add-security-group-egress-rule": _project_rule_change,
+    "add-security-group-ingress-rules": _project_rule_change,
+    "add-security-group-egress-rules": _project_rule_change,
+}
+
+
+def _project_generic(value: Any, depth: int = 0) -> Any:
+    """
+    Keeps scalar fields and shallow structure, and replaces large nested collections
+    with their size so the client can decide whether to fetch the full result.
+    """
+    if isinstance(value, dict):
+        if depth >= _MAX_PROJECTION_DEPTH:
+            return {"keys": len(value)}
+        return {
+            k: _project_generic(v, depth + 1)
+            for k, v in value.items()
+            if k != "ResponseMetadata"
+        }
+    if isinstance(value, list):
+        if depth >= _MAX_PROJECTION_DEPTH or any(isinstance(v, (dict, list)) for v in value):
+            return {"count": len(value)}
+        return value
+    return value
+
+
+def project_result(tool_name: str, result: Any) -> Any:
+    """
+    Projects a step result down to the fields the UI shows.
+
+    Args:
+        tool_name (str): The name of the tool that produced the result.
+        result (Any): The raw result returned by the tool.
+
+    Returns:
+        Any: A compact, JSON-friendly view of the result.
+    """
+    if not isinstance(result, dict):
+        return result
+    projection = RESULT_PROJECTIONS.get(tool_name)
+    if projection:
+        try:
+            return projection(result)
+        except Exception as e:
+            logger.warning(f"Result projection for tool '{tool_name}' failed, using generic projection: {e}")
+    return _project_generic(result)
+
+
+class ProgressChannel:
+    """
+    A bounded, per-connection send queue for execution progress messages.
+
+    Messages published with the same coalesce key replace each other while still queued,
+    so a slow client only receives the latest status of each step. When the queue is full,
+    the oldest droppable message is discarded; if every pending message must be delivered,
+    the publisher waits until the client catches up.
+    """
+
+    def __init__(self, websocket: WebSocket, logger: logger, max_pending: int = 32,
+                 serializer: Optional[Callable[[Any], Any]] = None):
+        """
+        Args:
+            websocket (WebSocket): The WebSocket connection to send messages on.
+            logger: The logger instance.
+            max_pending (int): The maximum number of messages waiting to be sent.
+            serializer (Callable, optional): The 'default' hook passed to json.dumps.
+        """
+        self.websocket = websocket
+        self.logger = logger
+        self.max_pending = max(1, max_pending)
+        self.serializer = serializer
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._droppable: set = set()
+        self._sequence = itertools.count()
+        self._condition = asyncio.Condition()
+        self._closed = False
+        self._sender: Optional[asyncio.Task] = None
+        self.coalesced_count = 0
+
+    def start(self) -> None:
+        """Starts the background task that drains the queue."""
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._drain())
+
+    async def publish(self, message: Dict[str, Any], coalesce_key: Optional[str] = None,
+                      droppable: bool = False) -> None:
+        """
+        Queues a message for delivery.
+
+        Args:
+            message (Dict[str, Any]): The message to send.
+            coalesce_key (str, optional): Messages sharing this key replace each other while queued.
+            droppable (bool): Whether the message may be discarded when the queue is full,
+                              e.g. an intermediate "running" status.
+        """
+        self.start()
+        async with self._condition:
+            if self._closed:
+                return
+            if coalesce_key is not None and coalesce_key in self._pending:
+                self._pending[coalesce_key] = message
+                if not droppable:
+                    self._droppable.discard(coalesce_key)
+                self.coalesced_count += 1
+                return
+
+            while len(self._pending) >= self.max_pending:
+                dropped = next((k for k in self._pending if k in self._droppable), None)
+                if dropped is not None:
+                    del self._pending[dropped]
+                    self._droppable.discard(dropped)
+                    self.coalesced_count += 1
+                    break
+                await self._condition.wait()
+                if self._closed:
+                    return
+
+            key = coalesce_key if coalesce_key is not None else f"seq-{next(self._sequence)}"
+            if droppable:
+                self._droppable.add(key)
+            self._pending[key] = message
+            self._condition.notify_all()
+
+    async def _drain(self) -> None:
+        """Sends queued messages one at a time until the channel is closed and empty."""
+        while True:
+            async with self._condition:
+                while not self._pending and not self._closed:
+                    await self._condition.wait()
+                if not self._pending and self._closed:
+                    return
+                key, message = self._pending.popitem(last=False)
+                self._droppable.discard(key)
+                self._condition.notify_all()
+            try:
+                await self.websocket.send_text(json.dumps(message, default=self.serializer))
+            except Exception as e:
+                self.logger.warning(f"Failed to send progress message, dropping remaining updates: {e}")
+                async with self._condition:
+                    self._pending.clear()
+                    self._droppable.clear()
+                    self._closed = True
+                    self._condition.notify_all()
+                return
+
+    async def close(self) -> None:
+        """Flushes every queued message and stops the sender task."""
+        async with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._sender is not None:
+            await self._sender
+        if self.coalesced_count:
+            self.logger.debug(f"Progress channel coalesced {self.coalesced_count} update(s) for a slow client.")
@@ -0,0 +1,193 @@
+import gzip
+import hashlib
+import json
+import queue
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from loguru import logger
+
+
+class PromptArchive:
+    """
+    A sampled, content-addressed archive of the prompts sent to the LLM, for debugging plans.
+
+    Recording a prompt only hashes it and puts references to its strings on a queue; a
+    background thread compresses and writes them, so capturing a prompt adds no I/O to the request.
+    The static prompt prefix, which is most of every prompt, is stored once under its hash
+    in 'prefixes/'. Each prompt is stored as a gzip-compressed delta in 'prompts/': the
+    prefix hash, the dynamic suffix and some metadata, named after the hash of the full
+    prompt, so identical prompts are stored once. When the queue is full, prompts are
+    dropped rather than slowing requests down.
+
+    The writer thread also prunes the archive, at most once per prune interval: prompts
+    older than max_age_seconds are deleted, then the oldest prompts until the archive
+    fits in max_bytes, and prefixes no longer used within max_age_seconds.
+    """
+
+    def __init__(self, logger: logger, archive_dir: str, sample_rate: float = 0.05, max_queue: int = 256,
+                 max_age_seconds: Optional[float] = 7 * 24 * 3600, max_bytes: Optional[int] = 256 * 1024 * 1024,
+                 prune_interval_seconds: float = 300):
+        """
+        Args:
+            logger: The logger instance.
+            archive_dir (str): The directory the prompts are written to.
+            sample_rate (float): The fraction (0-1) of prompts that are archived.
+            max_queue (int): The maximum number of prompts waiting to be written.
+            max_age_seconds (float, optional): How long archived prompts are kept. None keeps them regardless of age.
+            max_bytes (int, optional): The maximum total size of the archived prompts. None does not limit it.
+            prune_interval_seconds (float): The minimum time between two prunes.
+        """
+        self.logger = logger
+        self.archive_dir = Path(archive_dir)
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.prune_interval_seconds = prune_interval_seconds
+        self._last_prune: Optional[float] = None
+        self._queue: "queue.Queue[Tuple[str, str, str, Dict[str, Any]]]" = queue.Queue(maxsize=max(1, max_queue))
+        self._known_prefixes: set = set()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self.archived = 0
+        self.dropped = 0
+        self.pruned = 0
+
+    def record(self, static_prefix: str, dynamic_suffix: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Queues a prompt for archiving, if it is sampled. Never blocks.
+
+        Args:
+            static_prefix (str): The static part of the prompt.
+            dynamic_suffix (str): The request-specific part of the prompt.
+            metadata (Dict[str, Any], optional): Stored with the prompt, e.g. the provider and model.
+
+        Returns:
+            str: The ID the prompt is archived under, or None if it was not sampled or was dropped.
+        """
+        if self.sample_rate <= 0 or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return None
+        prompt_hash = hashlib.sha256(static_prefix.encode("utf-8"))
+        prompt_hash.update(dynamic_suffix.encode("utf-8"))
+        prompt_id = prompt_hash.hexdigest()
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait((prompt_id, static_prefix, dynamic_suffix, dict(metadata or {}, timestamp=time.time())))
+        except queue.Full:
+            self.dropped += 1
+            return None
+        return prompt_id
+
+    def flush(self) -> None:
+        """Blocks until every queued prompt has been written."""
+        self._queue.join()
+
+    def load(self, prompt_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Reads an archived prompt back.
+
+        Args:
+            prompt_id (str): The hash of the full prompt.
+
+        Returns:
+            Dict[str, Any]: The stored record with the reassembled 'prompt', or None if it is not archived.
+        """
+        path = self._prompt_path(prompt_id)
+        if not path.exists():
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            record = json.load(f)
+        prefix = (self.archive_dir / "prefixes" / f"{record['prefix']}.txt").read_text(encoding="utf-8")
+        record["prompt"] = prefix + record["suffix"]
+        return record
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="prompt-archive", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            prompt_id, static_prefix, dynamic_suffix, metadata = self._queue.get()
+            try:
+                self._write(prompt_id, static_prefix, dynamic_suffix, metadata)
+                self.archived += 1
+                now = time.monotonic()
+                if self._last_prune is None or now - self._last_prune >= self.prune_interval_seconds:
+                    self._last_prune = now
+                    self.prune()
+            except Exception as e:
+                self.logger.warning(f"Could not archive a prompt: {e}")
+            finally:
+                self._queue.task_done()
+
+    def prune(self) -> int:
+        """
+        Deletes expired prompts, then the oldest prompts beyond the size limit, then unused prefixes.
+
+        Returns:
+            int: The number of prompts deleted.
+        """
+        prompts = []
+        for path in (self.archive_dir / "prompts").rglob("*.json.gz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            prompts.append((stat.st_mtime, stat.st_size, path))
+        prompts.sort()
+
+        cutoff = time.time() - self.max_age_seconds if self.max_age_seconds is not None else None
+        total = sum(size for _, size, _ in prompts)
+        deleted = 0
+        for mtime, size, path in prompts:
+            expired = cutoff is not None and mtime < cutoff
+            if not expired and (self.max_bytes is None or total <= self.max_bytes):
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            deleted += 1
+
+        # Prefixes are touched whenever a prompt uses them, so an expired prefix has no live prompts.
+        if cutoff is not None:
+            for path in (self.archive_dir / "prefixes").glob("*.txt"):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink(missing_ok=True)
+                        self._known_prefixes.discard(path.stem)
+                except OSError:
+                    continue
+        self.pruned += deleted
+        if deleted:
+            self.logger.info(f"Pruned {deleted} archived prompt(s).")
+        return deleted
+
+    def _write(self, prompt_id: str, static_prefix: str, dynamic_suffix: str, metadata: Dict[str, Any]) -> None:
+        prefix_id = hashlib.sha256(static_prefix.encode("utf-8")).hexdigest()
+        prefix_path = self.archive_dir / "prefixes" / f"{prefix_id}.txt"
+        if prefix_id not in self._known_prefixes and not prefix_path.exists():
+            prefix_path.parent.mkdir(parents=True, exist_ok=True)
+            prefix_path.write_text(static_prefix, encoding="utf-8")
+        else:
+            # Marks the prefix as in use, so pruning keeps it as long as its prompts. This includes
+            # a prefix written before a restart, which is on disk but not yet known.
+            prefix_path.touch()
+        self._known_prefixes.add(prefix_id)
+
+        path = self._prompt_path(prompt_id)
+        if path.exists():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = dict(metadata, prefix=prefix_id, suffix=dynamic_suffix)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(record, f, default=str)
+
+    def _prompt_path(self, prompt_id: str) -> Path:
+        # Prompts are spread over subdirectories so no single directory grows too large.
+        return self.archive_dir / "prompts" / prompt_id[:2] / f"{prompt_id}.json.gz"
@@ -1,11 +1,14 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from pathlib import Path
 from ai_infra_agent.core.config import settings, ROOT_DIR
+import re
 import yaml
-import json
-from ai_infra_agent.infrastructure.tool_factory import ToolFactory
+from ai_infra_agent.infrastructure.tool_schemas import get_tool_schema_registry
 from loguru import logger
-from ai_infra_agent.core.logging import llm_request_logger # Import llm_request_logger
+
+# Stand-ins for the per-request values while the static part of the template is rendered.
+_REQUEST_SLOT = "\x00request\x00"
+_STATE_SLOT = "\x00state\x00"
 
 class PromptBuilder:
     """
@@ -35,8 +38,36 @@ class PromptBuilder:
         # Load the tools execution context template
         self.tools_context_template = self._load_text_file(ROOT_DIR / "settings/templates/tools-execution-context-optimized.txt")
 
-        # Initialize ToolFactory
-        self.tool_factory = ToolFactory(logger=logger) # Pass logger to ToolFactory
+        # Tool schemas are derived once per process; the tools context does not change between requests
+        self.tool_schemas = get_tool_schema_registry()
+        self.tools_context = self.tools_context_template.replace(
+            "{{MCP_TOOLS_SCHEMAS}}", self.tool_schemas.serialized()
+        )
+
+        # Everything before the first per-request value is rendered once, so every prompt starts
+        # with the same bytes and providers can cache that prefix.
+        self.static_prefix, dynamic_template = self._split_template()
+        self._dynamic_segments = re.split(f"({_REQUEST_SLOT}|{_STATE_SLOT})", dynamic_template)
+        logger.info(
+            f"Prompt static prefix is {len(self.static_prefix)} of {len(self.static_prefix) + len(dynamic_template)} characters."
+        )
+
+    def _split_template(self) -> Tuple[str, str]:
+        """
+        Renders the template with everything but the request and state, and splits it where
+        the first of those appears. The dynamic part keeps placeholders for the two values.
+        """
+        rendered = self.template.format(
+            request=_REQUEST_SLOT,
+            tools=self.tools_context,
+            state=_STATE_SLOT,
+            resource_patterns=self.resource_patterns,
+            field_mappings=self.field_mappings,
+            aws_region=settings.aws.region # Inject the region from config
+        )
+        positions = [position for position in (rendered.find(_REQUEST_SLOT), rendered.find(_STATE_SLOT)) if position >= 0]
+        split_at = min(positions) if positions else len(rendered)
+        return rendered[:split_at], rendered[split_at:]
 
     def _load_yaml_file(self, file_path: Path) -> str:
         """Loads a YAML file and returns its content as a string."""
@@ -74,12 +105,12 @@ Your task is to generate a JSON plan of tool calls to fulfill the user's request
 
 **Context:**
 
-**Current Infrastructure State:**
-{state}
-
 **Available Tools:**
 {tools}
 
+**Current Infrastructure State:**
+{state}
+
 **User Request:**
 "{request}"
 
@@ -94,42 +125,28 @@ Your task is to generate a JSON plan of tool calls to fulfill the user's request
 **JSON Plan:**
 """
 
-    def build(self, request: str, tools_context: str, current_state_formatted: str) -> str:
-        """Builds the final prompt string.
+    def build_parts(self, request: str, current_state_formatted: str) -> Tuple[str, str]:
+        """Builds the prompt as its static prefix, identical for every request, and its dynamic suffix.
 
         Args:
             request (str): The user's request.
-            tools_context (str): The formatted string of all available tool definitions.
             current_state_formatted (str): The formatted string representing the current infrastructure state.
 
         Returns:
-            str: The formatted prompt string.
+            Tuple[str, str]: The static prefix and the dynamic suffix; together they form the prompt.
         """
-        # Get tool information from ToolFactory
-        all_tool_info = self.tool_factory.get_all_tool_info()
-        # Format tool information as a JSON string for the prompt
-        formatted_tool_schemas = json.dumps(all_tool_info, indent=2)
-
-        # Replace the placeholder in the tools_context_template
-        final_tools_context = self.tools_context_template.replace(
-            "{{MCP_TOOLS_SCHEMAS}}", formatted_tool_schemas
-        )
+        values = {_REQUEST_SLOT: request, _STATE_SLOT: current_state_formatted}
+        return self.static_prefix, "".join(values.get(segment, segment) for segment in self._dynamic_segments)
 
-        # Format the main template
-        final_prompt_string = self.template.format(
-            request=request,
-            tools=final_tools_context, # Use the updated tools_context
-            state=current_state_formatted,
-            resource_patterns=self.resource_patterns,
-            field_mappings=self.field_mappings,
-            aws_region=settings.aws.region # Inject the region from config
-        )
+    def build(self, request: str, current_state_formatted: str) -> str:
+        """Builds the final prompt string. The tool definitions are part of the static prefix.
 
-        # Log the final prompt string to the dedicated LLM request logger
-        llm_request_logger.info(final_prompt_string)
-
-        # Debug print statements
-        print(f"--- DEBUG: Prompt Template (first 500 chars):\n{self.template[:500]}...")
-        print(f"--- DEBUG: Formatting args: request type={{type(request)}}, tools_context type={{type(tools_context)}}, current_state_formatted type={{type(current_state_formatted)}}")
+        Args:
+            request (str): The user's request.
+            current_state_formatted (str): The formatted string representing the current infrastructure state.
 
-        return final_prompt_string
+        Returns:
+            str: The formatted prompt string.
+        """
+        static_prefix, dynamic_suffix = self.build_parts(request, current_state_formatted)
+        return static_prefix + dynamic_suffix
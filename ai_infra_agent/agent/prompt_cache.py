@@ -0,0 +1,79 @@
+import hashlib
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+
+import botocore.session
+from langchain_core.messages import HumanMessage
+
+# Bedrock model families that accept cachePoint blocks; other models reject them.
+_BEDROCK_CACHING_MODELS = ("anthropic.claude", "amazon.nova")
+
+
+def prefix_cache_key(static_prefix: str) -> str:
+    """Returns a short, stable key identifying a prompt prefix across requests and processes."""
+    return hashlib.sha256(static_prefix.encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def bedrock_supports_cache_points() -> bool:
+    """
+    Returns whether the installed botocore knows the cachePoint content block. Older versions
+    reject the whole Converse request when it contains one.
+    """
+    try:
+        model = botocore.session.get_session().get_service_model("bedrock-runtime")
+        return "cachePoint" in model.shape_for("ContentBlock").members
+    except Exception:
+        return False
+
+
+def cache_hinted_input(provider: str, model: str, static_prefix: str, dynamic_suffix: str) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Builds the LLM input for a prompt made of a static prefix and a dynamic suffix, with the
+    hints each provider needs to reuse its cache of the prefix across requests.
+
+    - claude: the prefix is its own content block marked with cache_control.
+    - bedrock: a cachePoint block follows the prefix, for models and botocore versions that support it.
+    - openai: prefixes are cached automatically; prompt_cache_key routes requests sharing
+      the prefix to the same cache.
+    - gemini: prefixes are cached implicitly, so the prompt is sent as is.
+
+    Args:
+        provider (str): The configured LLM provider.
+        model (str): The configured model.
+        static_prefix (str): The part of the prompt that is identical for every request.
+        dynamic_suffix (str): The request-specific rest of the prompt.
+
+    Returns:
+        Tuple[Any, Dict[str, Any]]: The input to pass to the LLM's invoke, and extra invoke keyword arguments.
+    """
+    if provider == "claude":
+        return [HumanMessage(content=[
+            {"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": dynamic_suffix},
+        ])], {}
+    if (provider == "bedrock" and any(family in model for family in _BEDROCK_CACHING_MODELS)
+            and bedrock_supports_cache_points()):
+        return [HumanMessage(content=[
+            {"type": "text", "text": static_prefix},
+            {"cachePoint": {"type": "default"}},
+            {"type": "text", "text": dynamic_suffix},
+        ])], {}
+    if provider == "openai":
+        return static_prefix + dynamic_suffix, {"prompt_cache_key": prefix_cache_key(static_prefix)}
+    return static_prefix + dynamic_suffix, {}
+
+
+def cached_prompt_tokens(response: Any) -> int:
+    """Returns how many prompt tokens the provider served from its cache, if it reports it."""
+    metadata = getattr(response, "response_metadata", None) or {}
+    usage = metadata.get("usage") or metadata.get("token_usage") or {}
+    if not isinstance(usage, dict):
+        return 0
+    details = usage.get("prompt_tokens_details") or {}
+    return int(
+        usage.get("cache_read_input_tokens")  # Anthropic
+        or usage.get("cacheReadInputTokens")  # Bedrock Converse
+        or (details.get("cached_tokens") if isinstance(details, dict) else 0)  # OpenAI
+        or 0
+    )
@@ -0,0 +1,160 @@
+import hashlib
+import os
+import secrets
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+# Results containing these fields (e.g. the private key of 'create-key-pair') are never written to disk.
+SECRET_FIELDS = ("key_material", "master_user_password", "secret_access_key", "password")
+
+
+class _ExecutionResults:
+    """Holds the serialized step results of a single plan execution."""
+
+    def __init__(self, user_id: Optional[str]):
+        self.user_id = user_id
+        self.updated_at = time.monotonic()
+        # Either the serialized result itself, or the file it was spilled to.
+        self.steps: Dict[str, Union[str, Path]] = {}
+
+
+class ResultStore:
+    """
+    Keeps the full, serialized result of every executed step so clients using the
+    compact progress protocol can fetch them on demand by execution and step ID.
+
+    Results are stored as JSON strings, so each result is serialized exactly once.
+    By default they are kept in memory, so memory use grows with the size of the step
+    results of up to 'max_executions' executions. When a spill directory is configured, the strings are written to disk, readable by
+    the owner only, and only their paths are kept in memory; results holding secrets stay
+    in memory. The store is bounded: the least recently updated executions are evicted
+    first, and executions older than the TTL are dropped.
+    """
+
+    def __init__(self, max_executions: int = 256, ttl_seconds: int = 3600, spill_dir: Optional[str] = None):
+        """
+        Args:
+            max_executions (int): The maximum number of executions kept.
+            ttl_seconds (int): How long the results of an execution are kept after its last update.
+            spill_dir (str, optional): Directory the results are written to. If None, they stay in memory.
+                                       Each process writes to its own subdirectory, so workers can share it.
+        """
+        self.max_executions = max_executions
+        self.ttl_seconds = ttl_seconds
+        self.spill_dir = None
+        self._executions: "OrderedDict[str, _ExecutionResults]" = OrderedDict()
+        self._lock = threading.Lock()
+        if spill_dir:
+            root = Path(spill_dir)
+            root.mkdir(parents=True, exist_ok=True)
+            self._remove_expired_spills(root)
+            self.spill_dir = root / f"worker-{os.getpid()}-{secrets.token_hex(4)}"
+            self.spill_dir.mkdir(mode=0o700)
+
+    def put(self, execution_id: str, step_id: str, serialized_result: str, user_id: Optional[str] = None) -> bool:
+        """
+        Stores the serialized result of a step.
+
+        Args:
+            execution_id (str): The ID of the plan execution.
+            step_id (str): The ID of the step.
+            serialized_result (str): The step result, already serialized to JSON.
+            user_id (str, optional): The owner of the execution, checked on retrieval.
+
+        Returns:
+            bool: False if the execution belongs to a different user, in which case nothing is stored.
+        """
+        with self._lock:
+            self._evict_expired()
+            execution = self._executions.get(execution_id)
+            if execution is None:
+                execution = _ExecutionResults(user_id)
+                self._executions[execution_id] = execution
+            elif execution.user_id != user_id:
+                return False
+            execution.steps[step_id] = self._spill(execution_id, step_id, serialized_result)
+            execution.updated_at = time.monotonic()
+            self._executions.move_to_end(execution_id)
+            while len(self._executions) > self.max_executions:
+                self._discard(*self._executions.popitem(last=False))
+            return True
+
+    def get(self, execution_id: str, step_id: str, user_id: Optional[str] = None) -> Optional[str]:
+        """
+        Returns the serialized result of a step, or None if it is unknown, expired,
+        or owned by a different user.
+        """
+        with self._lock:
+            self._evict_expired()
+            execution = self._executions.get(execution_id)
+            if execution is None:
+                return None
+            if execution.user_id is not None and execution.user_id != user_id:
+                return None
+            stored = execution.steps.get(step_id)
+        if isinstance(stored, Path):
+            try:
+                return stored.read_text(encoding="utf-8")
+            except OSError:
+                return None
+        return stored
+
+    def step_ids(self, execution_id: str, user_id: Optional[str] = None) -> Optional[list]:
+        """Returns the IDs of the stored steps of an execution, or None if it is not accessible."""
+        with self._lock:
+            execution = self._executions.get(execution_id)
+            if execution is None or (execution.user_id is not None and execution.user_id != user_id):
+                return None
+            return list(execution.steps.keys())
+
+    def _evict_expired(self) -> None:
+        """Drops executions whose last update is older than the TTL. Must hold the lock."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._executions:
+            execution_id, execution = next(iter(self._executions.items()))
+            if execution.updated_at >= cutoff:
+                break
+            del self._executions[execution_id]
+            self._discard(execution_id, execution)
+
+    def _remove_expired_spills(self, root: Path) -> None:
+        """
+        Removes the spill directories of workers that wrote nothing within the TTL. Their results
+        have expired, and do not survive a restart anyway because owners are only tracked in memory;
+        the directories of live workers are left alone.
+        """
+        cutoff = time.time() - self.ttl_seconds
+        for worker_dir in root.glob("worker-*"):
+            try:
+                last_write = max((path.stat().st_mtime for path in worker_dir.rglob("*")), default=worker_dir.stat().st_mtime)
+            except OSError:
+                continue
+            if last_write < cutoff:
+                shutil.rmtree(worker_dir, ignore_errors=True)
+
+    def _execution_dir(self, execution_id: str) -> Path:
+        # Execution IDs come from clients, so they are hashed instead of used as path components.
+        return self.spill_dir / hashlib.sha256(execution_id.encode("utf-8")).hexdigest()[:32]
+
+    def _spill(self, execution_id: str, step_id: str, serialized_result: str) -> Union[str, Path]:
+        """Writes a result to the spill directory, falling back to memory if that fails."""
+        if self.spill_dir is None or any(f'"{field}"' in serialized_result for field in SECRET_FIELDS):
+            return serialized_result
+        path = self._execution_dir(execution_id) / f"{hashlib.sha256(step_id.encode('utf-8')).hexdigest()[:32]}.json"
+        try:
+            path.parent.mkdir(mode=0o700, exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(serialized_result)
+            return path
+        except OSError:
+            return serialized_result
+
+    def _discard(self, execution_id: str, execution: _ExecutionResults) -> None:
+        """Removes the spilled files of an evicted execution."""
+        if self.spill_dir is not None:
+            shutil.rmtree(self._execution_dir(execution_id), ignore_errors=True)
@@ -0,0 +1,618 @@
+import asyncio
+import json
+import re
+import uuid
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from loguru import logger
+
+from ai_infra_agent.infrastructure.tool_factory import ToolFactory
+from ai_infra_agent.state.schemas import InfrastructureState
+
+
+def _synthetic_id(prefix: str) -> str:
+    """Generates an ID with the same shape as a real AWS resource ID, e.g. 'vpc-0a1b2c3d4e5f60718'."""
+    return f"{prefix}-{uuid.uuid4().hex[:17]}"
+
+
+# Resource types covered by the discovery scanner. References to other types (e.g. subnets)
+# cannot be checked against the discovered state, so they are assumed to exist.
+DISCOVERED_TYPES = {"aws_ec2_instance", "aws_vpc", "aws_security_group", "aws_rds_db_subnet_group", "aws_rds_instance"}
+
+
+def _field(properties: Dict[str, Any], name: str, default: Any = None) -> Any:
+    """
+    Reads a property regardless of its casing, since discovered resources use the
+    snake_case keys of the list tools while simulated ones use the AWS PascalCase keys.
+    """
+    normalized = name.lower().replace("_", "")
+    for key, value in properties.items():
+        if isinstance(key, str) and key.lower().replace("_", "") == normalized:
+            return value
+    return default
+
+
+def _instance_ids(params: Dict[str, Any]) -> List[str]:
+    ids = list(params.get("instance_ids") or [])
+    if params.get("instance_id"):
+        ids.append(params["instance_id"])
+    return ids
+
+
+# EC2 operations that accept DryRun=True, mapped from the tool that performs them.
+# Each entry is (client operation, builder turning the tool parameters into API parameters).
+DRY_RUN_OPERATIONS: Dict[str, Tuple[str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "create-ec2-instance": ("run_instances", lambda p: {
+        k: v for k, v in {
+            "ImageId": p.get("image_id") or p.get("imageId"),
+            "InstanceType": p.get("instance_type"),
+            "KeyName": p.get("key_name"),
+            "SubnetId": p.get("subnet_id"),
+            "SecurityGroupIds": p.get("security_group_ids"),
+            "MinCount": p.get("min_count", 1),
+            "MaxCount": p.get("max_count", 1),
+        }.items() if v is not None
+    }),
+    "launch-ec2-fleet": ("run_instances", lambda p: {
+        "ImageId": p.get("image_id"),
+        "InstanceType": p.get("instance_type"),
+        "KeyName": p.get("key_name"),
+        "SubnetId": (p.get("subnet_ids") or [None])[0],
+        "SecurityGroupIds": p.get("security_group_ids"),
+        "MinCount": 1,
+        "MaxCount": 1,
+    }),
+    "create-vpc": ("create_vpc", lambda p: {"CidrBlock": p.get("cidr_block")}),
+    "create-internet-gateway": ("create_internet_gateway", lambda p: {}),
+    "create-key-pair": ("create_key_pair", lambda p: {"KeyName": p.get("key_name")}),
+    "create-security-group": ("create_security_group", lambda p: {
+        "GroupName": p.get("group_name"), "Description": p.get("description"), "VpcId": p.get("vpc_id"),
+    }),
+    "create-volume": ("create_volume", lambda p: {
+        "AvailabilityZone": p.get("availability_zone"), "Size": p.get("size"), "VolumeType": p.get("volume_type", "gp3"),
+    }),
+    "start-ec2-instance": ("start_instances", lambda p: {"InstanceIds": _instance_ids(p)}),
+    "stop-instance": ("stop_instances", lambda p: {"InstanceIds": _instance_ids(p)}),
+    "terminate-ec2-instance": ("terminate_instances", lambda p: {"InstanceIds": _instance_ids(p)}),
+    "bulk-start-instances": ("start_instances", lambda p: {"InstanceIds": _instance_ids(p)}),
+    "bulk-stop-instances": ("stop_instances", lambda p: {"InstanceIds": _instance_ids(p)}),
+    "bulk-terminate-instances": ("terminate_instances", lambda p: {"InstanceIds": _instance_ids(p)}),
+}
+
+
+class PlanSimulator:
+    """
+    Executes plan steps against an in-memory copy of the discovered infrastructure state
+    instead of AWS.
+
+    Creation tools return synthetic results shaped like the real tool results, so
+    '{{step-id.field}}' placeholders resolve exactly as they would in a live run.
+    Steps that reference resources missing from the model fail the same way a real
+    call would. Optionally, every EC2 mutation whose parameters only reference real
+    resources is also checked against AWS with DryRun=True; these checks run in the
+    background in parallel and are collected at the end of the simulation.
+    """
+
+    def __init__(self, state: InfrastructureState, logger: logger,
+                 tool_factory: Optional[ToolFactory] = None,
+                 user_aws_config: Optional[Dict[str, Any]] = None,
+                 check_permissions: bool = False):
+        """
+        Args:
+            state (InfrastructureState): The discovered state to simulate against. It is copied, never modified.
+            logger: The logger instance.
+            tool_factory (ToolFactory, optional): Used to reach the AWS adapters for permission checks.
+            user_aws_config (Dict[str, Any], optional): User-specific AWS credentials for permission checks.
+            check_permissions (bool): Whether to run AWS DryRun permission checks for EC2 mutations.
+        """
+        self.logger = logger
+        self.tool_factory = tool_factory
+        self.user_aws_config = user_aws_config or {}
+        self.check_permissions = bool(check_permissions and tool_factory and user_aws_config)
+        self.region = self.user_aws_config.get("region", "us-east-1")
+        self.resources: Dict[str, Dict[str, Any]] = {
+            resource_id: {"type": resource.type, "properties": dict(resource.properties)}
+            for resource_id, resource in state.resources.items()
+        }
+        self.synthetic_ids: set = set()
+        self._permission_tasks: List[asyncio.Task] = []
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+        self._init_handlers()
+
+    def _init_handlers(self):
+        """Registers the simulated implementation of each tool."""
+        # --- EC2 ---
+        self._register_handler("create-ec2-instance", self._create_ec2_instance)
+        self._register_handler("launch-ec2-fleet", self._launch_ec2_fleet)
+        self._register_handler("terminate-ec2-instance", self._change_instance_state("terminated", "TerminatingInstances"))
+        self._register_handler("start-ec2-instance", self._change_instance_state("pending", "StartingInstances"))
+        self._register_handler("stop-instance", self._change_instance_state("stopping", "StoppingInstances"))
+        self._register_handler("bulk-start-instances", self._bulk_change_instance_state("pending"))
+        self._register_handler("bulk-stop-instances", self._bulk_change_instance_state("stopping"))
+        self._register_handler("bulk-terminate-instances", self._bulk_change_instance_state("terminated"))
+        self._register_handler("bulk-tag-resources", self._bulk_tag_resources)
+        self._register_handler("create-volume", self._create_volume)
+        self._register_handler("list-availability-zones", self._list_availability_zones)
+        self._register_handler("list-ec2-instances", self._list_ec2_instances)
+        # --- AMI ---
+        self._register_handler("get-latest-amazon-linux-ami", self._latest_ami("al2023-ami-simulated-x86_64"))
+        self._register_handler("get-latest-ubuntu-ami", self._latest_ami("ubuntu-jammy-22.04-amd64-server-simulated"))
+        self._register_handler("get-latest-ami", self._latest_family_ami)
+        # --- Key Pairs ---
+        self._register_handler("create-key-pair", self._create_key_pair)
+        # --- VPC ---
+        self._register_handler("get-default-vpc", self._get_default_vpc)
+        self._register_handler("list-vpcs", self._list_vpcs)
+        self._register_handler("create-vpc", self._create_vpc)
+        self._register_handler("list-subnets", self._list_subnets)
+        self._register_handler("list-subnets-for-alb", self._list_subnets_for_alb)
+        self._register_handler("create-internet-gateway", self._create_internet_gateway)
+        self._register_handler("attach-internet-gateway", self._attach_internet_gateway)
+        self._register_handler("create-public-subnet", self._create_public_subnet)
+        # --- Security Groups ---
+        self._register_handler("create-security-group", self._create_security_group)
+        self._register_handler("list-security-groups", self._list_security_groups)
+        self._register_handler("delete-security-group", self._delete_security_group)
+        for tool_name in ("add-security-group-ingress-rule", "add-security-group-egress-rule",
+                          "add-security-group-ingress-rules", "add-security-group-egress-rules"):
+            self._register_handler(tool_name, self._add_security_group_rules)
+        # --- RDS ---
+        self._register_handler("create-db-subnet-group", self._create_db_subnet_group)
+        self._register_handler("create-db-instance", self._create_db_instance)
+        # --- ELB / S3 ---
+        self._register_handler("create-load-balancer", self._create_load_balancer)
+        self._register_handler("create-s3-bucket", self._create_s3_bucket)
+
+    def _register_handler(self, tool_name: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]]):
+        """Helper to register a simulated tool implementation."""
+        self._handlers[tool_name] = handler
+
+    # --- Public API ---
+
+    def simulate(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Simulates a single tool call.
+
+        Args:
+            tool_name (str): The name of the tool the step calls.
+            params (Dict[str, Any]): The resolved tool parameters.
+
+        Returns:
+            Dict[str, Any]: A synthetic result shaped like the real tool's result.
+
+        Raises:
+            ValueError: If the tool is unknown or the step references a resource that does not exist.
+        """
+        handler = self._handlers.get(tool_name)
+        if handler is None:
+            if self.tool_factory and tool_name not in self.tool_factory.get_tool_names():
+                raise ValueError(f"Tool '{tool_name}' not found.")
+            self.logger.warning(f"No simulation available for tool '{tool_name}', returning an empty result.")
+            return {"simulated": True}
+
+        result = handler(params)
+        if self.check_permissions and tool_name in DRY_RUN_OPERATIONS:
+            self._schedule_permission_check(tool_name, params)
+        return result
+
+    async def collect_permission_checks(self) -> List[Dict[str, Any]]:
+        """Waits for all scheduled DryRun permission checks and returns their outcomes."""
+        if not self._permission_tasks:
+            return []
+        results = await asyncio.gather(*self._permission_tasks)
+        self._permission_tasks.clear()
+        return list(results)
+
+    # --- Permission checks ---
+
+    def _schedule_permission_check(self, tool_name: str, params: Dict[str, Any]):
+        """Starts a DryRun permission check in the background, unless it references synthetic IDs."""
+        serialized = json.dumps(params, default=str)
+        if any(synthetic_id in serialized for synthetic_id in self.synthetic_ids):
+            self.logger.debug(f"Skipping DryRun check for '{tool_name}': it references resources created by this plan.")
+            return
+        operation, build_params = DRY_RUN_OPERATIONS[tool_name]
+        api_params = {k: v for k, v in build_params(params).items() if v is not None}
+        self._permission_tasks.append(
+            asyncio.create_task(asyncio.to_thread(self._check_permission, tool_name, operation, api_params))
+        )
+
+    def _check_permission(self, tool_name: str, operation: str, api_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Runs a single DryRun call through the tool's adapter."""
+        try:
+            tool = self.tool_factory.get_tool(tool_name, self.user_aws_config)
+            outcome = tool.adapter.check_permission(operation, **api_params)
+        except Exception as e:
+            outcome = {"allowed": False, "code": "CheckFailed", "message": str(e)}
+        return {"tool": tool_name, "operation": operation, **outcome}
+
+    # --- Model helpers ---
+
+    def _add(self, resource_type: str, resource_id: str, properties: Dict[str, Any]) -> None:
+        self.synthetic_ids.add(resource_id)
+        self.resources[resource_id] = {"type": resource_type, "properties": properties}
+
+    def _of_type(self, resource_type: str) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(rid, r["properties"]) for rid, r in self.resources.items() if r["type"] == resource_type]
+
+    def _require(self, resource_type: str, resource_id: Any, label: str) -> Dict[str, Any]:
+        """Returns the properties of a modelled resource, or raises like AWS would for a missing one."""
+        if not isinstance(resource_id, str) or not resource_id:
+            raise ValueError(f"Simulation: a valid {label} is required, got {resource_id!r}.")
+        resource = self.resources.get(resource_id)
+        if resource is None and resource_type not in DISCOVERED_TYPES:
+            return {}
+        if resource is None or resource["type"] != resource_type:
+            raise ValueError(f"Simulation: {label} '{resource_id}' does not exist.")
+        return resource["properties"]
+
+    # --- EC2 ---
+
+    def _create_ec2_instance(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        image_id = params.get("image_id") or params.get("imageId")
+        if not image_id:
+            raise ValueError("image_id (or imageId) is a required argument.")
+        subnet_id = params.get("subnet_id")
+        subnet = self._require("aws_subnet", subnet_id, "subnet") if subnet_id else {}
+        for group_id in params.get("security_group_ids") or []:
+            self._require("aws_security_group", group_id, "security group")
+
+        instances = []
+        for _ in range(int(params.get("max_count") or params.get("min_count") or 1)):
+            instance_id = _synthetic_id("i")
+            instance = {
+                "InstanceId": instance_id,
+                "ImageId": image_id,
+                "InstanceType": params.get("instance_type"),
+                "KeyName": params.get("key_name"),
+                "State": {"Code": 0, "Name": "pending"},
+                "SubnetId": subnet_id,
+                "VpcId": _field(subnet, "VpcId"),
+                "PrivateIpAddress": "10.0.0.10",
+                "SecurityGroups": [{"GroupId": g} for g in params.get("security_group_ids") or []],
+                "Tags": params.get("tags") or [],
+                "LaunchTime": datetime.utcnow(),
+            }
+            self._add("aws_ec2_instance", instance_id, instance)
+            instances.append(instance)
+        return {"Instances": instances, "OwnerId": "000000000000", "ReservationId": _synthetic_id("r")}
+
+    def _launch_ec2_fleet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        count = int(params.get("count") or 0)
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+        subnet_ids = params.get("subnet_ids") or [
+            rid for rid, p in self._of_type("aws_subnet")
+            if not params.get("vpc_id") or _field(p, "VpcId") == params.get("vpc_id")
+        ]
+        if not subnet_ids:
+            raise ValueError("Simulation: no subnets found to launch the fleet into.")
+
+        instances, placement = [], []
+        for index, subnet_id in enumerate(subnet_ids):
+            share = count // len(subnet_ids) + (1 if index < count % len(subnet_ids) else 0)
+            if not share:
+                continue
+            launched = self._create_ec2_instance({**params, "subnet_id": subnet_id, "min_count": share, "max_count": share})
+            instances.extend(launched["Instances"])
+            placement.append({
+                "subnet_id": subnet_id,
+                "availability_zone": _field(self._require("aws_subnet", subnet_id, "subnet"), "AvailabilityZone"),
+                "requested": share,
+                "launched": share,
+            })
+        return {"Instances": instances, "InstanceIds": [i["InstanceId"] for i in instances], "placement": placement}
+
+    def _change_instance_state(self, new_state: str, response_key: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        def handler(params: Dict[str, Any]) -> Dict[str, Any]:
+            instance_ids = _instance_ids(params)
+            if not instance_ids:
+                raise ValueError("Either 'instance_id' or 'instance_ids' must be provided.")
+            changes = []
+            for instance_id in instance_ids:
+                instance = self._require("aws_ec2_instance", instance_id, "instance")
+                state = _field(instance, "State") or {}
+                previous = state.get("Name", "unknown") if isinstance(state, dict) else state
+                instance["State"] = {"Name": new_state}
+                changes.append({
+                    "InstanceId": instance_id,
+                    "PreviousState": {"Name": previous},
+                    "CurrentState": {"Name": new_state},
+                })
+            return {response_key: changes}
+        return handler
+
+    def _bulk_change_instance_state(self, new_state: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        def handler(params: Dict[str, Any]) -> Dict[str, Any]:
+            instance_ids = _instance_ids(params)
+            if not instance_ids:
+                raise ValueError("Either 'instance_id' or 'instance_ids' must be provided.")
+            results = {}
+            for instance_id in dict.fromkeys(instance_ids):
+                try:
+                    instance = self._require("aws_ec2_instance", instance_id, "instance")
+                except ValueError as e:
+                    results[instance_id] = {"status": "failed", "error": str(e)}
+                    continue
+                state = _field(instance, "State") or {}
+                previous = state.get("Name", "unknown") if isinstance(state, dict) else state
+                instance["State"] = {"Name": new_state}
+                results[instance_id] = {"status": "succeeded", "previous_state": previous, "current_state": new_state}
+            return self._bulk_result(results, params)
+        return handler
+
+    def _bulk_tag_resources(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        resource_ids = params.get("resource_ids") or []
+        if not resource_ids or not params.get("tags"):
+            raise ValueError("Both 'resource_ids' and 'tags' must be provided.")
+        results = {}
+        for resource_id in dict.fromkeys(resource_ids):
+            if resource_id in self.resources:
+                results[resource_id] = {"status": "succeeded"}
+            else:
+                results[resource_id] = {"status": "failed", "error": f"Simulation: resource '{resource_id}' does not exist."}
+        return self._bulk_result(results, params)
+
+    @staticmethod
+    def _bulk_result(results: Dict[str, Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+        """Shapes per-ID results like the bulk tools do, failing the step on partial failure unless allowed."""
+        succeeded = [rid for rid, r in results.items() if r["status"] == "succeeded"]
+        failed = [rid for rid, r in results.items() if r["status"] != "succeeded"]
+        if failed and (params.get("fail_on_partial", True) or not succeeded):
+            raise ValueError(f"Simulation: {len(failed)} of {len(results)} resource(s) failed: {results[failed[0]]['error']}")
+        return {"results": results, "succeeded": succeeded, "failed": failed}
+
+    def _create_volume(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        volume_id = _synthetic_id("vol")
+        volume = {
+            "VolumeId": volume_id,
+            "AvailabilityZone": params.get("availability_zone"),
+            "Size": params.get("size"),
+            "VolumeType": params.get("volume_type", "gp3"),
+            "State": "creating",
+            "Tags": params.get("tags") or [],
+        }
+        self._add("aws_ebs_volume", volume_id, volume)
+        return dict(volume)
+
+    def _list_availability_zones(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"availability_zones": [f"{self.region}{suffix}" for suffix in ("a", "b", "c")]}
+
+    def _list_ec2_instances(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        wanted = set(params.get("instance_ids") or [])
+        instances = [p for rid, p in self._of_type("aws_ec2_instance") if not wanted or rid in wanted]
+        return {"Reservations": [{"Instances": instances}] if instances else []}
+
+    def _latest_ami(self, name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        def handler(params: Dict[str, Any]) -> Dict[str, Any]:
+            return {"ami_id": _synthetic_id("ami"), "description": "Simulated AMI", "name": name}
+        return handler
+
+    def _latest_family_ami(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._latest_ami(f"{params.get('family', 'amazon-linux-2023')}-simulated")(params)
+
+    # --- Key Pairs ---
+
+    def _create_key_pair(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        key_name = params.get("key_name")
+        if not key_name:
+            raise ValueError("key_name is a required argument.")
+        if any(_field(p, "KeyName") == key_name for _, p in self._of_type("aws_key_pair")):
+            raise ValueError(f"Simulation: key pair '{key_name}' already exists.")
+        self._add("aws_key_pair", _synthetic_id("key"), {"KeyName": key_name})
+        return {"key_name": key_name, "key_material": "-----SIMULATED KEY MATERIAL-----"}
+
+    # --- VPC ---
+
+    def _vpc_summary(self, vpc_id: str, vpc: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "vpc_id": vpc_id,
+            "is_default": _field(vpc, "IsDefault", False),
+            "cidr_block": _field(vpc, "CidrBlock"),
+            "state": _field(vpc, "State", "available"),
+            "tags": _field(vpc, "Tags", []),
+        }
+
+    def _subnet_summary(self, subnet_id: str, subnet: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "subnet_id": subnet_id,
+            "availability_zone": _field(subnet, "AvailabilityZone"),
+            "cidr_block": _field(subnet, "CidrBlock"),
+            "state": _field(subnet, "State", "available"),
+            "vpc_id": _field(subnet, "VpcId"),
+            "tags": _field(subnet, "Tags", []),
+        }
+
+    def _get_default_vpc(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        for vpc_id, vpc in self._of_type("aws_vpc"):
+            if _field(vpc, "IsDefault"):
+                return {"vpc_id": vpc_id}
+        raise ValueError("Simulation: no default VPC found in the discovered state.")
+
+    def _list_vpcs(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"vpcs": [self._vpc_summary(vpc_id, vpc) for vpc_id, vpc in self._of_type("aws_vpc")]}
+
+    def _create_vpc(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        vpc_id = _synthetic_id("vpc")
+        vpc = {"VpcId": vpc_id, "CidrBlock": params.get("cidr_block"), "State": "pending",
+               "IsDefault": False, "Tags": params.get("tags") or []}
+        self._add("aws_vpc", vpc_id, vpc)
+        return {"vpc_id": vpc_id, "details": dict(vpc)}
+
+    def _subnets_in(self, vpc_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        return [(sid, s) for sid, s in self._of_type("aws_subnet") if _field(s, "VpcId") == vpc_id]
+
+    def _list_subnets(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        vpc_id = params.get("vpc_id")
+        self._require("aws_vpc", vpc_id, "VPC")
+        return {"subnets": [self._subnet_summary(sid, s) for sid, s in self._subnets_in(vpc_id)]}
+
+    def _list_subnets_for_alb(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        vpc_id = params.get("vpc_id")
+        self._require("aws_vpc", vpc_id, "VPC")
+        min_azs = int(params.get("min_azs", 2))
+        subnets = self._subnets_in(vpc_id)
+        if not subnets and vpc_id not in self.synthetic_ids:
+            # Subnets of discovered VPCs are not part of the discovered state; assume one per AZ.
+            subnets = [(_synthetic_id("subnet"), {"AvailabilityZone": f"{self.region}{suffix}", "VpcId": vpc_id})
+                       for suffix in "abc"[:max(min_azs, 2)]]
+        by_az: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        for subnet_id, subnet in subnets:
+            by_az.setdefault(_field(subnet, "AvailabilityZone"), (subnet_id, subnet))
+        if len(by_az) < min_azs:
+            raise ValueError(f"Could not find subnets in at least {min_azs} different Availability Zones. Found only {len(by_az)}.")
+        selected = list(by_az.values())
+        return {"subnet_ids": [sid for sid, _ in selected],
+                "details": [{"SubnetId": sid, **s} for sid, s in selected]}
+
+    def _create_internet_gateway(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        igw_id = _synthetic_id("igw")
+        tags = [{"Key": "Name", "Value": params["name"]}] if params.get("name") else []
+        gateway = {"InternetGatewayId": igw_id, "Attachments": [], "Tags": tags}
+        self._add("aws_internet_gateway", igw_id, gateway)
+        return {"internet_gateway_id": igw_id, "details": dict(gateway)}
+
+    def _attach_internet_gateway(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        igw_id, vpc_id = params.get("internet_gateway_id"), params.get("vpc_id")
+        gateway = self._require("aws_internet_gateway", igw_id, "internet gateway")
+        self._require("aws_vpc", vpc_id, "VPC")
+        if gateway.get("Attachments"):
+            raise ValueError(f"Simulation: internet gateway '{igw_id}' is already attached.")
+        gateway["Attachments"] = [{"VpcId": vpc_id, "State": "available"}]
+        return {"status": "success", "internet_gateway_id": igw_id, "vpc_id": vpc_id}
+
+    def _create_public_subnet(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        vpc_id = params.get("vpc_id")
+        self._require("aws_vpc", vpc_id, "VPC")
+        subnet_id = _synthetic_id("subnet")
+        index = len(self._subnets_in(vpc_id))
+        tags = [{"Key": "Name", "Value": params["name"]}] if params.get("name") else []
+        subnet = {
+            "SubnetId": subnet_id,
+            "VpcId": vpc_id,
+            "CidrBlock": params.get("cidr_block"),
+            "AvailabilityZone": params.get("availability_zone") or f"{self.region}{'abc'[index % 3]}",
+            "State": "available",
+            "MapPublicIpOnLaunch": True,
+            "Tags": tags,
+        }
+        self._add("aws_subnet", subnet_id, subnet)
+        return {"subnet_id": subnet_id, "details": dict(subnet)}
+
+    # --- Security Groups ---
+
+    def _create_security_group(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        group_name, vpc_id = params.get("group_name"), params.get("vpc_id")
+        self._require("aws_vpc", vpc_id, "VPC")
+        for _, group in self._of_type("aws_security_group"):
+            if _field(group, "GroupName") == group_name and _field(group, "VpcId") == vpc_id:
+                raise ValueError(f"Simulation: security group '{group_name}' already exists in VPC '{vpc_id}'.")
+        group_id = _synthetic_id("sg")
+        self._add("aws_security_group", group_id, {
+            "GroupId": group_id, "GroupName": group_name, "VpcId": vpc_id,
+            "Description": params.get("description"), "IpPermissions": [], "IpPermissionsEgress": [],
+        })
+        return {"groupId": group_id, "groupName": group_name}
+
+    def _list_security_groups(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        vpc_id = params.get("vpc_id")
+        groups = [
+            {"group_id": gid, "group_name": _field(g, "GroupName"), "description": _field(g, "Description"),
+             "vpc_id": _field(g, "VpcId")}
+            for gid, g in self._of_type("aws_security_group")
+            if not vpc_id or _field(g, "VpcId") == vpc_id
+        ]
+        return {"security_groups": groups}
+
+    def _delete_security_group(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        group_id = params.get("group_id")
+        self._require("aws_security_group", group_id, "security group")
+        del self.resources[group_id]
+        return {"success": True, "group_id": group_id}
+
+    def _add_security_group_rules(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        group_id = params.get("group_id")
+        self._require("aws_security_group", group_id, "security group")
+        rule_count = len(params.get("rules") or [None])
+        return {
+            "success": True,
+            "response": {
+                "Return": True,
+                "SecurityGroupRules": [
+                    {"SecurityGroupRuleId": _synthetic_id("sgr"), "GroupId": group_id} for _ in range(rule_count)
+                ],
+            },
+        }
+
+    # --- RDS ---
+
+    def _create_db_subnet_group(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        name = params.get("db_subnet_group_name")
+        subnet_ids = params.get("subnet_ids") or []
+        if len(subnet_ids) < 2:
+            raise ValueError("Simulation: a DB subnet group needs subnets in at least two Availability Zones.")
+        if name in self.resources:
+            raise ValueError(f"Simulation: DB subnet group '{name}' already exists.")
+        group = {
+            "DBSubnetGroupName": name,
+            "DBSubnetGroupDescription": params.get("db_subnet_group_description"),
+            "SubnetGroupStatus": "Complete",
+            "Subnets": [{"SubnetIdentifier": sid} for sid in subnet_ids],
+            "DBSubnetGroupArn": f"arn:aws:rds:{self.region}:000000000000:subgrp:{name}",
+        }
+        self._add("aws_rds_db_subnet_group", name, group)
+        return dict(group)
+
+    def _create_db_instance(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        identifier = params.get("db_instance_identifier")
+        if not identifier:
+            raise ValueError("db_instance_identifier is a required argument.")
+        if identifier in self.resources:
+            raise ValueError(f"Simulation: DB instance '{identifier}' already exists.")
+        subnet_group = params.get("db_subnet_group_name")
+        if subnet_group:
+            self._require("aws_rds_db_subnet_group", subnet_group, "DB subnet group")
+        instance = {
+            "DBInstanceIdentifier": identifier,
+            "DBInstanceClass": params.get("db_instance_class"),
+            "Engine": params.get("engine"),
+            "DBInstanceStatus": "creating",
+            "AllocatedStorage": params.get("allocated_storage"),
+            "DBSubnetGroup": {"DBSubnetGroupName": subnet_group} if subnet_group else None,
+            "DBInstanceArn": f"arn:aws:rds:{self.region}:000000000000:db:{identifier}",
+        }
+        self._add("aws_rds_instance", identifier, instance)
+        return dict(instance)
+
+    # --- ELB / S3 ---
+
+    def _create_load_balancer(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        name = params.get("name")
+        for subnet_id in params.get("subnet_ids") or []:
+            self._require("aws_subnet", subnet_id, "subnet")
+        for group_id in params.get("security_group_ids") or []:
+            self._require("aws_security_group", group_id, "security group")
+        suffix = uuid.uuid4().hex[:16]
+        arn = f"arn:aws:elasticloadbalancing:{self.region}:000000000000:loadbalancer/app/{name}/{suffix}"
+        balancer = {
+            "LoadBalancerArn": arn,
+            "LoadBalancerName": name,
+            "DNSName": f"{name}-{suffix[:8]}.{self.region}.elb.amazonaws.com",
+            "Scheme": params.get("scheme", "internet-facing"),
+            "Type": params.get("lb_type", "application"),
+            "State": {"Code": "provisioning"},
+        }
+        self._add("aws_lb", arn, balancer)
+        return dict(balancer)
+
+    def _create_s3_bucket(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        bucket_name = params.get("bucket_name")
+        if not bucket_name:
+            raise ValueError("bucket_name is a required argument.")
+        # Mirror the real tool: random-suffix placeholders are filled in and the name is normalized.
+        bucket_name = re.sub(r"\{.*?\}", uuid.uuid4().hex[:8], bucket_name, count=1).lower().replace("_", "-")
+        if bucket_name in self.resources:
+            raise ValueError(f"Simulation: bucket '{bucket_name}' already exists.")
+        self._add("aws_s3_bucket", bucket_name, {"Name": bucket_name})
+        return {"bucket_name": bucket_name, "details": {"Location": f"/{bucket_name}"}}
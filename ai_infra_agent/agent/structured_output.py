@@ -0,0 +1,160 @@
+import json
+from typing import Dict, Any, List, Optional
+
+from loguru import logger
+
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.runnables import Runnable
+
+from ai_infra_agent.agent.plan_stream import PLAN_STEPS_KEY, chunk_text
+from ai_infra_agent.infrastructure.tool_schemas import ToolSchemaRegistry
+
+# The tool the LLM is forced to call with the plan as its arguments.
+PLAN_TOOL_NAME = "submit_execution_plan"
+
+PLAN_ACTIONS = ["create_infrastructure", "update_infrastructure", "delete_infrastructure", "no_action"]
+
+# Gemini rejects OBJECT schemas without properties, so it returns each step's free-form
+# parameters as a JSON-encoded string, which is decoded when the plan is extracted.
+_STRING_PARAMETER_PROVIDERS = {"gemini"}
+
+
+def plan_schema(tool_names: List[str], parameters_as_string: bool = False) -> Dict[str, Any]:
+    """
+    Builds the JSON schema of a plan, as described by the decision template.
+
+    Args:
+        tool_names (List[str]): The registered tools, the only values 'mcpTool' may take.
+        parameters_as_string (bool): Whether 'toolParameters' is a JSON-encoded string instead of an object.
+
+    Returns:
+        Dict[str, Any]: The schema.
+    """
+    if parameters_as_string:
+        tool_parameters = {"type": "string", "description": "The tool's parameters as a JSON object, encoded as a string."}
+    else:
+        tool_parameters = {"type": "object", "description": "The tool's parameters, as defined by its schema."}
+    step = {
+        "type": "object",
+        "properties": {
+            "id": {"type": "string", "description": "Unique step ID, e.g. 'step-create-vpc'."},
+            "name": {"type": "string", "description": "Human-readable name."},
+            "description": {"type": "string", "description": "What the step does and why."},
+            "action": {"type": "string", "enum": ["create", "query", "update", "delete"]},
+            "resourceId": {"type": "string", "description": "Logical identifier of the resource."},
+            "mcpTool": {"type": "string", "enum": sorted(tool_names), "description": "The exact tool name."},
+            "toolParameters": tool_parameters,
+            "dependsOn": {"type": "array", "items": {"type": "string"}, "description": "IDs of earlier steps."},
+            "riskLevel": {"type": "string", "enum": ["low", "medium", "high"]},
+        },
+        "required": ["id", "name", "mcpTool", "toolParameters", "dependsOn"],
+    }
+    return {
+        "type": "object",
+        "properties": {
+            "action": {"type": "string", "enum": PLAN_ACTIONS},
+            "reasoning": {"type": "string", "description": "The analysis, and which MANAGED resources are reused."},
+            "confidence": {"type": "number", "description": "Confidence in the plan, from 0 to 1."},
+            PLAN_STEPS_KEY: {"type": "array", "items": step},
+        },
+        "required": ["action", "reasoning", "confidence", PLAN_STEPS_KEY],
+    }
+
+
+def decode_step(step: Any) -> Any:
+    """Decodes a step's string-encoded 'toolParameters', if they are. Anything undecodable is left for validation."""
+    if isinstance(step, dict) and isinstance(step.get("toolParameters"), str):
+        try:
+            return {**step, "toolParameters": json.loads(step["toolParameters"] or "{}")}
+        except json.JSONDecodeError:
+            return step
+    return step
+
+
+def decode_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the plan with the 'toolParameters' of every step decoded."""
+    steps = plan.get(PLAN_STEPS_KEY)
+    if not isinstance(steps, list):
+        return plan
+    return {**plan, PLAN_STEPS_KEY: [decode_step(step) for step in steps]}
+
+
+class StructuredPlanOutput:
+    """
+    Makes the LLM return plans through its provider's native tool calling instead of as text.
+
+    The LLM is bound to a single 'submit_execution_plan' tool, whose arguments are the plan,
+    and is forced to call it. The tool's schema is built once from the tool registry, so the
+    provider constrains 'mcpTool' to the registered tools and the plan to the expected shape,
+    and the plan arrives as parsed arguments, with no markdown fence or malformed JSON to
+    recover from.
+    """
+
+    def __init__(self, logger: logger, tool_schemas: ToolSchemaRegistry):
+        """
+        Args:
+            logger: The logger instance.
+            tool_schemas (ToolSchemaRegistry): The schemas of the registered tools.
+        """
+        self.logger = logger
+        tool_names = [schema["name"] for schema in tool_schemas.schemas()]
+        self._tools = {
+            parameters_as_string: {
+                "name": PLAN_TOOL_NAME,
+                "description": "Submits the execution plan for the user's request.",
+                "parameters": plan_schema(tool_names, parameters_as_string),
+            }
+            for parameters_as_string in (False, True)
+        }
+
+    def tool(self, provider: str) -> Dict[str, Any]:
+        """Returns the plan tool, in the variant a provider supports."""
+        return self._tools[provider in _STRING_PARAMETER_PROVIDERS]
+
+    def bind(self, provider: str, llm: BaseLanguageModel) -> Optional[Runnable]:
+        """
+        Binds an LLM to the plan tool and forces it to call the tool.
+
+        Args:
+            provider (str): The LLM provider.
+            llm (BaseLanguageModel): The client.
+
+        Returns:
+            Runnable: The bound LLM, or None if the client does not support tool calling.
+        """
+        tool = self.tool(provider)
+        try:
+            return llm.bind_tools([tool], tool_choice=PLAN_TOOL_NAME)
+        except NotImplementedError:
+            self.logger.warning(f"The {provider} LLM does not support tool calling; plans are parsed from text.")
+            return None
+        except ValueError as e:
+            # Some Bedrock models support tools but cannot be forced to call one; the prompt still asks for the plan.
+            self.logger.info(f"The {provider} LLM cannot be forced to call the plan tool, offering it instead: {e}")
+        try:
+            return llm.bind_tools([tool])
+        except Exception as e:
+            self.logger.warning(f"Could not bind the plan tool to the {provider} LLM; plans are parsed from text: {e}")
+            return None
+
+    @staticmethod
+    def extract(response: Any) -> Optional[Dict[str, Any]]:
+        """
+        Returns the plan from the LLM's call of the plan tool, or None if it did not call it.
+        """
+        for tool_call in getattr(response, "tool_calls", None) or []:
+            if tool_call.get("name") == PLAN_TOOL_NAME and isinstance(tool_call.get("args"), dict):
+                return decode_plan(tool_call["args"])
+        return None
+
+    @staticmethod
+    def chunk_text(chunk: Any) -> str:
+        """
+        Returns the streamed text of a chunk: the partial JSON arguments of the plan tool call,
+        or the message text if the LLM answered without calling the tool.
+        """
+        arguments = "".join(
+            tool_call_chunk.get("args") or ""
+            for tool_call_chunk in getattr(chunk, "tool_call_chunks", None) or []
+        )
+        return arguments or chunk_text(getattr(chunk, "content", chunk))
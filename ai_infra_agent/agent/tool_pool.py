@@ -0,0 +1,137 @@
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Any, Optional, Callable, Awaitable, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# Key used for callers that do not identify a user.
+ANONYMOUS_USER = "anonymous"
+
+
+class ToolPoolRejectedError(RuntimeError):
+    """Raised when a tool call is not admitted because the pool is saturated."""
+
+
+class ToolExecutionPool:
+    """
+    Admission control for tool calls, shared by every user of the process.
+
+    At most 'max_concurrent' tool calls run at once, and a single user holds at most
+    'per_user_limit' of those slots, so one large plan cannot starve everyone else.
+    Calls beyond that wait in a bounded queue; when the queue is full, or a call waits
+    longer than 'queue_timeout', it is rejected with ToolPoolRejectedError instead of
+    piling up. Queue depth, in-flight calls and wait times are tracked for the metrics route.
+    """
+
+    def __init__(self, logger: logger, max_concurrent: int = 32, per_user_limit: int = 4,
+                 max_queue: int = 256, queue_timeout: float = 30.0):
+        """
+        Args:
+            logger: The logger instance.
+            max_concurrent (int): The maximum number of tool calls running at once.
+            per_user_limit (int): The maximum number of tool calls one user runs at once.
+            max_queue (int): The maximum number of tool calls waiting for a slot.
+            queue_timeout (float): How long a call may wait for a slot, in seconds.
+        """
+        self.logger = logger
+        self.max_concurrent = max(1, max_concurrent)
+        self.per_user_limit = max(1, min(per_user_limit, self.max_concurrent))
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout = queue_timeout
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._user_slots: Dict[str, asyncio.Semaphore] = {}
+        self._user_active: Dict[str, int] = {}
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._wait_times: deque = deque(maxlen=1024)
+
+    async def run(self, user_id: Optional[str], call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Runs a tool call once a slot is free for its user.
+
+        Args:
+            user_id (str, optional): The user the call belongs to.
+            call (Callable): Coroutine function performing the tool call.
+
+        Returns:
+            Whatever the call returns.
+
+        Raises:
+            ToolPoolRejectedError: If the queue is full or the call waited longer than the queue timeout.
+        """
+        user_key = user_id or ANONYMOUS_USER
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+        user_slots = self._user_slots.get(user_key)
+        if user_slots is None:
+            user_slots = self._user_slots[user_key] = asyncio.Semaphore(self.per_user_limit)
+
+        if self.waiting >= self.max_queue and (user_slots.locked() or self._slots.locked()):
+            self.rejected += 1
+            raise ToolPoolRejectedError(
+                f"Tool execution queue is full ({self.waiting} calls waiting). Please retry later."
+            )
+
+        enqueued = time.monotonic()
+        self.waiting += 1
+        self._user_active[user_key] = self._user_active.get(user_key, 0) + 1
+        acquired_user = acquired_slot = False
+        try:
+            try:
+                # The user's own quota is taken first, so a user at their limit does not hold a shared slot.
+                await asyncio.wait_for(user_slots.acquire(), timeout=self.queue_timeout)
+                acquired_user = True
+                remaining = max(0.0, self.queue_timeout - (time.monotonic() - enqueued))
+                await asyncio.wait_for(self._slots.acquire(), timeout=remaining)
+                acquired_slot = True
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise ToolPoolRejectedError(
+                    f"Tool call waited more than {self.queue_timeout:.0f}s for an execution slot. Please retry later."
+                ) from None
+            finally:
+                self.waiting -= 1
+
+            self._wait_times.append(time.monotonic() - enqueued)
+            self.running += 1
+            try:
+                return await call()
+            finally:
+                self.running -= 1
+                self.completed += 1
+        finally:
+            if acquired_slot:
+                self._slots.release()
+            if acquired_user:
+                user_slots.release()
+            self._user_active[user_key] -= 1
+            if not self._user_active[user_key]:
+                # Idle users are forgotten so the maps do not grow with every user ever seen.
+                del self._user_active[user_key]
+                del self._user_slots[user_key]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns queue depth, in-flight calls, rejections and wait-time statistics."""
+        waits = sorted(self._wait_times)
+
+        def percentile(fraction: float) -> float:
+            if not waits:
+                return 0.0
+            return round(waits[min(len(waits) - 1, int(fraction * len(waits)))] * 1000, 1)
+
+        return {
+            "max_concurrent": self.max_concurrent,
+            "per_user_limit": self.per_user_limit,
+            "max_queue": self.max_queue,
+            "queue_depth": self.waiting,
+            "running": self.running,
+            "active_users": len(self._user_active),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "max": percentile(1.0)},
+        }
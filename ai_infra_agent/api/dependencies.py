@@ -11,16 +11,27 @@ from ai_infra_agent.state.manager import StateManager
 
 # --- Infrastructure Imports ---
 from ai_infra_agent.infrastructure.tool_factory import ToolFactory
+from ai_infra_agent.infrastructure.tool_cache import ToolResultCache
 
 # --- Agent & Discovery Imports ---
 from ai_infra_agent.agent.agent import StateAwareAgent
+from ai_infra_agent.agent.llm_pool import LLMClientPool
+from ai_infra_agent.agent.llm_limiter import LLMConcurrencyLimiter
+from ai_infra_agent.agent.llm_hedging import LatencyTracker
+from ai_infra_agent.agent.plan_validator import PlanValidator
+from ai_infra_agent.agent.structured_output import StructuredPlanOutput
+from ai_infra_agent.infrastructure.tool_schemas import get_tool_schema_registry
+from ai_infra_agent.agent.prompt_builder import PromptBuilder
+from ai_infra_agent.agent.prompt_archive import PromptArchive
+from ai_infra_agent.agent.plan_cache import PlanCache
+from ai_infra_agent.agent.result_store import ResultStore
+from ai_infra_agent.agent.tool_pool import ToolExecutionPool
 from ai_infra_agent.services.discovery.scanner import DiscoveryScanner
 
 # Supabase client (server-side) utilities
 from ai_infra_agent.core.supabase_client import (
     verify_user_token,
-    get_user_aws_credentials,
-    get_user_google_credentials,
+    get_user_cloud_credentials,
 )
 
 from fastapi import Depends, HTTPException, Header
@@ -40,7 +51,7 @@ def get_state_manager() -> StateManager:
     """Provide a singleton StateManager instance."""
     log = get_logger()
     log.info("Initializing StateManager singleton...")
-    return StateManager(log)
+    return StateManager(log, fallback_max_age=settings.agent.discovery_fallback_max_age_seconds)
 
 
 @lru_cache(maxsize=None)
@@ -51,7 +62,11 @@ def get_tool_factory() -> ToolFactory:
     """
     log = get_logger()
     log.info("Initializing ToolFactory singleton...")
-    factory = ToolFactory(logger=log)
+    result_cache = (
+        ToolResultCache(max_entries=settings.execution.tool_cache_max_entries)
+        if settings.execution.tool_cache_enabled else None
+    )
+    factory = ToolFactory(logger=log, result_cache=result_cache)
     try:
         count = len(factory.get_tool_names())
     except Exception:
@@ -60,6 +75,112 @@ def get_tool_factory() -> ToolFactory:
     return factory
 
 
+@lru_cache(maxsize=None)
+def get_result_store() -> ResultStore:
+    """Provide a singleton ResultStore holding the full step results of recent executions."""
+    execution_settings = settings.execution
+    return ResultStore(
+        max_executions=execution_settings.result_store_max_executions,
+        ttl_seconds=execution_settings.result_store_ttl_seconds,
+        spill_dir=execution_settings.result_store_dir,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_plan_cache() -> Optional[PlanCache]:
+    """Provide a singleton PlanCache, or None when plan caching is disabled."""
+    agent_settings = settings.agent
+    if not agent_settings.plan_cache_enabled:
+        return None
+    return PlanCache(
+        max_entries=agent_settings.plan_cache_max_entries,
+        ttl_seconds=agent_settings.plan_cache_ttl_seconds,
+        similarity_threshold=agent_settings.plan_cache_similarity_threshold,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_llm_pool() -> Optional[LLMClientPool]:
+    """Provide a singleton LLMClientPool, or None when every agent should create its own client."""
+    agent_settings = settings.agent
+    if not agent_settings.llm_pool_enabled:
+        return None
+    return LLMClientPool(
+        logger=get_logger(),
+        max_clients=agent_settings.llm_pool_max_clients,
+        idle_ttl_seconds=agent_settings.llm_pool_idle_ttl_seconds,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_llm_limiter() -> LLMConcurrencyLimiter:
+    """Provide a singleton LLMConcurrencyLimiter that bounds concurrent LLM calls per provider and key."""
+    agent_settings = settings.agent
+    return LLMConcurrencyLimiter(
+        logger=get_logger(),
+        per_provider=agent_settings.llm_max_concurrent_per_provider,
+        per_key=agent_settings.llm_max_concurrent_per_key,
+        queue_timeout=agent_settings.llm_queue_timeout,
+        max_retries=agent_settings.llm_rate_limit_retries,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_llm_latency_tracker() -> LatencyTracker:
+    """Provide a singleton LatencyTracker with the recent latencies of every LLM provider and model."""
+    return LatencyTracker()
+
+
+@lru_cache(maxsize=None)
+def get_plan_validator() -> Optional[PlanValidator]:
+    """Provide a singleton PlanValidator, or None when plans are not validated."""
+    if not settings.agent.plan_validation_enabled:
+        return None
+    return PlanValidator(logger=get_logger(), tool_schemas=get_tool_schema_registry())
+
+
+@lru_cache(maxsize=None)
+def get_structured_plan_output() -> Optional[StructuredPlanOutput]:
+    """Provide a singleton StructuredPlanOutput, or None when plans are parsed from text."""
+    if settings.agent.planning_mode != "structured":
+        return None
+    return StructuredPlanOutput(logger=get_logger(), tool_schemas=get_tool_schema_registry())
+
+
+@lru_cache(maxsize=None)
+def get_prompt_archive() -> Optional[PromptArchive]:
+    """Provide a singleton PromptArchive, or None when prompts are not archived."""
+    agent_settings = settings.agent
+    if not agent_settings.prompt_archive_dir or agent_settings.prompt_archive_sample_rate <= 0:
+        return None
+    return PromptArchive(
+        logger=get_logger(),
+        archive_dir=agent_settings.prompt_archive_dir,
+        sample_rate=agent_settings.prompt_archive_sample_rate,
+        max_age_seconds=agent_settings.prompt_archive_max_age_seconds,
+        max_bytes=agent_settings.prompt_archive_max_bytes,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_prompt_builder() -> PromptBuilder:
+    """Provide a singleton PromptBuilder; its template and tool schemas are prepared once."""
+    return PromptBuilder()
+
+
+@lru_cache(maxsize=None)
+def get_tool_execution_pool() -> ToolExecutionPool:
+    """Provide a singleton ToolExecutionPool that admits tool calls fairly across users."""
+    execution_settings = settings.execution
+    return ToolExecutionPool(
+        logger=get_logger(),
+        max_concurrent=execution_settings.tool_pool_max_concurrent,
+        per_user_limit=execution_settings.tool_pool_per_user,
+        max_queue=execution_settings.tool_pool_max_queue,
+        queue_timeout=execution_settings.tool_pool_queue_timeout,
+    )
+
+
 def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     x_user_id: Optional[str] = Header(None, alias="X-User-Id")
@@ -125,9 +246,8 @@ def get_user_credentials(user: Dict[str, str] = Depends(get_current_user)) -> Di
     """Fetch per-user AWS and Google credentials from Supabase for the authenticated user."""
     user_id = user["user_id"]
     try:
-        aws = get_user_aws_credentials(user_id)
-        google = get_user_google_credentials(user_id)
-        return {"user_id": user_id, "email": user.get("email"), "aws": aws, "google": google}
+        credentials = get_user_cloud_credentials(user_id)
+        return {"user_id": user_id, "email": user.get("email"), "aws": credentials["aws"], "google": credentials["google"]}
     except Exception as e:
         get_logger().error(f"Failed fetching credentials for user {user_id}: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -154,7 +274,8 @@ def get_scanner(user_creds: Dict[str, Any] = Depends(get_user_credentials)) -> D
 def get_agent(user_creds: Dict[str, Any] = Depends(get_user_credentials)) -> StateAwareAgent:
     """
     Create a StateAwareAgent bound to the provided user's credentials.
-    This is not a singleton as it's user-specific.
+    This is not a singleton as it's user-specific, but the agent is cheap to create:
+    its LLM client comes from the shared LLMClientPool and its PromptBuilder is shared.
     """
     log = get_logger()
     log.debug(f"Creating per-request agent for user {user_creds.get('user_id')}")
@@ -167,5 +288,14 @@ def get_agent(user_creds: Dict[str, Any] = Depends(get_user_credentials)) -> Sta
         logger=log,
         scanner=get_scanner(user_creds=user_creds), # Pass user_creds to get_scanner
         user_credentials=user_creds,
+        tool_pool=get_tool_execution_pool(),
+        plan_cache=get_plan_cache(),
+        llm_pool=get_llm_pool(),
+        prompt_builder=get_prompt_builder(),
+        llm_limiter=get_llm_limiter(),
+        prompt_archive=get_prompt_archive(),
+        latency_tracker=get_llm_latency_tracker(),
+        plan_validator=get_plan_validator(),
+        structured_output=get_structured_plan_output(),
     )
     return agent
@@ -1,9 +1,26 @@
-from fastapi import APIRouter, Body, Depends, HTTPException
-from typing import Any, Dict, List
+import json
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from typing import Any, AsyncIterator, Dict, List
 from datetime import datetime
 
 from ai_infra_agent.agent.agent import StateAwareAgent
-from ai_infra_agent.api.dependencies import get_agent, get_logger, get_user_credentials, get_scanner
+from ai_infra_agent.agent.result_store import ResultStore
+from ai_infra_agent.agent.tool_pool import ToolExecutionPool
+from ai_infra_agent.agent.llm_limiter import LLMConcurrencyLimiter
+from ai_infra_agent.agent.llm_hedging import LatencyTracker
+from ai_infra_agent.api.dependencies import (
+    get_agent,
+    get_current_user,
+    get_llm_latency_tracker,
+    get_llm_limiter,
+    get_logger,
+    get_result_store,
+    get_scanner,
+    get_tool_execution_pool,
+    get_user_credentials,
+)
+from ai_infra_agent.infrastructure.tool_schemas import ToolSchemaRegistry, get_tool_schema_registry
 from ai_infra_agent.services.discovery.scanner import DiscoveryScanner
 from ai_infra_agent.core.supabase_client import get_supabase_client
 
@@ -64,6 +81,43 @@ async def process_request(
         )
 
 
+@router.post(
+    "/process/stream",
+    summary="Process a user request and stream the execution plan as it is generated",
+    response_description="Server-sent events: one 'step' event per plan step, then a 'plan' or 'error' event.",
+)
+async def stream_process_request(
+    request_body: Dict[str, Any] = Body(
+        ...,
+        example={"request": "create a t3.micro ec2 instance"},
+    ),
+    user_creds: dict = Depends(get_user_credentials),
+):
+    """
+    Like /process, but streams each step of the plan as soon as the LLM has generated it,
+    so clients can show the plan before the LLM has finished. The last event carries the
+    complete plan, identical to the response of /process.
+    """
+    user_request = request_body.get("request")
+    if not user_request:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "Field 'request' is required in the request body."},
+        )
+    agent = get_agent(user_creds)
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event in agent.stream_request(user_request):
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            get_logger().error(f"Failed to stream request: {e}", exc_info=True)
+            error = {"type": "error", "error": {"error": f"An unexpected error occurred: {str(e)}"}}
+            yield f"event: error\ndata: {json.dumps(error)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
 @router.post(
     "/discover",
     summary="Trigger discovery of existing AWS resources",
@@ -154,3 +208,94 @@ async def get_resources(
     except Exception as e:
         logger.error(f"Failed to fetch resources for user {user_id}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to retrieve infrastructure data.")
+
+
+@router.get(
+    "/executions/{execution_id}/steps/{step_id}/result",
+    summary="Get the full result of an executed plan step",
+    response_description="The raw result returned by the step's tool.",
+)
+async def get_step_result(
+    execution_id: str,
+    step_id: str,
+    user: Dict[str, str] = Depends(get_current_user),
+    result_store: ResultStore = Depends(get_result_store),
+):
+    """
+    Returns the full result of a step from a recent plan execution. Clients using the
+    compact WebSocket progress protocol only receive projected results and fetch the
+    complete ones from here when needed.
+    """
+    serialized = result_store.get(execution_id, step_id, user_id=user.get("user_id"))
+    if serialized is None:
+        raise HTTPException(status_code=404, detail="Step result not found or expired.")
+    # The result is stored pre-serialized, so it is returned as-is without re-encoding.
+    return Response(content=serialized, media_type="application/json")
+
+
+@router.get(
+    "/tool-pool/metrics",
+    summary="Get the tool execution pool metrics",
+    response_description="Queue depth, in-flight calls, rejections and wait times of the tool execution pool.",
+)
+async def get_tool_pool_metrics(
+    user: Dict[str, str] = Depends(get_current_user),
+    tool_pool: ToolExecutionPool = Depends(get_tool_execution_pool),
+):
+    """
+    Returns how loaded the shared tool execution pool is: how many tool calls are running
+    and waiting, how many were rejected, and how long admitted calls waited for a slot.
+    """
+    return tool_pool.metrics()
+
+
+@router.get(
+    "/llm/metrics",
+    summary="Get the LLM concurrency limiter metrics",
+    response_description="Queue depth, in-flight calls, throttling, wait times and latencies of LLM calls.",
+)
+async def get_llm_metrics(
+    user: Dict[str, str] = Depends(get_current_user),
+    llm_limiter: LLMConcurrencyLimiter = Depends(get_llm_limiter),
+    latency_tracker: LatencyTracker = Depends(get_llm_latency_tracker),
+):
+    """
+    Returns how many LLM calls are running and waiting for a slot, how often providers
+    throttled them, how long calls waited for a slot, and the latency percentiles and
+    histogram of every provider and model.
+    """
+    return {**llm_limiter.metrics(), "latency": latency_tracker.snapshot()}
+
+
+@router.get(
+    "/tools",
+    summary="List the available tools and their parameter schemas",
+    response_description="The name, description and JSON schema of the parameters of every tool.",
+)
+async def list_tools(
+    user: Dict[str, str] = Depends(get_current_user),
+    tool_schemas: ToolSchemaRegistry = Depends(get_tool_schema_registry),
+):
+    """
+    Returns the typed schemas of all tools the agent can put in a plan, the same
+    schemas that are given to the LLM.
+    """
+    # The schemas are serialized once per process, so they are returned without re-encoding.
+    return Response(content=tool_schemas.serialized(), media_type="application/json")
+
+
+@router.get(
+    "/tools/{tool_name}",
+    summary="Get the parameter schema of a tool",
+    response_description="The name, description and JSON schema of the parameters of the tool.",
+)
+async def get_tool_schema(
+    tool_name: str,
+    user: Dict[str, str] = Depends(get_current_user),
+    tool_schemas: ToolSchemaRegistry = Depends(get_tool_schema_registry),
+):
+    """Returns the typed schema of a single tool."""
+    schema = tool_schemas.get(tool_name)
+    if schema is None:
+        raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found.")
+    return schema
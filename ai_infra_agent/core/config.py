@@ -1,7 +1,7 @@
 # ai_infra_agent/core/config.py
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 import yaml
 from pydantic import BaseModel, Field, SecretStr
@@ -30,6 +30,14 @@ class AWSSettings(BaseSettings):
     secret_access_key: Optional[SecretStr] = Field(None, description="AWS Secret Access Key")
     max_retries: int = Field(5, description="Maximum number of retries for AWS API calls")
     timeout: int = Field(60, description="Timeout in seconds for AWS API calls")
+    client_pool_max_size: int = Field(128, description="Maximum number of boto3 clients kept warm in the client pool")
+    client_pool_ttl_seconds: int = Field(900, description="Seconds a pooled boto3 client is reused before it is recreated")
+    max_pool_connections: int = Field(10, description="Maximum number of keep-alive HTTP connections per boto3 client")
+    prewarm_services: List[str] = Field(["ec2", "rds", "elbv2", "s3"], description="AWS services whose models are loaded at startup")
+    max_concurrent_calls: int = Field(64, description="Threads available to blocking AWS calls")
+    use_aiobotocore: bool = Field(True, description="Run AWS calls natively on the event loop when aiobotocore is installed")
+    ami_catalog_path: Optional[str] = Field("states/ami-catalog.json", description="File the AMI catalog is persisted to (None keeps it in memory)")
+    ami_catalog_refresh_seconds: int = Field(21600, description="Age after which an AMI catalog entry is refreshed in the background")
 
 class AgentSettings(BaseModel):
     """Configuration for the AI agent"""
@@ -38,6 +46,36 @@ class AgentSettings(BaseModel):
     template_path: str = Field("settings/templates/decision-plan-prompt-optimized.txt", description="Path to the prompt template file")
     max_tokens: int = Field(10000, description="Maximum number of tokens for LLM response")
     temperature: float = Field(0.1, description="Temperature for LLM response generation")
+    dry_run: bool = Field(False, description="Simulate plan executions against the discovered state instead of AWS")
+    dry_run_permission_checks: bool = Field(True, description="Run AWS DryRun permission checks for EC2 steps during simulation")
+    prompt_cache_enabled: bool = Field(True, description="Send provider prompt-caching hints for the static prompt prefix")
+    plan_cache_enabled: bool = Field(True, description="Reuse generated plans for repeated requests against unchanged state")
+    plan_cache_max_entries: int = Field(512, description="Maximum number of cached plans")
+    plan_cache_ttl_seconds: int = Field(3600, description="How long a generated plan is reused")
+    plan_cache_similarity_threshold: Optional[float] = Field(None, description="Minimum similarity (0-1) for near-duplicate requests to share a plan; None disables near-duplicate matching")
+    llm_pool_enabled: bool = Field(True, description="Share LLM clients, and their warm connections, across agents using the same key")
+    llm_pool_max_clients: int = Field(64, description="Maximum number of pooled LLM clients")
+    llm_pool_idle_ttl_seconds: int = Field(900, description="How long an unused pooled LLM client is kept")
+    llm_max_concurrent_per_provider: int = Field(64, description="Maximum number of LLM calls to one provider running at once")
+    llm_max_concurrent_per_key: int = Field(16, description="Maximum number of LLM calls with one API key running at once")
+    llm_queue_timeout: float = Field(60.0, description="Seconds an LLM call may wait for a slot before it is rejected")
+    llm_rate_limit_retries: int = Field(4, description="How often an LLM call throttled by the provider is retried with backoff")
+    prompt_archive_dir: Optional[str] = Field("states/prompts", description="Directory sampled LLM prompts are archived to (None disables the archive)")
+    prompt_archive_sample_rate: float = Field(0.05, description="Fraction (0-1) of LLM prompts that are archived")
+    prompt_archive_max_age_seconds: Optional[int] = Field(604800, description="How long archived prompts are kept (None keeps them regardless of age)")
+    prompt_archive_max_bytes: Optional[int] = Field(268435456, description="Maximum total size of the archived prompts; the oldest are deleted first (None does not limit it)")
+    discovery_deadline_seconds: Optional[float] = Field(8.0, description="Seconds to wait for discovery before planning against the last discovered state; None always waits")
+    discovery_fallback_max_age_seconds: float = Field(900, description="Maximum age of the last discovered state used when discovery misses its deadline")
+    llm_deadline_seconds: Optional[float] = Field(120.0, description="Seconds the LLM may take to return a plan; None waits indefinitely")
+    hedge_provider: Optional[str] = Field(None, description="Provider slow plan generations are hedged with; None uses the primary provider")
+    hedge_model: Optional[str] = Field(None, description="Model slow plan generations are hedged with; hedging is off unless provider or model differs from the primary")
+    hedge_percentile: float = Field(0.95, description="Percentile of the primary LLM's recent latency after which a hedge request is sent")
+    hedge_min_samples: int = Field(20, description="Latency samples needed before the percentile is used")
+    hedge_initial_delay_seconds: float = Field(15.0, description="Hedge delay used until enough latency samples are known")
+    hedge_min_delay_seconds: float = Field(2.0, description="Shortest hedge delay, so fast requests are never duplicated")
+    plan_validation_enabled: bool = Field(True, description="Validate plans against the tool schemas before returning or executing them")
+    plan_repair_attempts: int = Field(1, description="How often the LLM is asked to fix the invalid steps of a plan")
+    planning_mode: str = Field("structured", description="'structured' makes the LLM return plans through a forced tool call whose schema is built from the tool registry; 'text' parses JSON from the response")
     # Add other agent settings if needed
 
 class LoggingSettings(BaseModel):
@@ -50,6 +88,21 @@ class StateSettings(BaseModel):
     """State management configuration"""
     file_path: str = Field("states/infrastructure-state.json", description="Path to the state file")
     
+class ExecutionSettings(BaseModel):
+    """Plan execution configuration"""
+    result_store_dir: Optional[str] = Field(None, description="Directory full step results are spilled to, owner-readable only. The default, None, keeps them in the memory of each worker, bounded by result_store_max_executions executions and result_store_ttl_seconds")
+    result_store_max_executions: int = Field(256, description="Maximum number of executions whose step results are kept")
+    result_store_ttl_seconds: int = Field(3600, description="How long step results are kept after an execution's last update")
+    rollback_on_failure: bool = Field(True, description="Undo the completed steps of a plan when a step fails")
+    rollback_max_attempts: int = Field(6, description="Attempts per rollback deletion while AWS releases dependencies")
+    rollback_retry_delay: float = Field(5.0, description="Initial delay in seconds between rollback attempts, doubled each time")
+    tool_pool_max_concurrent: int = Field(32, description="Maximum number of tool calls running at once across all users")
+    tool_pool_per_user: int = Field(4, description="Maximum number of tool calls one user runs at once")
+    tool_pool_max_queue: int = Field(256, description="Maximum number of tool calls waiting for a slot before new ones are rejected")
+    tool_pool_queue_timeout: float = Field(30.0, description="Seconds a tool call may wait for a slot before it is rejected")
+    tool_cache_enabled: bool = Field(True, description="Cache the results of read-only tools such as AMI and subnet lookups")
+    tool_cache_max_entries: int = Field(1024, description="Maximum number of cached read-only tool results")
+
 class WebSettings(BaseModel):
     """Web server configuration"""
     port: int = Field(8080, description="Web server port")
@@ -62,6 +115,7 @@ class Settings(BaseModel):
     agent: AgentSettings = Field(default_factory=AgentSettings)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     state: StateSettings = Field(default_factory=StateSettings)
+    execution: ExecutionSettings = Field(default_factory=ExecutionSettings)
     web: WebSettings = Field(default_factory=WebSettings)
 
 # --- Step 3: Create a single, explicit function to build the settings object ---
@@ -118,6 +172,7 @@ def load_app_settings() -> Settings:
         agent=AgentSettings.model_validate(final_config_data.get("agent", {})),
         logging=LoggingSettings.model_validate(final_config_data.get("logging", {})),
         state=StateSettings.model_validate(final_config_data.get("state", {})),
+        execution=ExecutionSettings.model_validate(final_config_data.get("execution", {})),
         web=WebSettings.model_validate(final_config_data.get("web", {})),
     )
 
@@ -82,24 +82,9 @@ def get_user_aws_credentials(user_id: str) -> Dict[str, str]:
             row = cur.fetchone()
             if not row:
                 raise ValueError("AWS credentials not found for this user in the database.")
-
-            access_key = row.get("aws_access_key")
-            secret_key = row.get("aws_secret_key")
-            region = row.get("aws_region")
-
-            if not all([access_key, secret_key, region]):
-                missing = []
-                if not access_key: missing.append("AWS Access Key")
-                if not secret_key: missing.append("AWS Secret Key")
-                if not region: missing.append("AWS Region")
-                raise ValueError(f"Missing required AWS credentials in user profile: {', '.join(missing)}. Please update your settings.")
-
+            aws = _aws_credentials_from_row(row)
             logger.info(f"Successfully fetched AWS credentials for user {user_id}")
-            return {
-                "access_key_id": access_key,
-                "secret_access_key": secret_key,
-                "region": region,
-            }
+            return aws
     except ValueError:
         raise  # Re-raise ValueError to be caught by the caller
     except Exception as e:
@@ -124,15 +109,68 @@ def get_user_google_credentials(user_id: str) -> Dict[str, str]:
                 (user_id,)
             )
             row = cur.fetchone()
-            if not row or not row.get("google_api_key"):
-                raise ValueError("Google API Key not found in user profile. Please update your settings.")
-
+            google = _google_credentials_from_row(row)
             logger.info(f"Successfully fetched Google API key for user {user_id}")
-            return {"api_key": row.get("google_api_key")}
+            return google
     except ValueError:
         raise # Re-raise ValueError to be caught by the caller
     except Exception as e:
         logger.error(f"Failed to fetch Google credentials for user {user_id}: {e}", exc_info=True)
         raise RuntimeError("A database error occurred while fetching Google credentials.")
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
+
+
+def get_user_cloud_credentials(user_id: str) -> Dict[str, Dict[str, str]]:
+    """
+    Fetches a user's AWS credentials and Google API key with a single query, on one connection.
+    Raises ValueError if any of them is missing, like get_user_aws_credentials and get_user_google_credentials.
+    """
+    logger.info(f"Fetching AWS and Google credentials for user_id: {user_id} via direct DB connection.")
+    conn = _get_db_connection()
+    try:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            cur.execute(
+                "SELECT aws_access_key, aws_secret_key, aws_region, google_api_key FROM users WHERE id = %s",
+                (user_id,)
+            )
+            row = cur.fetchone()
+            if not row:
+                raise ValueError("AWS credentials not found for this user in the database.")
+            credentials = {"aws": _aws_credentials_from_row(row), "google": _google_credentials_from_row(row)}
+            logger.info(f"Successfully fetched AWS and Google credentials for user {user_id}")
+            return credentials
+    except ValueError:
+        raise  # Re-raise ValueError to be caught by the caller
+    except Exception as e:
+        logger.error(f"Failed to fetch credentials for user {user_id}: {e}", exc_info=True)
+        raise RuntimeError("A database error occurred while fetching credentials.")
+    finally:
+        conn.close()
+
+
+def _aws_credentials_from_row(row: Dict[str, str]) -> Dict[str, str]:
+    """Extracts the AWS credentials of a users row. Raises ValueError if any is missing."""
+    access_key = row.get("aws_access_key")
+    secret_key = row.get("aws_secret_key")
+    region = row.get("aws_region")
+
+    if not all([access_key, secret_key, region]):
+        missing = []
+        if not access_key: missing.append("AWS Access Key")
+        if not secret_key: missing.append("AWS Secret Key")
+        if not region: missing.append("AWS Region")
+        raise ValueError(f"Missing required AWS credentials in user profile: {', '.join(missing)}. Please update your settings.")
+
+    return {
+        "access_key_id": access_key,
+        "secret_access_key": secret_key,
+        "region": region,
+    }
+
+
+def _google_credentials_from_row(row: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Extracts the Google API key of a users row. Raises ValueError if it is missing."""
+    if not row or not row.get("google_api_key"):
+        raise ValueError("Google API Key not found in user profile. Please update your settings.")
+    return {"api_key": row.get("google_api_key")}
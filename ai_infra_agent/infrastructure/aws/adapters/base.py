@@ -1,7 +1,25 @@
-import boto3
-from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import ClientError
 from loguru import logger
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional
+
+from ai_infra_agent.infrastructure.aws.aio import run_blocking
+from ai_infra_agent.infrastructure.aws.client_pool import get_client_pool
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
+
+# Errors caused by one of the IDs in a bulk request (an unknown ID, or a resource in the wrong
+# state), after which the other IDs may still succeed on their own. Any other error, such as
+# throttling or missing permissions, would only be repeated for every ID.
+ID_SPECIFIC_ERRORS = (
+    "InvalidInstanceID",
+    "InvalidID",
+    ".NotFound",
+    ".Malformed",
+    "IncorrectInstanceState",
+    "IncorrectState",
+    "OperationNotPermitted",
+    "UnsupportedOperation",
+)
 
 class AWSAdapterBase:
     """
@@ -13,7 +31,8 @@ class AWSAdapterBase:
     def __init__(self,
                  service_name: str,
                  logger: logger,
-                 aws_config: Dict[str, Any]):
+                 aws_config: Dict[str, Any],
+                 connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the AWS adapter.
 
@@ -22,9 +41,12 @@ class AWSAdapterBase:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): A dictionary containing user-specific AWS credentials.
                                          Must include 'access_key_id', 'secret_access_key', and 'region'.
+            connection (AWSConnectionContext, optional): The user's connection context. Adapters sharing a
+                                                         context share one client per service.
         """
         self.service_name = service_name
         self.logger = logger
+        self.connection = connection
         if not aws_config:
             raise ValueError("aws_config is required to initialize an AWS adapter.")
         self.aws_config = aws_config
@@ -44,30 +66,105 @@ class AWSAdapterBase:
                 "Incomplete AWS configuration. 'access_key_id', 'secret_access_key', and 'region' are all required."
             )
 
-        self.logger.info(f"Creating boto3 client for service '{self.service_name}' in region '{region}' using user-provided credentials.")
-
         try:
-            # Configure retries for robustness
-            config = Config(
-                retries={
-                    "max_attempts": self.aws_config.get("max_retries", 3),
-                    "mode": "standard",
-                }
-            )
+            # Clients are shared across adapters so repeated tool calls reuse the loaded
+            # service model and the client's keep-alive connections.
+            if self.connection is not None:
+                return self.connection.client(self.service_name)
+            return get_client_pool().get_client(self.service_name, self.aws_config)
 
-            client = boto3.client(
-                self.service_name,
-                region_name=region,
-                aws_access_key_id=access_key_id,
-                aws_secret_access_key=secret_access_key,
-                config=config,
-            )
-            
-            self.logger.info(f"Successfully created boto3 client for '{self.service_name}'.")
-            return client
-            
         except Exception as e:
             self.logger.error(
                 f"Failed to create boto3 client for service '{self.service_name}' with provided credentials: {e}"
             )
-            raise
\ No newline at end of file
+            raise
+
+    async def acall(self, operation_name: str, **params) -> Dict[str, Any]:
+        """
+        Calls an AWS operation of this adapter's service without blocking the event loop.
+
+        With a connection context that supports native async clients (aiobotocore), the call
+        runs on the event loop; otherwise the blocking client call runs on the AWS thread pool.
+
+        Args:
+            operation_name (str): The snake_case name of the operation (e.g., 'describe_vpcs').
+            **params: The operation's parameters.
+
+        Returns:
+            Dict[str, Any]: The operation's response.
+        """
+        if self.connection is not None and self.connection.supports_async:
+            return await self.connection.acall(self.service_name, operation_name, **params)
+        return await run_blocking(getattr(self.client, operation_name), **params)
+
+    def run_in_chunks(self, ids: List[str], call: Callable[[List[str]], Any], chunk_size: int = 100,
+                      max_parallel: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Runs a bulk operation over many IDs, in chunks that stay within AWS request limits,
+        with several chunks in flight at once.
+
+        If a whole chunk is rejected because of one of its IDs (e.g. an ID that does not exist),
+        its IDs are retried one at a time, so a single bad ID does not fail the others. Any other
+        error (throttling, permissions, credentials) is raised instead of being retried per ID.
+
+        Args:
+            ids (List[str]): The IDs to operate on. Duplicates are ignored.
+            call (Callable): Performs the operation on one chunk of IDs and returns the response.
+            chunk_size (int): The maximum number of IDs per request.
+            max_parallel (int): The maximum number of requests in flight.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each ID, {"response": ...} of the request that covered it,
+                                       or {"error": ...} if it failed.
+
+        Raises:
+            Exception: The first error of a chunk that is not specific to its IDs.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        chunk_size = max(1, chunk_size)
+        chunks = [unique_ids[i:i + chunk_size] for i in range(0, len(unique_ids), chunk_size)]
+
+        def run_chunk(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            try:
+                response = call(chunk)
+                return {resource_id: {"response": response} for resource_id in chunk}
+            except Exception as e:
+                if not any(code in str(e) for code in ID_SPECIFIC_ERRORS):
+                    raise
+                if len(chunk) == 1:
+                    return {chunk[0]: {"error": str(e)}}
+                self.logger.warning(f"Chunk of {len(chunk)} IDs failed, retrying them one at a time: {e}")
+                results = {}
+                for resource_id in chunk:
+                    results.update(run_chunk([resource_id]))
+                return results
+
+        results: Dict[str, Dict[str, Any]] = {}
+        if not chunks:
+            return results
+        # A local pool: the caller may itself be running on the shared AWS thread pool.
+        with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(chunks))), thread_name_prefix="aws-bulk") as pool:
+            for chunk_results in pool.map(run_chunk, chunks):
+                results.update(chunk_results)
+        return results
+
+    def check_permission(self, operation_name: str, **params) -> Dict[str, Any]:
+        """
+        Checks whether the user may perform an operation, without performing it,
+        by calling it with DryRun=True. Only operations that accept DryRun (mostly EC2) are supported.
+
+        Args:
+            operation_name (str): The client method to check (e.g., 'run_instances').
+            **params: The API parameters the real call would use.
+
+        Returns:
+            Dict[str, Any]: {"allowed": bool, "code": str, "message": str}.
+        """
+        try:
+            getattr(self.client, operation_name)(DryRun=True, **params)
+        except ClientError as e:
+            error = e.response.get("Error", {})
+            code = error.get("Code", "")
+            # AWS reports a successful dry run as a 'DryRunOperation' error.
+            return {"allowed": code == "DryRunOperation", "code": code, "message": error.get("Message", str(e))}
+        return {"allowed": True, "code": "DryRunOperation", "message": ""}
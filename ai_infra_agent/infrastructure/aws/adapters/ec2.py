@@ -1,7 +1,16 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
 from ai_infra_agent.infrastructure.aws.adapters.base import AWSAdapterBase
+from ai_infra_agent.infrastructure.aws.ami_catalog import get_ami_catalog
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
+
+
+def _spread(total: int, buckets: int) -> List[int]:
+    """Splits total into buckets shares that differ by at most one, larger shares first."""
+    return [total // buckets + (1 if i < total % buckets else 0) for i in range(buckets)]
 
 
 class EC2Adapter(AWSAdapterBase):
@@ -9,15 +18,16 @@ class EC2Adapter(AWSAdapterBase):
     Adapter for interacting with the AWS EC2 service.
     """
 
-    def __init__(self, logger: logger, aws_config: Dict[str, Any]):
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the EC2 adapter.
 
         Args:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): User-specific AWS credentials.
+            connection (AWSConnectionContext, optional): The user's shared connection context.
         """
-        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config)
+        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config, connection=connection)
 
     def list_instances(self, instance_ids: List[str] = None) -> Dict[str, Any]:
         """
@@ -39,6 +49,14 @@ class EC2Adapter(AWSAdapterBase):
             self.logger.error(f"Error listing EC2 instances: {e}")
             raise
 
+    async def alist_instances(self, instance_ids: List[str] = None) -> Dict[str, Any]:
+        """
+        Lists EC2 instances without blocking the event loop. See list_instances.
+        """
+        self.logger.info(f"Listing EC2 instances with IDs: {instance_ids}")
+        params = {"InstanceIds": instance_ids} if instance_ids else {}
+        return await self.acall("describe_instances", **params)
+
     def create_instance(
         self,
         image_id: str,
@@ -94,6 +112,134 @@ class EC2Adapter(AWSAdapterBase):
             self.logger.error(f"Error creating EC2 instance: {e}")
             raise
 
+    def launch_fleet(
+        self,
+        image_id: str,
+        instance_type: str,
+        count: int,
+        min_count: Optional[int] = None,
+        key_name: Optional[str] = None,
+        subnet_ids: Optional[List[str]] = None,
+        vpc_id: Optional[str] = None,
+        security_group_ids: Optional[List[str]] = None,
+        tags: Optional[List[Dict[str, str]]] = None,
+        max_parallel: int = 4,
+    ) -> Dict[str, Any]:
+        """
+        Launches a fleet of identical instances spread evenly across Availability Zones.
+
+        One subnet is picked per AZ (from subnet_ids, the subnets of vpc_id, or the default
+        subnets), and each gets a single run_instances call for its share of the fleet, with
+        MinCount=1 so a capacity shortage in one AZ does not fail the others. Instances an AZ
+        could not provide are requested once more from the AZs that delivered in full. If the
+        fleet still has fewer than min_count instances, the launched ones are terminated again,
+        like run_instances does for MinCount.
+
+        Args:
+            image_id (str): The ID of the AMI.
+            instance_type (str): The instance type (e.g., 't3.micro').
+            count (int): The number of instances to launch.
+            min_count (int, optional): The fewest instances that make the launch a success. Defaults to count.
+            key_name (str, optional): The name of the key pair.
+            subnet_ids (List[str], optional): The subnets to spread the fleet across.
+            vpc_id (str, optional): Spread across the subnets of this VPC, if subnet_ids is not given.
+            security_group_ids (List[str], optional): A list of security group IDs.
+            tags (List[Dict[str, str]], optional): Tags applied to the instances and volumes at launch.
+            max_parallel (int): The maximum number of run_instances calls in flight.
+
+        Returns:
+            Dict[str, Any]: 'Instances' (all launched instances), 'InstanceIds', and the 'placement'
+                            of the fleet per subnet.
+        """
+        if count < 1:
+            raise ValueError("count must be at least 1.")
+        min_count = count if min_count is None else max(1, min(min_count, count))
+        subnets = self._fleet_subnets(subnet_ids, vpc_id)
+        if not subnets:
+            raise ValueError("No subnets found to launch the fleet into.")
+        self.logger.info(
+            f"Launching a fleet of {count} '{instance_type}' instances across {len(subnets)} Availability Zones"
+        )
+
+        base_params = {"ImageId": image_id, "InstanceType": instance_type}
+        if key_name:
+            base_params["KeyName"] = key_name
+        if security_group_ids:
+            base_params["SecurityGroupIds"] = security_group_ids
+        if tags:
+            base_params["TagSpecifications"] = [
+                {"ResourceType": "instance", "Tags": tags},
+                {"ResourceType": "volume", "Tags": tags},
+            ]
+
+        def launch(subnet: Dict[str, Any], share: int) -> Dict[str, Any]:
+            try:
+                response = self.client.run_instances(
+                    **base_params, SubnetId=subnet["SubnetId"], MinCount=1, MaxCount=share,
+                    # Makes the call idempotent, so a retried request cannot launch the share twice.
+                    ClientToken=uuid.uuid4().hex,
+                )
+                return {"instances": response.get("Instances", [])}
+            except Exception as e:
+                self.logger.warning(f"Fleet launch of {share} instances in subnet '{subnet['SubnetId']}' failed: {e}")
+                return {"instances": [], "error": str(e)}
+
+        placement = [
+            {"subnet_id": s["SubnetId"], "availability_zone": s["AvailabilityZone"], "requested": share, "launched": 0}
+            for s, share in zip(subnets, _spread(count, len(subnets)))
+        ]
+        instances: List[Dict[str, Any]] = []
+        errors: List[str] = []
+        requests = [(i, entry["requested"]) for i, entry in enumerate(placement) if entry["requested"]]
+        for attempt in range(2):
+            with ThreadPoolExecutor(max_workers=max(1, min(max_parallel, len(requests))), thread_name_prefix="aws-fleet") as pool:
+                outcomes = list(pool.map(lambda request: launch(subnets[request[0]], request[1]), requests))
+            delivered_in_full = []
+            for (index, share), outcome in zip(requests, outcomes):
+                instances.extend(outcome["instances"])
+                placement[index]["launched"] += len(outcome["instances"])
+                if outcome.get("error"):
+                    errors.append(outcome["error"])
+                if len(outcome["instances"]) == share:
+                    delivered_in_full.append(index)
+            shortfall = count - len(instances)
+            if not shortfall or not delivered_in_full or attempt:
+                break
+            # Ask the AZs that had capacity for the instances the others could not provide.
+            self.logger.info(f"Fleet is {shortfall} instances short, requesting them from {len(delivered_in_full)} other AZs")
+            requests = [
+                (index, share) for index, share in zip(delivered_in_full, _spread(shortfall, len(delivered_in_full))) if share
+            ]
+            for index, share in requests:
+                placement[index]["requested"] += share
+
+        instance_ids = [i["InstanceId"] for i in instances]
+        if len(instances) < min_count:
+            if instance_ids:
+                self.logger.warning(f"Fleet reached {len(instances)} of at least {min_count} instances, terminating them")
+                self.client.terminate_instances(InstanceIds=instance_ids)
+            raise ValueError(
+                f"Launched only {len(instances)} of at least {min_count} instances: {'; '.join(errors) or 'no capacity'}"
+            )
+        return {"Instances": instances, "InstanceIds": instance_ids, "placement": placement}
+
+    def _fleet_subnets(self, subnet_ids: Optional[List[str]], vpc_id: Optional[str]) -> List[Dict[str, Any]]:
+        """Picks one available subnet per Availability Zone, preferring the one with the most free IPs."""
+        if subnet_ids:
+            response = self.client.describe_subnets(SubnetIds=subnet_ids)
+        elif vpc_id:
+            response = self.client.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])
+        else:
+            response = self.client.describe_subnets(Filters=[{"Name": "default-for-az", "Values": ["true"]}])
+        per_az: Dict[str, Dict[str, Any]] = {}
+        for subnet in response.get("Subnets", []):
+            if subnet.get("State", "available") != "available":
+                continue
+            best = per_az.get(subnet["AvailabilityZone"])
+            if best is None or subnet.get("AvailableIpAddressCount", 0) > best.get("AvailableIpAddressCount", 0):
+                per_az[subnet["AvailabilityZone"]] = subnet
+        return [per_az[az] for az in sorted(per_az)]
+
 
     def terminate_instance(self, instance_ids: List[str]) -> Dict[str, Any]:
         """
@@ -112,65 +258,50 @@ class EC2Adapter(AWSAdapterBase):
             self.logger.error(f"Error terminating EC2 instances '{instance_ids}': {e}")
             raise
 
-    def get_latest_ami(self, owner: str, name_pattern: str) -> Dict[str, Any]:
+    def get_latest_ami(self, owner: str, name_pattern: str, architecture: str = "x86_64") -> Dict[str, Any]:
         """
         Gets the latest AMI based on owner and name pattern.
 
         Args:
             owner (str): The owner of the AMI (e.g., 'amazon').
             name_pattern (str): The pattern to match the AMI name (e.g., 'al2023-ami-*-x86_64').
+            architecture (str): The AMI architecture. Defaults to 'x86_64'.
 
         Returns:
             Dict[str, Any]: The dictionary of the latest image found.
         """
         self.logger.info(f"Searching for latest AMI with owner '{owner}' and pattern: {name_pattern}")
         try:
-            response = self.client.describe_images(
-                Owners=[owner],
-                Filters=[
-                    {"Name": "name", "Values": [name_pattern]},
-                    {"Name": "state", "Values": ["available"]},
-                    {"Name": "architecture", "Values": ["x86_64"]}
-                ],
-            )
-            images = sorted(response["Images"], key=lambda x: x["CreationDate"], reverse=True)
-            if not images:
-                raise ValueError(f"No matching AMI found for owner '{owner}' and pattern '{name_pattern}'")
-            return images[0]
+            # Answered from the regional AMI catalog; AWS is only called for unknown or stale entries.
+            return get_ami_catalog().latest(self.client, self.aws_config.get("region"), owner, name_pattern, architecture)
         except Exception as e:
             self.logger.error(f"Error getting latest AMI: {e}")
             raise
 
+    def get_latest_family_ami(self, family: str) -> Dict[str, Any]:
+        """
+        Gets the latest AMI of an OS family registered in the AMI catalog (e.g., 'ubuntu-24.04').
+
+        Args:
+            family (str): The name of the OS family.
+
+        Returns:
+            Dict[str, Any]: The dictionary of the latest image found.
+        """
+        self.logger.info(f"Searching for latest AMI of family '{family}'")
+        try:
+            return get_ami_catalog().latest_for_family(self.client, self.aws_config.get("region"), family)
+        except Exception as e:
+            self.logger.error(f"Error getting latest AMI of family '{family}': {e}")
+            raise
+
     def get_latest_ubuntu_ami(self) -> Dict[str, Any]:
         """
         Gets the latest Ubuntu Server 22.04 LTS (HVM), SSD Volume Type AMI for x86_64 architecture.
         Owner ID for Canonical (Ubuntu) is '099720109477'.
         """
         self.logger.info("Searching for latest Ubuntu Server 22.04 LTS AMI...")
-        try:
-            # Canonical (Ubuntu) owner ID
-            ubuntu_owner_id = "099720109477"
-            # Pattern for Ubuntu Server 22.04 LTS, HVM, SSD Volume Type, x86_64
-            # The name pattern often includes the build date, e.g., "ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-20230126"
-            ubuntu_name_pattern = "ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*"
-
-            response = self.client.describe_images(
-                Owners=[ubuntu_owner_id],
-                Filters=[
-                    {"Name": "name", "Values": [ubuntu_name_pattern]},
-                    {"Name": "state", "Values": ["available"]},
-                    {"Name": "architecture", "Values": ["x86_64"]},
-                    {"Name": "virtualization-type", "Values": ["hvm"]},
-                    {"Name": "root-device-type", "Values": ["ebs"]}
-                ],
-            )
-            images = sorted(response["Images"], key=lambda x: x["CreationDate"], reverse=True)
-            if not images:
-                raise ValueError(f"No matching Ubuntu AMI found for pattern '{ubuntu_name_pattern}'")
-            return images[0]
-        except Exception as e:
-            self.logger.error(f"Error getting latest Ubuntu AMI: {e}")
-            raise
+        return self.get_latest_family_ami("ubuntu-22.04")
 
     def start_instance(self, instance_id: str) -> Dict[str, Any]:
         """
@@ -206,6 +337,77 @@ class EC2Adapter(AWSAdapterBase):
             self.logger.error(f"Error stopping EC2 instances '{instance_ids}': {e}")
             raise
 
+    def bulk_change_instance_state(self, action: str, instance_ids: List[str], chunk_size: int = 100,
+                                   max_parallel: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Starts, stops or terminates many EC2 instances, in parallel chunks.
+
+        Args:
+            action (str): One of 'start', 'stop' or 'terminate'.
+            instance_ids (List[str]): The IDs of the instances.
+            chunk_size (int, optional): The maximum number of instances per request. Defaults to 100.
+            max_parallel (int, optional): The maximum number of requests in flight. Defaults to 4.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each instance ID, its previous and current state, or the error.
+        """
+        operations = {
+            "start": ("start_instances", "StartingInstances"),
+            "stop": ("stop_instances", "StoppingInstances"),
+            "terminate": ("terminate_instances", "TerminatingInstances"),
+        }
+        if action not in operations:
+            raise ValueError(f"Unsupported bulk action '{action}'. Use one of: {', '.join(operations)}.")
+        operation_name, result_key = operations[action]
+        self.logger.info(f"Bulk {action} of {len(instance_ids)} EC2 instances in chunks of {chunk_size}")
+
+        raw = self.run_in_chunks(
+            instance_ids,
+            lambda chunk: getattr(self.client, operation_name)(InstanceIds=chunk),
+            chunk_size=chunk_size,
+            max_parallel=max_parallel,
+        )
+        results = {}
+        for instance_id, outcome in raw.items():
+            if "error" in outcome:
+                results[instance_id] = {"status": "failed", "error": outcome["error"]}
+                continue
+            change = next(
+                (c for c in outcome["response"].get(result_key, []) if c.get("InstanceId") == instance_id), {}
+            )
+            results[instance_id] = {
+                "status": "succeeded",
+                "previous_state": (change.get("PreviousState") or {}).get("Name"),
+                "current_state": (change.get("CurrentState") or {}).get("Name"),
+            }
+        return results
+
+    def bulk_tag_resources(self, resource_ids: List[str], tags: List[Dict[str, str]], chunk_size: int = 100,
+                           max_parallel: int = 4) -> Dict[str, Dict[str, Any]]:
+        """
+        Adds or overwrites tags on many EC2 resources (instances, volumes, VPCs, ...), in parallel chunks.
+
+        Args:
+            resource_ids (List[str]): The IDs of the resources.
+            tags (List[Dict[str, str]]): The tags, as [{'Key': ..., 'Value': ...}].
+            chunk_size (int, optional): The maximum number of resources per request. Defaults to 100.
+            max_parallel (int, optional): The maximum number of requests in flight. Defaults to 4.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: For each resource ID, its status, or the error.
+        """
+        self.logger.info(f"Bulk tagging {len(resource_ids)} EC2 resources in chunks of {chunk_size}")
+        raw = self.run_in_chunks(
+            resource_ids,
+            lambda chunk: self.client.create_tags(Resources=chunk, Tags=tags),
+            chunk_size=chunk_size,
+            max_parallel=max_parallel,
+        )
+        return {
+            resource_id: {"status": "failed", "error": outcome["error"]} if "error" in outcome else {"status": "succeeded"}
+            for resource_id, outcome in raw.items()
+        }
+
     def create_volume(self, availability_zone: str, size: int, volume_type: str = 'gp3', tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
         """
         Creates a new EBS volume.
@@ -248,4 +450,37 @@ class EC2Adapter(AWSAdapterBase):
             return self.client.describe_availability_zones()
         except Exception as e:
             self.logger.error(f"Error listing Availability Zones: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def wait_for_instances_terminated(self, instance_ids: List[str]) -> None:
+        """
+        Blocks until the given instances are terminated.
+
+        Args:
+            instance_ids (List[str]): The IDs of the instances to wait for.
+        """
+        self.logger.info(f"Waiting for EC2 instances to terminate: {instance_ids}")
+        try:
+            self.client.get_waiter("instance_terminated").wait(
+                InstanceIds=instance_ids, WaiterConfig={"Delay": 5, "MaxAttempts": 60}
+            )
+        except Exception as e:
+            self.logger.error(f"Error waiting for EC2 instances '{instance_ids}' to terminate: {e}")
+            raise
+
+    def delete_volume(self, volume_id: str) -> Dict[str, Any]:
+        """
+        Deletes an EBS volume.
+
+        Args:
+            volume_id (str): The ID of the volume to delete.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_volume call.
+        """
+        self.logger.info(f"Deleting EBS volume: {volume_id}")
+        try:
+            return self.client.delete_volume(VolumeId=volume_id)
+        except Exception as e:
+            self.logger.error(f"Error deleting volume '{volume_id}': {e}")
+            raise
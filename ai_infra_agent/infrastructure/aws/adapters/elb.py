@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional, List
 from loguru import logger
 
 from ai_infra_agent.infrastructure.aws.adapters.base import AWSAdapterBase
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 
 
 class ElbAdapter(AWSAdapterBase):
@@ -9,15 +10,16 @@ class ElbAdapter(AWSAdapterBase):
     Adapter for interacting with the AWS Elastic Load Balancing (ELBv2) service.
     """
 
-    def __init__(self, logger: logger, aws_config: Dict[str, Any]):
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the ELB adapter.
 
         Args:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): User-specific AWS credentials.
+            connection (AWSConnectionContext, optional): The user's shared connection context.
         """
-        super().__init__(service_name="elbv2", logger=logger, aws_config=aws_config)
+        super().__init__(service_name="elbv2", logger=logger, aws_config=aws_config, connection=connection)
 
     def create_load_balancer(
         self,
@@ -62,3 +64,20 @@ class ElbAdapter(AWSAdapterBase):
         except Exception as e:
             self.logger.error(f"Error creating load balancer: {e}")
             raise
+
+    def delete_load_balancer(self, load_balancer_arn: str) -> Dict[str, Any]:
+        """
+        Deletes an Application or Network Load Balancer.
+
+        Args:
+            load_balancer_arn (str): The ARN of the load balancer.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_load_balancer call.
+        """
+        self.logger.info(f"Deleting load balancer '{load_balancer_arn}'.")
+        try:
+            return self.client.delete_load_balancer(LoadBalancerArn=load_balancer_arn)
+        except Exception as e:
+            self.logger.error(f"Error deleting load balancer '{load_balancer_arn}': {e}")
+            raise
@@ -1,7 +1,8 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from loguru import logger
 
 from ai_infra_agent.infrastructure.aws.adapters.base import AWSAdapterBase
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 
 
 class KeyPairAdapter(AWSAdapterBase):
@@ -9,15 +10,16 @@ class KeyPairAdapter(AWSAdapterBase):
     Adapter for interacting with AWS EC2 Key Pairs.
     """
 
-    def __init__(self, logger: logger, aws_config: Dict[str, Any]):
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the KeyPair adapter. Note that Key Pair resources are managed via the 'ec2' client.
 
         Args:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): User-specific AWS credentials.
+            connection (AWSConnectionContext, optional): The user's shared connection context.
         """
-        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config)
+        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config, connection=connection)
 
     def create_key_pair(self, key_name: str) -> Dict[str, Any]:
         """
@@ -49,3 +51,20 @@ class KeyPairAdapter(AWSAdapterBase):
         except Exception as e:
             self.logger.error(f"Error listing key pairs: {e}")
             raise
+
+    def delete_key_pair(self, key_name: str) -> Dict[str, Any]:
+        """
+        Deletes an EC2 key pair.
+
+        Args:
+            key_name (str): The name of the key pair to delete.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_key_pair call.
+        """
+        self.logger.info(f"Deleting key pair: {key_name}")
+        try:
+            return self.client.delete_key_pair(KeyName=key_name)
+        except Exception as e:
+            self.logger.error(f"Error deleting key pair '{key_name}': {e}")
+            raise
@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional, List
 from loguru import logger
 
 from ai_infra_agent.infrastructure.aws.adapters.base import AWSAdapterBase
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 
 
 class RdsAdapter(AWSAdapterBase):
@@ -9,15 +10,16 @@ class RdsAdapter(AWSAdapterBase):
     Adapter for interacting with the AWS RDS service.
     """
 
-    def __init__(self, logger: logger, aws_config: Dict[str, Any]):
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the RDS adapter.
 
         Args:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): User-specific AWS credentials.
+            connection (AWSConnectionContext, optional): The user's shared connection context.
         """
-        super().__init__(service_name="rds", logger=logger, aws_config=aws_config)
+        super().__init__(service_name="rds", logger=logger, aws_config=aws_config, connection=connection)
 
     def describe_db_instances(self, db_instance_identifier: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -39,6 +41,14 @@ class RdsAdapter(AWSAdapterBase):
             self.logger.error(f"Error describing RDS DB instances: {e}")
             raise
 
+    async def adescribe_db_instances(self, db_instance_identifier: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Describes RDS DB instances without blocking the event loop. See describe_db_instances.
+        """
+        self.logger.info(f"Describing RDS DB instances with identifier: {db_instance_identifier}")
+        params = {"DBInstanceIdentifier": db_instance_identifier} if db_instance_identifier else {}
+        return await self.acall("describe_db_instances", **params)
+
     def describe_db_subnet_groups(self, db_subnet_group_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Describes RDS DB Subnet Groups.
@@ -59,6 +69,14 @@ class RdsAdapter(AWSAdapterBase):
             self.logger.error(f"Error describing RDS DB Subnet Groups: {e}")
             raise
 
+    async def adescribe_db_subnet_groups(self, db_subnet_group_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Describes RDS DB Subnet Groups without blocking the event loop. See describe_db_subnet_groups.
+        """
+        self.logger.info(f"Describing RDS DB Subnet Groups with name: {db_subnet_group_name}")
+        params = {"DBSubnetGroupName": db_subnet_group_name} if db_subnet_group_name else {}
+        return await self.acall("describe_db_subnet_groups", **params)
+
     def create_db_subnet_group(self, db_subnet_group_name: str, db_subnet_group_description: str, subnet_ids: List[str], tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
         """
         Creates a new RDS DB Subnet Group.
@@ -146,3 +164,48 @@ class RdsAdapter(AWSAdapterBase):
         except Exception as e:
             self.logger.error(f"Error creating RDS DB instance: {e}")
             raise
+
+    def delete_db_instance(self, db_instance_identifier: str, skip_final_snapshot: bool = True, wait: bool = False) -> Dict[str, Any]:
+        """
+        Deletes a DB instance.
+
+        Args:
+            db_instance_identifier (str): The DB instance identifier.
+            skip_final_snapshot (bool): Whether to skip the final DB snapshot. Defaults to True.
+            wait (bool): Whether to block until the instance is deleted. Defaults to False.
+
+        Returns:
+            Dict[str, Any]: The DBInstance part of the delete_db_instance response.
+        """
+        self.logger.info(f"Deleting DB instance '{db_instance_identifier}' (skip final snapshot: {skip_final_snapshot}).")
+        try:
+            response = self.client.delete_db_instance(
+                DBInstanceIdentifier=db_instance_identifier,
+                SkipFinalSnapshot=skip_final_snapshot,
+                DeleteAutomatedBackups=True,
+            )
+            if wait:
+                self.client.get_waiter("db_instance_deleted").wait(
+                    DBInstanceIdentifier=db_instance_identifier, WaiterConfig={"Delay": 15, "MaxAttempts": 80}
+                )
+            return response.get('DBInstance', {})
+        except Exception as e:
+            self.logger.error(f"Error deleting DB instance '{db_instance_identifier}': {e}")
+            raise
+
+    def delete_db_subnet_group(self, db_subnet_group_name: str) -> Dict[str, Any]:
+        """
+        Deletes a DB subnet group.
+
+        Args:
+            db_subnet_group_name (str): The name of the DB subnet group.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_db_subnet_group call.
+        """
+        self.logger.info(f"Deleting DB subnet group '{db_subnet_group_name}'.")
+        try:
+            return self.client.delete_db_subnet_group(DBSubnetGroupName=db_subnet_group_name)
+        except Exception as e:
+            self.logger.error(f"Error deleting DB subnet group '{db_subnet_group_name}': {e}")
+            raise
@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional, List
 from loguru import logger
 
 from ai_infra_agent.infrastructure.aws.adapters.base import AWSAdapterBase
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 
 
 class S3Adapter(AWSAdapterBase):
@@ -9,15 +10,16 @@ class S3Adapter(AWSAdapterBase):
     Adapter for interacting with the AWS S3 service.
     """
 
-    def __init__(self, logger: logger, aws_config: Dict[str, Any]):
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the S3 adapter.
 
         Args:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): User-specific AWS credentials.
+            connection (AWSConnectionContext, optional): The user's shared connection context.
         """
-        super().__init__(service_name="s3", logger=logger, aws_config=aws_config)
+        super().__init__(service_name="s3", logger=logger, aws_config=aws_config, connection=connection)
 
     def create_bucket(self, bucket_name: str, region: Optional[str] = None, tags: Optional[List[Dict[str, str]]] = None) -> Dict[str, Any]:
         """
@@ -55,3 +57,20 @@ class S3Adapter(AWSAdapterBase):
         except Exception as e:
             self.logger.error(f"Error creating S3 bucket '{bucket_name}': {e}")
             raise
+
+    def delete_bucket(self, bucket_name: str) -> Dict[str, Any]:
+        """
+        Deletes an empty S3 bucket.
+
+        Args:
+            bucket_name (str): The name of the S3 bucket.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_bucket call.
+        """
+        self.logger.info(f"Deleting S3 bucket: {bucket_name}")
+        try:
+            return self.client.delete_bucket(Bucket=bucket_name)
+        except Exception as e:
+            self.logger.error(f"Error deleting S3 bucket '{bucket_name}': {e}")
+            raise
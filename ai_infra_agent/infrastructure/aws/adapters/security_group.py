@@ -1,7 +1,8 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from loguru import logger
 
 from ai_infra_agent.infrastructure.aws.adapters.base import AWSAdapterBase
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 
 
 class SecurityGroupAdapter(AWSAdapterBase):
@@ -9,15 +10,16 @@ class SecurityGroupAdapter(AWSAdapterBase):
     Adapter for managing EC2 security groups.
     """
 
-    def __init__(self, logger: logger, aws_config: Dict[str, Any]):
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the SecurityGroup adapter.
 
         Args:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): User-specific AWS credentials.
+            connection (AWSConnectionContext, optional): The user's shared connection context.
         """
-        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config)
+        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config, connection=connection)
 
     def create_security_group(self, group_name: str, description: str, vpc_id: str) -> Dict[str, Any]:
         """
@@ -57,6 +59,25 @@ class SecurityGroupAdapter(AWSAdapterBase):
             self.logger.error(f"Failed to add ingress rule to security group '{group_id}': {e}")
             raise
 
+    def add_security_group_ingress_rules(self, group_id: str, ip_permissions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Adds several ingress rules to an existing EC2 security group in a single API call.
+
+        Args:
+            group_id (str): The ID of the security group.
+            ip_permissions (List[Dict[str, Any]]): The IpPermissions entries to authorize.
+        """
+        try:
+            response = self.client.authorize_security_group_ingress(
+                GroupId=group_id,
+                IpPermissions=ip_permissions
+            )
+            self.logger.info(f"{len(ip_permissions)} ingress permission(s) added to security group '{group_id}'.")
+            return response
+        except Exception as e:
+            self.logger.error(f"Failed to add ingress rules to security group '{group_id}': {e}")
+            raise
+
     def list_security_groups(self) -> Dict[str, Any]:
         """
         Lists all EC2 security groups.
@@ -70,6 +91,14 @@ class SecurityGroupAdapter(AWSAdapterBase):
             self.logger.error(f"Failed to list security groups: {e}")
             raise
 
+    async def alist_security_groups(self) -> Dict[str, Any]:
+        """
+        Lists all EC2 security groups without blocking the event loop. See list_security_groups.
+        """
+        response = await self.acall("describe_security_groups")
+        self.logger.info(f"Found {len(response.get('SecurityGroups', []))} security groups.")
+        return response
+
     def add_security_group_egress_rule(self, group_id: str, ip_protocol: str, cidr_ip: str, from_port: int = None, to_port: int = None) -> Dict[str, Any]:
         """
         Adds an egress rule to an existing EC2 security group.
@@ -94,6 +123,25 @@ class SecurityGroupAdapter(AWSAdapterBase):
             self.logger.error(f"Failed to add egress rule to security group '{group_id}': {e}")
             raise
 
+    def add_security_group_egress_rules(self, group_id: str, ip_permissions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Adds several egress rules to an existing EC2 security group in a single API call.
+
+        Args:
+            group_id (str): The ID of the security group.
+            ip_permissions (List[Dict[str, Any]]): The IpPermissions entries to authorize.
+        """
+        try:
+            response = self.client.authorize_security_group_egress(
+                GroupId=group_id,
+                IpPermissions=ip_permissions
+            )
+            self.logger.info(f"{len(ip_permissions)} egress permission(s) added to security group '{group_id}'.")
+            return response
+        except Exception as e:
+            self.logger.error(f"Failed to add egress rules to security group '{group_id}': {e}")
+            raise
+
     def delete_security_group(self, group_id: str) -> Dict[str, Any]:
         """
         Deletes an EC2 security group.
@@ -2,6 +2,7 @@ from typing import List, Dict, Any, Optional
 from loguru import logger
 
 from ai_infra_agent.infrastructure.aws.adapters.base import AWSAdapterBase
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 
 
 class VpcAdapter(AWSAdapterBase):
@@ -9,15 +10,16 @@ class VpcAdapter(AWSAdapterBase):
     Adapter for interacting with AWS VPC, Subnets, and related networking resources.
     """
 
-    def __init__(self, logger: logger, aws_config: Dict[str, Any]):
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], connection: Optional[AWSConnectionContext] = None):
         """
         Initializes the VPC adapter. Note that VPC resources are managed via the 'ec2' client.
 
         Args:
             logger (Logger): The logger instance.
             aws_config (Dict[str, Any]): User-specific AWS credentials.
+            connection (AWSConnectionContext, optional): The user's shared connection context.
         """
-        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config)
+        super().__init__(service_name="ec2", logger=logger, aws_config=aws_config, connection=connection)
 
     def list_vpcs(self, vpc_ids: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -39,6 +41,14 @@ class VpcAdapter(AWSAdapterBase):
             self.logger.error(f"Error listing VPCs: {e}")
             raise
 
+    async def alist_vpcs(self, vpc_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Lists VPCs without blocking the event loop. See list_vpcs.
+        """
+        self.logger.info(f"Listing VPCs with IDs: {vpc_ids}")
+        params = {"VpcIds": vpc_ids} if vpc_ids else {}
+        return await self.acall("describe_vpcs", **params)
+
     def list_subnets(self, vpc_id: str) -> Dict[str, Any]:
         """
         Lists subnets within a specific VPC.
@@ -177,3 +187,73 @@ class VpcAdapter(AWSAdapterBase):
         except Exception as e:
             self.logger.error(f"Error modifying subnet '{subnet_id}' attribute: {e}")
             raise
+
+    def delete_vpc(self, vpc_id: str) -> Dict[str, Any]:
+        """
+        Deletes a VPC. All of its dependent resources must have been deleted first.
+
+        Args:
+            vpc_id (str): The ID of the VPC to delete.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_vpc call.
+        """
+        self.logger.info(f"Deleting VPC '{vpc_id}'.")
+        try:
+            return self.client.delete_vpc(VpcId=vpc_id)
+        except Exception as e:
+            self.logger.error(f"Error deleting VPC '{vpc_id}': {e}")
+            raise
+
+    def detach_internet_gateway(self, internet_gateway_id: str, vpc_id: str) -> Dict[str, Any]:
+        """
+        Detaches an Internet Gateway from a VPC.
+
+        Args:
+            internet_gateway_id (str): The ID of the Internet Gateway.
+            vpc_id (str): The ID of the VPC.
+
+        Returns:
+            Dict[str, Any]: A status dictionary.
+        """
+        self.logger.info(f"Detaching Internet Gateway '{internet_gateway_id}' from VPC '{vpc_id}'.")
+        try:
+            self.client.detach_internet_gateway(InternetGatewayId=internet_gateway_id, VpcId=vpc_id)
+            return {"status": "success", "internet_gateway_id": internet_gateway_id, "vpc_id": vpc_id}
+        except Exception as e:
+            self.logger.error(f"Error detaching Internet Gateway '{internet_gateway_id}' from VPC '{vpc_id}': {e}")
+            raise
+
+    def delete_internet_gateway(self, internet_gateway_id: str) -> Dict[str, Any]:
+        """
+        Deletes a detached Internet Gateway.
+
+        Args:
+            internet_gateway_id (str): The ID of the Internet Gateway.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_internet_gateway call.
+        """
+        self.logger.info(f"Deleting Internet Gateway '{internet_gateway_id}'.")
+        try:
+            return self.client.delete_internet_gateway(InternetGatewayId=internet_gateway_id)
+        except Exception as e:
+            self.logger.error(f"Error deleting Internet Gateway '{internet_gateway_id}': {e}")
+            raise
+
+    def delete_subnet(self, subnet_id: str) -> Dict[str, Any]:
+        """
+        Deletes a subnet.
+
+        Args:
+            subnet_id (str): The ID of the subnet.
+
+        Returns:
+            Dict[str, Any]: The response from the delete_subnet call.
+        """
+        self.logger.info(f"Deleting subnet '{subnet_id}'.")
+        try:
+            return self.client.delete_subnet(SubnetId=subnet_id)
+        except Exception as e:
+            self.logger.error(f"Error deleting subnet '{subnet_id}': {e}")
+            raise
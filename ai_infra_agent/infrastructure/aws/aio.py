@@ -0,0 +1,45 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable
+
+from ai_infra_agent.core.config import settings
+
+# aiobotocore is optional. When it is installed, AWS calls made through an
+# AWSConnectionContext run natively on the event loop; otherwise they run on a
+# dedicated, bounded thread pool.
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session as get_aio_session
+except ImportError:
+    AioConfig = None
+    get_aio_session = None
+
+
+def native_async_enabled() -> bool:
+    """Returns whether AWS calls can run natively on the event loop."""
+    return get_aio_session is not None and settings.aws.use_aiobotocore
+
+
+@lru_cache(maxsize=None)
+def get_aws_executor() -> ThreadPoolExecutor:
+    """
+    Provide the thread pool blocking AWS calls run on. It is separate from the event loop's
+    default executor so AWS calls neither starve nor are starved by other blocking work.
+    """
+    return ThreadPoolExecutor(max_workers=settings.aws.max_concurrent_calls, thread_name_prefix="aws-call")
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Runs a blocking callable on the AWS thread pool without blocking the event loop.
+
+    Args:
+        func (Callable): The blocking callable, e.g. a boto3 client method or a tool's execute.
+
+    Returns:
+        Any: Whatever the callable returns.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_aws_executor(), functools.partial(func, *args, **kwargs))
@@ -0,0 +1,213 @@
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from loguru import logger
+
+from ai_infra_agent.core.config import settings
+from ai_infra_agent.infrastructure.aws.aio import get_aws_executor
+
+# Image fields kept in the catalog; describe_images returns many more.
+_IMAGE_FIELDS = ("ImageId", "Name", "Description", "CreationDate", "Architecture", "OwnerId")
+
+
+class AmiFamily:
+    """A named OS family the catalog can resolve to its latest image, e.g. 'ubuntu-22.04'."""
+
+    def __init__(self, name: str, owner: str, name_pattern: str, architecture: str = "x86_64",
+                 filters: Optional[List[Dict[str, Any]]] = None):
+        """
+        Args:
+            name (str): The family name used in lookups.
+            owner (str): The image owner alias or account ID (e.g., 'amazon').
+            name_pattern (str): The describe_images name filter (e.g., 'al2023-ami-*-x86_64').
+            architecture (str): The image architecture.
+            filters (List[Dict[str, Any]], optional): Extra describe_images filters.
+        """
+        self.name = name
+        self.owner = owner
+        self.name_pattern = name_pattern
+        self.architecture = architecture
+        self.filters = filters or []
+
+
+class AmiCatalog:
+    """
+    A regional catalog of the latest public AMIs, indexed by (owner, name pattern, architecture, region).
+
+    Lookups are answered from the catalog without calling AWS. An entry older than the refresh
+    interval is still returned, and a background refresh replaces it; only a lookup that has no
+    entry at all calls describe_images synchronously. The catalog is persisted to disk so a
+    restarted process starts warm. Public images are the same for every account, so the
+    catalog is shared by all users.
+    """
+
+    def __init__(self, logger: logger, path: Optional[str] = None, refresh_seconds: int = 21600):
+        """
+        Args:
+            logger: The logger instance.
+            path (str, optional): The JSON file the catalog is persisted to. If None, it is kept in memory only.
+            refresh_seconds (int): How old an entry may get before it is refreshed in the background.
+        """
+        self.logger = logger
+        self.path = Path(path) if path else None
+        self.refresh_seconds = refresh_seconds
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._families: Dict[str, AmiFamily] = {}
+        self._refreshing: set = set()
+        self._lock = threading.Lock()
+        self._init_families()
+        self._load()
+
+    def _init_families(self):
+        """Registers the OS families that can be looked up by name."""
+        self._register_family(AmiFamily("amazon-linux-2023", "amazon", "al2023-ami-*-x86_64"))
+        self._register_family(AmiFamily("amazon-linux-2", "amazon", "amzn2-ami-hvm-*-x86_64-gp2"))
+        self._register_family(AmiFamily(
+            "ubuntu-22.04", "099720109477", "ubuntu/images/hvm-ssd/ubuntu-jammy-22.04-amd64-server-*",
+            filters=[{"Name": "virtualization-type", "Values": ["hvm"]}, {"Name": "root-device-type", "Values": ["ebs"]}],
+        ))
+        self._register_family(AmiFamily(
+            "ubuntu-24.04", "099720109477", "ubuntu/images/hvm-ssd-gp3/ubuntu-noble-24.04-amd64-server-*",
+            filters=[{"Name": "virtualization-type", "Values": ["hvm"]}, {"Name": "root-device-type", "Values": ["ebs"]}],
+        ))
+
+    def _register_family(self, family: AmiFamily):
+        """Helper to register an OS family."""
+        self._families[family.name] = family
+
+    def family(self, name: str) -> AmiFamily:
+        """Returns a registered OS family, raising ValueError for unknown names."""
+        family = self._families.get(name)
+        if family is None:
+            raise ValueError(f"Unknown AMI family '{name}'. Known families: {', '.join(sorted(self._families))}")
+        return family
+
+    def family_names(self) -> List[str]:
+        return sorted(self._families)
+
+    def latest(self, client: Any, region: str, owner: str, name_pattern: str, architecture: str = "x86_64",
+               filters: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Returns the latest available image matching an owner and name pattern in a region.
+
+        Args:
+            client: An EC2 client for the region, used when the catalog has to call AWS.
+            region (str): The region of the image.
+            owner (str): The image owner alias or account ID.
+            name_pattern (str): The describe_images name filter.
+            architecture (str): The image architecture.
+            filters (List[Dict[str, Any]], optional): Extra describe_images filters.
+
+        Returns:
+            Dict[str, Any]: The image, with the fields ImageId, Name, Description and CreationDate.
+
+        Raises:
+            ValueError: If no image matches.
+        """
+        key = self._key(owner, name_pattern, architecture, region)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            if time.time() - entry["refreshed_at"] >= self.refresh_seconds:
+                self._schedule_refresh(key, client, owner, name_pattern, architecture, filters)
+            return dict(entry["image"])
+
+        image = self._refresh(key, client, owner, name_pattern, architecture, filters)
+        return dict(image)
+
+    def latest_for_family(self, client: Any, region: str, family_name: str) -> Dict[str, Any]:
+        """Returns the latest image of a registered OS family. See latest."""
+        family = self.family(family_name)
+        return self.latest(client, region, family.owner, family.name_pattern, family.architecture, family.filters)
+
+    @staticmethod
+    def _key(owner: str, name_pattern: str, architecture: str, region: str) -> str:
+        # JSON object keys must be strings, so the index key is flattened.
+        return "|".join((owner, name_pattern, architecture, region))
+
+    def _schedule_refresh(self, key: str, client: Any, owner: str, name_pattern: str, architecture: str,
+                          filters: Optional[List[Dict[str, Any]]]) -> None:
+        """Refreshes an entry on the AWS thread pool unless a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._refresh(key, client, owner, name_pattern, architecture, filters)
+            except Exception as e:
+                self.logger.warning(f"Background refresh of AMI catalog entry '{key}' failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        get_aws_executor().submit(refresh)
+
+    def _refresh(self, key: str, client: Any, owner: str, name_pattern: str, architecture: str,
+                 filters: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Fetches the latest matching image from AWS and stores it in the catalog."""
+        self.logger.info(f"Refreshing AMI catalog entry: owner '{owner}', pattern '{name_pattern}', {architecture}")
+        response = client.describe_images(
+            Owners=[owner],
+            Filters=[
+                {"Name": "name", "Values": [name_pattern]},
+                {"Name": "state", "Values": ["available"]},
+                {"Name": "architecture", "Values": [architecture]},
+                *(filters or []),
+            ],
+        )
+        images = response.get("Images", [])
+        if not images:
+            raise ValueError(f"No matching AMI found for owner '{owner}' and pattern '{name_pattern}'")
+        # Only the newest image is needed, so a single pass replaces sorting the whole list.
+        latest = max(images, key=lambda image: image.get("CreationDate", ""))
+        image = {field: latest.get(field) for field in _IMAGE_FIELDS}
+        with self._lock:
+            self._entries[key] = {"image": image, "refreshed_at": time.time()}
+            snapshot = dict(self._entries)
+        self._save(snapshot)
+        return image
+
+    def _load(self) -> None:
+        """Loads the persisted catalog, ignoring a missing or unreadable file."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._entries = {
+                key: entry for key, entry in data.get("entries", {}).items()
+                if isinstance(entry, dict) and "image" in entry and "refreshed_at" in entry
+            }
+            self.logger.info(f"Loaded {len(self._entries)} AMI catalog entries from {self.path}")
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load the AMI catalog from {self.path}: {e}")
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Persists the catalog atomically, so a crash never leaves a truncated file."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"entries": entries}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.logger.warning(f"Could not persist the AMI catalog to {self.path}: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_ami_catalog() -> AmiCatalog:
+    """Provide the process-wide AmiCatalog singleton."""
+    return AmiCatalog(
+        logger=logger,
+        path=settings.aws.ami_catalog_path,
+        refresh_seconds=settings.aws.ami_catalog_refresh_seconds,
+    )
@@ -0,0 +1,192 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Tuple
+
+import botocore.session
+from botocore.config import Config
+from loguru import logger
+
+from ai_infra_agent.core.config import settings
+
+
+def credential_fingerprint(aws_config: Dict[str, Any]) -> str:
+    """
+    Returns a stable, non-reversible fingerprint of a set of AWS credentials,
+    so secrets are never used as (or logged with) cache keys.
+    """
+    material = "\0".join(
+        str(aws_config.get(key) or "") for key in ("access_key_id", "secret_access_key", "session_token")
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AWSClientPool:
+    """
+    A thread-safe pool of boto3 clients keyed by (credential fingerprint, service, region).
+
+    Reusing a client keeps its loaded service model and its HTTP connection pool warm,
+    so steady-state tool calls skip client construction and reuse keep-alive connections.
+    The pool is bounded: the least recently used clients are evicted first, and clients
+    older than the TTL are replaced so rotated or revoked credentials do not linger. Evicted
+    clients are closed, so their connection pools do not outlive them.
+
+    All clients are created from one botocore session owned by the pool. The session's
+    loader caches parsed service models, so the EC2 model shared by the VPC, security group,
+    key pair and EC2 adapters is parsed once per process instead of once per client.
+    """
+
+    ClientKey = Tuple[str, str, str, int]  # fingerprint, service_name, region, max_retries
+
+    def __init__(self, logger: logger, max_size: int = 128, ttl_seconds: int = 900, max_pool_connections: int = 10):
+        """
+        Args:
+            logger: The logger instance.
+            max_size (int): The maximum number of clients kept.
+            ttl_seconds (int): How long a client is reused after it was created.
+            max_pool_connections (int): The size of each client's HTTP connection pool.
+        """
+        self.logger = logger
+        self.max_size = max(1, max_size)
+        self.ttl_seconds = ttl_seconds
+        self.max_pool_connections = max_pool_connections
+        self._clients: "OrderedDict[AWSClientPool.ClientKey, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Serializes client creation, as botocore sessions are not thread-safe, without blocking lookups.
+        self._create_lock = threading.Lock()
+        self._session = botocore.session.Session()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_client(self, service_name: str, aws_config: Dict[str, Any]) -> Any:
+        """
+        Returns a warm client for the given service and credentials, creating it if needed.
+
+        Args:
+            service_name (str): The name of the AWS service (e.g., 'ec2', 's3').
+            aws_config (Dict[str, Any]): User-specific AWS credentials, including 'region'.
+
+        Returns:
+            The boto3 client.
+        """
+        key = (
+            credential_fingerprint(aws_config),
+            service_name,
+            aws_config.get("region"),
+            int(aws_config.get("max_retries", 3)),
+        )
+        evicted = []
+        try:
+            client = self._lookup(key, evicted)
+            if client is not None:
+                return client
+            with self._create_lock:
+                # Another request may have created the client while this one waited.
+                client = self._lookup(key, evicted)
+                if client is not None:
+                    return client
+                client = self._create_client(service_name, aws_config)
+                with self._lock:
+                    self.misses += 1
+                    self._clients[key] = (client, time.monotonic())
+                    while len(self._clients) > self.max_size:
+                        evicted.append(self._clients.popitem(last=False)[1][0])
+                        self.evictions += 1
+                return client
+        finally:
+            for stale_client in evicted:
+                self._close(stale_client)
+
+    def _lookup(self, key: "AWSClientPool.ClientKey", evicted: list) -> Any:
+        """
+        Returns the pooled client of a key if it is within its TTL, or None.
+
+        Args:
+            key: The client's key.
+            evicted (list): Collects the expired client, if any, to be closed outside the lock.
+
+        Returns:
+            The client, or None if it has to be created.
+        """
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl_seconds:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._clients[key]
+                evicted.append(entry[0])
+                self.evictions += 1
+            return None
+
+    def _close(self, client: Any) -> None:
+        """Closes an evicted client's HTTP connections."""
+        try:
+            client.close()
+        except Exception as e:
+            self.logger.debug(f"Could not close an evicted boto3 client: {e}")
+
+    def _create_client(self, service_name: str, aws_config: Dict[str, Any]) -> Any:
+        """Creates a new boto3 client with retries and keep-alive connections."""
+        self.logger.info(f"Creating boto3 client for service '{service_name}' in region '{aws_config.get('region')}'.")
+        config = Config(
+            retries={
+                "max_attempts": aws_config.get("max_retries", 3),
+                "mode": "standard",
+            },
+            max_pool_connections=self.max_pool_connections,
+            tcp_keepalive=True,
+        )
+        return self._session.create_client(
+            service_name,
+            region_name=aws_config.get("region"),
+            aws_access_key_id=aws_config.get("access_key_id"),
+            aws_secret_access_key=aws_config.get("secret_access_key"),
+            aws_session_token=aws_config.get("session_token"),
+            config=config,
+        )
+
+    def prewarm(self, service_names: Iterable[str]) -> None:
+        """
+        Loads and caches the service models of the given services ahead of the first request.
+
+        Args:
+            service_names (Iterable[str]): The AWS services to load (e.g., 'ec2', 'rds').
+        """
+        service_names = list(service_names)
+        with self._create_lock:
+            self._session.get_component("endpoint_resolver")
+            for service_name in service_names:
+                try:
+                    self._session.get_service_model(service_name)
+                except Exception as e:
+                    self.logger.warning(f"Could not prewarm the service model of '{service_name}': {e}")
+        self.logger.info(f"Prewarmed AWS service models: {', '.join(service_names)}")
+
+    def clear(self) -> None:
+        """Drops and closes every pooled client."""
+        with self._lock:
+            clients = [client for client, _ in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            self._close(client)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the pool's size and hit/miss/eviction counters."""
+        with self._lock:
+            return {"size": len(self._clients), "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+@lru_cache(maxsize=None)
+def get_client_pool() -> AWSClientPool:
+    """Provide the process-wide AWSClientPool singleton."""
+    return AWSClientPool(
+        logger=logger,
+        max_size=settings.aws.client_pool_max_size,
+        ttl_seconds=settings.aws.client_pool_ttl_seconds,
+        max_pool_connections=settings.aws.max_pool_connections,
+    )
@@ -0,0 +1,180 @@
+import asyncio
+import threading
+import time
+from contextlib import AsyncExitStack
+from typing import Dict, Any, Optional
+
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.aio import AioConfig, get_aio_session, native_async_enabled
+from ai_infra_agent.infrastructure.aws.client_pool import AWSClientPool, get_client_pool
+
+
+class _InstrumentedClient:
+    """
+    A thin proxy around a boto3 client that records the count, errors and duration
+    of every API operation called through it. Everything else (meta, exceptions,
+    waiters, paginators) is passed through unchanged.
+    """
+
+    def __init__(self, client: Any, service_name: str, context: "AWSConnectionContext"):
+        self._client = client
+        self._service_name = service_name
+        self._context = context
+        self._operations = set(client.meta.method_to_api_mapping)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._client, name)
+        if name not in self._operations:
+            return attribute
+
+        def instrumented(*args, **kwargs):
+            started = time.perf_counter()
+            failed = False
+            try:
+                return attribute(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self._context._record(self._service_name, name, time.perf_counter() - started, failed)
+
+        return instrumented
+
+
+class AWSConnectionContext:
+    """
+    The AWS connections of one user for the lifetime of a plan execution or request.
+
+    Every adapter created with the same context shares one client per service, so the
+    VPC, security group, key pair and EC2 adapters of a plan all use the same EC2 client
+    and its open connections. Calls made through the context are counted per operation.
+
+    When aiobotocore is installed, the context also opens native asyncio clients (see acall),
+    which are closed by aclose at the end of the plan or request.
+    """
+
+    def __init__(self, logger: logger, aws_config: Dict[str, Any], pool: Optional[AWSClientPool] = None):
+        """
+        Args:
+            logger: The logger instance.
+            aws_config (Dict[str, Any]): User-specific AWS credentials, including 'region'.
+            pool (AWSClientPool, optional): Where clients come from. Defaults to the process-wide pool.
+        """
+        self.logger = logger
+        self.aws_config = aws_config
+        self.pool = pool or get_client_pool()
+        self._clients: Dict[str, _InstrumentedClient] = {}
+        self._stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.supports_async = native_async_enabled()
+        self._async_clients: Dict[str, Any] = {}
+        self._async_stack: Optional[AsyncExitStack] = None
+        self._async_lock: Optional[asyncio.Lock] = None
+
+    def client(self, service_name: str) -> Any:
+        """
+        Returns the shared client of a service, opening it on first use.
+
+        Args:
+            service_name (str): The name of the AWS service (e.g., 'ec2', 's3').
+
+        Returns:
+            The instrumented boto3 client.
+        """
+        with self._lock:
+            client = self._clients.get(service_name)
+            if client is None:
+                client = _InstrumentedClient(self.pool.get_client(service_name, self.aws_config), service_name, self)
+                self._clients[service_name] = client
+            return client
+
+    async def acall(self, service_name: str, operation_name: str, **params) -> Any:
+        """
+        Calls an AWS operation natively on the event loop through the service's async client.
+
+        Args:
+            service_name (str): The name of the AWS service (e.g., 'ec2', 's3').
+            operation_name (str): The snake_case name of the operation (e.g., 'describe_vpcs').
+            **params: The operation's parameters.
+
+        Returns:
+            Dict[str, Any]: The operation's response.
+        """
+        client = await self._async_client(service_name)
+        started = time.perf_counter()
+        failed = False
+        try:
+            return await getattr(client, operation_name)(**params)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._record(service_name, operation_name, time.perf_counter() - started, failed)
+
+    async def _async_client(self, service_name: str) -> Any:
+        """Opens the async client of a service on first use."""
+        if not self.supports_async:
+            raise RuntimeError("Native async AWS clients require aiobotocore.")
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            client = self._async_clients.get(service_name)
+            if client is None:
+                if self._async_stack is None:
+                    self._async_stack = AsyncExitStack()
+                config = AioConfig(
+                    retries={"max_attempts": self.aws_config.get("max_retries", 3), "mode": "standard"},
+                    max_pool_connections=self.pool.max_pool_connections,
+                )
+                client = await self._async_stack.enter_async_context(get_aio_session().create_client(
+                    service_name,
+                    region_name=self.aws_config.get("region"),
+                    aws_access_key_id=self.aws_config.get("access_key_id"),
+                    aws_secret_access_key=self.aws_config.get("secret_access_key"),
+                    aws_session_token=self.aws_config.get("session_token"),
+                    config=config,
+                ))
+                self._async_clients[service_name] = client
+            return client
+
+    async def aclose(self) -> None:
+        """Closes the async clients opened by this context. Pooled sync clients stay warm."""
+        if self._async_stack is not None:
+            stack, self._async_stack = self._async_stack, None
+            self._async_clients.clear()
+            try:
+                await stack.aclose()
+            except Exception as e:
+                self.logger.warning(f"Failed to close async AWS clients: {e}")
+
+    def _record(self, service_name: str, operation: str, duration: float, failed: bool) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(service_name, {}).setdefault(
+                operation, {"calls": 0, "errors": 0, "total_ms": 0.0}
+            )
+            entry["calls"] += 1
+            entry["errors"] += int(failed)
+            entry["total_ms"] += duration * 1000
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Returns the calls, errors and total duration of every operation, grouped by service."""
+        with self._lock:
+            return {
+                service: {
+                    operation: {**entry, "total_ms": round(entry["total_ms"], 1)}
+                    for operation, entry in operations.items()
+                }
+                for service, operations in self._stats.items()
+            }
+
+    def summary(self) -> Dict[str, Any]:
+        """Returns the totals across all services: clients opened, calls, errors and duration."""
+        with self._lock:
+            entries = [entry for operations in self._stats.values() for entry in operations.values()]
+            return {
+                "clients": len(self._clients) + len(self._async_clients),
+                "calls": sum(entry["calls"] for entry in entries),
+                "errors": sum(entry["errors"] for entry in entries),
+                "durationMs": round(sum(entry["total_ms"] for entry in entries), 1),
+            }
@@ -70,4 +70,37 @@ class GetLatestUbuntuAmiTool(BaseTool):
             }
         except Exception as e:
             self.logger.error(f"Failed to get latest Ubuntu AMI: {e}")
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
+
+class GetLatestAmiTool(BaseTool):
+    """
+    Tool to find the latest AMI of any OS family registered in the AMI catalog.
+    """
+
+    def __init__(self, logger, adapter):
+        """
+        Initializes the GetLatestAmiTool.
+        """
+        super().__init__(logger=logger, adapter=adapter)
+        self.name = "get-latest-ami"
+        self.description = "Find the latest AMI ID of an OS family (e.g., 'amazon-linux-2023', 'ubuntu-24.04')."
+
+    def execute(self, family: str = "amazon-linux-2023", **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to get the latest AMI of an OS family.
+
+        Args:
+            family (str): The OS family, as registered in the AMI catalog. Defaults to 'amazon-linux-2023'.
+        """
+        self.logger.info(f"Getting latest AMI of family '{family}'...")
+        try:
+            ami_info = self.adapter.get_latest_family_ami(family)
+            self.logger.info(f"Found latest AMI of family '{family}': {ami_info['ImageId']}")
+            return {
+                "ami_id": ami_info.get("ImageId"),
+                "description": ami_info.get("Description"),
+                "name": ami_info.get("Name"),
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to get latest AMI of family '{family}': {e}")
+            return {"error": str(e)}
@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, TYPE_CHECKING
 from loguru import logger
 
+from ai_infra_agent.infrastructure.aws.aio import run_blocking
+
 # Sử dụng TYPE_CHECKING để tránh import vòng tròn trong quá trình runtime
 # Nó chỉ được sử dụng bởi các công cụ kiểm tra kiểu tĩnh (như mypy, Pylance)
 if TYPE_CHECKING:
@@ -32,4 +34,13 @@ class BaseTool(ABC):
         """
         Executes the tool's action. This method must be implemented by subclasses.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool's action without blocking the event loop.
+
+        By default the synchronous execute runs on the AWS thread pool. Tools that can
+        call AWS natively through 'self.adapter.acall' override this method.
+        """
+        return await run_blocking(self.execute, **kwargs)
@@ -60,6 +60,65 @@ class CreateEC2InstanceTool(BaseTool):
         )
 
 
+class LaunchEC2FleetTool(BaseTool):
+    """
+    Tool to launch many identical EC2 instances in one step, spread across Availability Zones.
+    """
+    def __init__(self, logger, adapter: EC2Adapter):
+        super().__init__(logger, adapter)
+        self.name = "launch-ec2-fleet"
+        self.description = "Launches a fleet of identical EC2 instances spread evenly across Availability Zones."
+
+    def execute(
+        self,
+        image_id: str,
+        instance_type: str,
+        count: int,
+        min_count: Optional[int] = None,
+        key_name: Optional[str] = None,
+        subnet_ids: Optional[List[str]] = None,
+        vpc_id: Optional[str] = None,
+        security_group_ids: Optional[List[str]] = None,
+        tags: Any = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Executes the tool to launch a fleet of EC2 instances.
+
+        Args:
+            image_id (str): The ID of the AMI.
+            instance_type (str): The instance type (e.g., 't3.micro').
+            count (int): The number of instances to launch.
+            min_count (int, optional): The fewest instances that make the launch a success. Defaults to count.
+            key_name (str, optional): The name of the key pair.
+            subnet_ids (List[str], optional): The subnets to spread the fleet across. Defaults to the default subnets.
+            vpc_id (str, optional): Spread across the subnets of this VPC, if subnet_ids is not given.
+            security_group_ids (List[str], optional): A list of security group IDs.
+            tags (Any, optional): Tags applied at launch, either as {'Key': 'Value'} or as [{'Key': ..., 'Value': ...}].
+
+        Returns:
+            Dict[str, Any]: All launched 'Instances', their 'InstanceIds' and the 'placement' per subnet, or an error.
+        """
+        self.logger.info(f"Executing tool: {self.name}")
+        if isinstance(tags, dict):
+            tags = [{"Key": str(k), "Value": str(v)} for k, v in tags.items()]
+        try:
+            return self.adapter.launch_fleet(
+                image_id=image_id,
+                instance_type=instance_type,
+                count=int(count),
+                min_count=int(min_count) if min_count is not None else None,
+                key_name=key_name,
+                subnet_ids=subnet_ids,
+                vpc_id=vpc_id,
+                security_group_ids=security_group_ids,
+                tags=tags,
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to launch EC2 fleet: {e}")
+            return {"error": str(e)}
+
+
 class ListEC2InstancesTool(BaseTool):
     """
     Tool to list EC2 instances.
@@ -84,6 +143,13 @@ class ListEC2InstancesTool(BaseTool):
         
         return response
 
+    async def aexecute(self, instance_ids: List[str] = None) -> Dict[str, Any]:
+        """
+        Lists EC2 instances without blocking the event loop.
+        """
+        self.logger.info(f"Executing tool: {self.name}")
+        return await self.adapter.alist_instances(instance_ids=instance_ids)
+
 
 class TerminateEC2InstanceTool(BaseTool):
     """
@@ -94,7 +160,7 @@ class TerminateEC2InstanceTool(BaseTool):
         self.name = "terminate-ec2-instance"
         self.description = "Terminates a specific EC2 instance."
 
-    def execute(self, instance_id: Optional[str] = None, instance_ids: Optional[List[str]] = None, **kwargs) -> Dict[str, Any]:
+    def execute(self, instance_id: Optional[str] = None, instance_ids: Optional[List[str]] = None, wait: bool = False, **kwargs) -> Dict[str, Any]:
         """
         Executes the tool to terminate EC2 instances.
         Accepts either a single instance_id or a list of instance_ids.
@@ -102,6 +168,7 @@ class TerminateEC2InstanceTool(BaseTool):
         Args:
             instance_id (Optional[str]): A single instance ID to terminate.
             instance_ids (Optional[List[str]]): A list of instance IDs to terminate.
+            wait (bool): Whether to block until the instances are terminated. Defaults to False.
 
         Returns:
             Dict[str, Any]: The response from the terminate_instance call.
@@ -116,7 +183,10 @@ class TerminateEC2InstanceTool(BaseTool):
             raise ValueError("Either 'instance_id' or 'instance_ids' must be provided.")
 
         self.logger.info(f"Executing tool: {self.name} for instances: {final_instance_ids}")
-        return self.adapter.terminate_instance(instance_ids=final_instance_ids)
+        response = self.adapter.terminate_instance(instance_ids=final_instance_ids)
+        if wait:
+            self.adapter.wait_for_instances_terminated(instance_ids=final_instance_ids)
+        return response
 
 class StartInstanceTool(BaseTool):
     """
@@ -254,3 +324,185 @@ class ListAvailabilityZonesTool(BaseTool):
         except Exception as e:
             self.logger.error(f"Failed to list Availability Zones: {e}")
             return {"error": str(e)}
+
+class DeleteVolumeTool(BaseTool):
+    """
+    Tool to delete an EBS volume.
+    """
+
+    def __init__(self, logger, adapter: EC2Adapter):
+        """
+        Initializes the DeleteVolumeTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "delete-volume"
+        self.description = "Deletes an EBS volume that is not attached to an instance."
+
+    def execute(self, volume_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete a volume.
+
+        Args:
+            volume_id (str): The ID of the volume to delete.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Executing DeleteVolumeTool for volume: {volume_id}")
+        try:
+            self.adapter.delete_volume(volume_id=volume_id)
+            return {"success": True, "volume_id": volume_id}
+        except Exception as e:
+            self.logger.error(f"Failed to delete volume {volume_id}: {e}")
+            return {"error": str(e)}
+
+
+# EC2 accepts at most 1000 IDs per request; smaller chunks keep each request fast and retries cheap.
+BULK_MAX_CHUNK_SIZE = 1000
+BULK_DEFAULT_CHUNK_SIZE = 100
+BULK_DEFAULT_PARALLELISM = 4
+
+
+def _as_bool(value: Any) -> bool:
+    """Reads a boolean parameter, which the LLM may also pass as a string such as "false"."""
+    if isinstance(value, str):
+        return value.strip().lower() not in ("false", "0", "no", "off", "")
+    return bool(value)
+
+
+def _summarize_bulk_results(verb: str, results: Dict[str, Dict[str, Any]], fail_on_partial: bool) -> Dict[str, Any]:
+    """Builds the result of a bulk tool from its per-ID results."""
+    succeeded = [resource_id for resource_id, r in results.items() if r["status"] == "succeeded"]
+    failed = [resource_id for resource_id, r in results.items() if r["status"] != "succeeded"]
+    if failed and (fail_on_partial or not succeeded):
+        details = "; ".join(f"{resource_id}: {results[resource_id].get('error')}" for resource_id in failed[:5])
+        more = f" (and {len(failed) - 5} more)" if len(failed) > 5 else ""
+        return {"error": f"Failed to {verb} {len(failed)} of {len(results)} resource(s): {details}{more}"}
+    return {"results": results, "succeeded": succeeded, "failed": failed}
+
+
+class BulkInstanceStateTool(BaseTool):
+    """
+    Base class for the tools that start, stop or terminate a fleet of EC2 instances in one step.
+    """
+
+    action = ""
+
+    def __init__(self, logger, adapter: EC2Adapter):
+        super().__init__(logger, adapter)
+
+    def execute(self, instance_ids: Optional[List[str]] = None, instance_id: Optional[str] = None,
+                chunk_size: int = BULK_DEFAULT_CHUNK_SIZE, max_parallel: int = BULK_DEFAULT_PARALLELISM,
+                fail_on_partial: bool = True, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the bulk state change.
+
+        Args:
+            instance_ids (Optional[List[str]]): The IDs of the instances.
+            instance_id (Optional[str]): A single instance ID, added to instance_ids.
+            chunk_size (int): The maximum number of instances per AWS request (at most 1000).
+            max_parallel (int): The maximum number of AWS requests in flight.
+            fail_on_partial (bool): Fail the step if any instance failed. If False, failures are
+                                    only reported per instance.
+
+        Returns:
+            Dict[str, Any]: The per-instance results with the lists of succeeded and failed IDs, or an error.
+        """
+        final_instance_ids = list(instance_ids or [])
+        if instance_id:
+            final_instance_ids.append(instance_id)
+        if not final_instance_ids:
+            return {"error": "Either 'instance_id' or 'instance_ids' must be provided."}
+
+        self.logger.info(f"Executing {self.name} for {len(final_instance_ids)} instances")
+        try:
+            results = self.adapter.bulk_change_instance_state(
+                self.action,
+                final_instance_ids,
+                chunk_size=min(max(1, int(chunk_size)), BULK_MAX_CHUNK_SIZE),
+                max_parallel=max(1, int(max_parallel)),
+            )
+            return _summarize_bulk_results(self.action, results, _as_bool(fail_on_partial))
+        except Exception as e:
+            self.logger.error(f"Failed to {self.action} instances: {e}")
+            return {"error": str(e)}
+
+
+class BulkStartInstancesTool(BulkInstanceStateTool):
+    """
+    Tool to start a fleet of EC2 instances.
+    """
+    action = "start"
+
+    def __init__(self, logger, adapter: EC2Adapter):
+        super().__init__(logger, adapter)
+        self.name = "bulk-start-instances"
+        self.description = "Starts many EC2 instances in parallel chunks and reports the result per instance."
+
+
+class BulkStopInstancesTool(BulkInstanceStateTool):
+    """
+    Tool to stop a fleet of EC2 instances.
+    """
+    action = "stop"
+
+    def __init__(self, logger, adapter: EC2Adapter):
+        super().__init__(logger, adapter)
+        self.name = "bulk-stop-instances"
+        self.description = "Stops many EC2 instances in parallel chunks and reports the result per instance."
+
+
+class BulkTerminateInstancesTool(BulkInstanceStateTool):
+    """
+    Tool to terminate a fleet of EC2 instances.
+    """
+    action = "terminate"
+
+    def __init__(self, logger, adapter: EC2Adapter):
+        super().__init__(logger, adapter)
+        self.name = "bulk-terminate-instances"
+        self.description = "Terminates many EC2 instances in parallel chunks and reports the result per instance."
+
+
+class BulkTagResourcesTool(BaseTool):
+    """
+    Tool to tag many EC2 resources in one step.
+    """
+
+    def __init__(self, logger, adapter: EC2Adapter):
+        super().__init__(logger, adapter)
+        self.name = "bulk-tag-resources"
+        self.description = "Adds or overwrites tags on many EC2 resources (instances, volumes, VPCs, ...) in parallel chunks."
+
+    def execute(self, resource_ids: List[str], tags: Any, chunk_size: int = BULK_DEFAULT_CHUNK_SIZE,
+                max_parallel: int = BULK_DEFAULT_PARALLELISM, fail_on_partial: bool = True, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the bulk tagging.
+
+        Args:
+            resource_ids (List[str]): The IDs of the resources to tag.
+            tags (Any): The tags, either as {'Key': 'Value'} or as [{'Key': ..., 'Value': ...}].
+            chunk_size (int): The maximum number of resources per AWS request (at most 1000).
+            max_parallel (int): The maximum number of AWS requests in flight.
+            fail_on_partial (bool): Fail the step if any resource failed.
+
+        Returns:
+            Dict[str, Any]: The per-resource results with the lists of succeeded and failed IDs, or an error.
+        """
+        if isinstance(tags, dict):
+            tags = [{"Key": str(k), "Value": str(v)} for k, v in tags.items()]
+        if not resource_ids or not tags:
+            return {"error": "Both 'resource_ids' and 'tags' must be provided."}
+
+        self.logger.info(f"Executing {self.name} for {len(resource_ids)} resources")
+        try:
+            results = self.adapter.bulk_tag_resources(
+                resource_ids,
+                tags,
+                chunk_size=min(max(1, int(chunk_size)), BULK_MAX_CHUNK_SIZE),
+                max_parallel=max(1, int(max_parallel)),
+            )
+            return _summarize_bulk_results("tag", results, _as_bool(fail_on_partial))
+        except Exception as e:
+            self.logger.error(f"Failed to tag resources: {e}")
+            return {"error": str(e)}
@@ -56,3 +56,35 @@ class CreateLoadBalancerTool(BaseTool):
         except Exception as e:
             self.logger.error(f"Failed to create load balancer: {e}")
             return {"error": str(e)}
+
+
+class DeleteLoadBalancerTool(BaseTool):
+    """
+    Tool to delete an Application or Network Load Balancer.
+    """
+
+    def __init__(self, logger: logger, adapter: ElbAdapter):
+        """
+        Initializes the DeleteLoadBalancerTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "delete-load-balancer"
+        self.description = "Deletes an Application or Network Load Balancer by its ARN."
+
+    def execute(self, load_balancer_arn: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete a load balancer.
+
+        Args:
+            load_balancer_arn (str): The ARN of the load balancer.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Executing DeleteLoadBalancerTool for LB: {load_balancer_arn}")
+        try:
+            self.adapter.delete_load_balancer(load_balancer_arn=load_balancer_arn)
+            return {"success": True, "load_balancer_arn": load_balancer_arn}
+        except Exception as e:
+            self.logger.error(f"Failed to delete load balancer {load_balancer_arn}: {e}")
+            return {"error": str(e)}
@@ -20,11 +20,16 @@ class CreateKeyPairTool(BaseTool):
         self.name = "create-key-pair"
         self.description = "Create a new EC2 key pair for SSH access. Returns the private key material which should be saved immediately as it cannot be retrieved later."
 
-    def execute(self, **kwargs) -> Dict[str, Any]:
+    def execute(self, key_name: str, **kwargs) -> Dict[str, Any]:
         """
         Executes the tool to create a key pair.
+
+        Args:
+            key_name (str): The name of the key pair.
+
+        Returns:
+            Dict[str, Any]: The key name and the private key material.
         """
-        key_name = kwargs.get("key_name")
         if not key_name:
             raise ValueError("key_name is a required argument.")
 
@@ -55,3 +60,35 @@ class ListKeyPairsTool(BaseTool):
         self.logger.info("Executing ListKeyPairsTool")
         # This now calls the method on KeyPairAdapter
         return self.adapter.list_key_pairs()
+
+
+class DeleteKeyPairTool(BaseTool):
+    """
+    Tool to delete an EC2 key pair.
+    """
+
+    def __init__(self, logger: logger, adapter: KeyPairAdapter):
+        """
+        Initializes the DeleteKeyPairTool.
+        """
+        super().__init__(logger=logger, adapter=adapter)
+        self.name = "delete-key-pair"
+        self.description = "Deletes an EC2 key pair by name."
+
+    def execute(self, key_name: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete a key pair.
+
+        Args:
+            key_name (str): The name of the key pair to delete.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Deleting key pair '{key_name}'...")
+        try:
+            self.adapter.delete_key_pair(key_name=key_name)
+            return {"success": True, "key_name": key_name}
+        except Exception as e:
+            self.logger.error(f"Failed to delete key pair '{key_name}': {e}")
+            return {"error": str(e)}
@@ -37,6 +37,17 @@ class ListRDSInstancesTool(BaseTool):
             self.logger.error(f"Failed to list RDS instances: {e}")
             return {"error": str(e)}
 
+    async def aexecute(self, db_instance_identifier: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Lists RDS instances without blocking the event loop.
+        """
+        self.logger.info(f"Executing ListRDSInstancesTool for identifier: {db_instance_identifier}")
+        try:
+            return await self.adapter.adescribe_db_instances(db_instance_identifier=db_instance_identifier)
+        except Exception as e:
+            self.logger.error(f"Failed to list RDS instances: {e}")
+            return {"error": str(e)}
+
 
 class ListDbSubnetGroupsTool(BaseTool):
     """
@@ -69,6 +80,17 @@ class ListDbSubnetGroupsTool(BaseTool):
             self.logger.error(f"Failed to list DB subnet groups: {e}")
             return {"error": str(e)}
 
+    async def aexecute(self, db_subnet_group_name: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Lists DB subnet groups without blocking the event loop.
+        """
+        self.logger.info(f"Executing ListDbSubnetGroupsTool for name: {db_subnet_group_name}")
+        try:
+            return await self.adapter.adescribe_db_subnet_groups(db_subnet_group_name=db_subnet_group_name)
+        except Exception as e:
+            self.logger.error(f"Failed to list DB subnet groups: {e}")
+            return {"error": str(e)}
+
 
 class CreateDbSubnetGroupTool(BaseTool):
     """
@@ -173,3 +195,72 @@ class CreateDbInstanceTool(BaseTool):
         except Exception as e:
             self.logger.error(f"Failed to create DB instance: {e}")
             return {"error": str(e)}
+
+
+class DeleteDbInstanceTool(BaseTool):
+    """
+    Tool to delete an RDS DB instance.
+    """
+
+    def __init__(self, logger: logger, adapter: RdsAdapter):
+        """
+        Initializes the DeleteDbInstanceTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "delete-db-instance"
+        self.description = "Deletes an RDS DB instance."
+
+    def execute(self, db_instance_identifier: str, skip_final_snapshot: bool = True, wait: bool = False, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete a DB instance.
+
+        Args:
+            db_instance_identifier (str): The DB instance identifier.
+            skip_final_snapshot (bool): Whether to skip the final DB snapshot. Defaults to True.
+            wait (bool): Whether to block until the instance is deleted. Defaults to False.
+
+        Returns:
+            Dict[str, Any]: The details of the DB instance being deleted, or an error.
+        """
+        self.logger.info(f"Executing DeleteDbInstanceTool for instance: {db_instance_identifier}")
+        try:
+            return self.adapter.delete_db_instance(
+                db_instance_identifier=db_instance_identifier,
+                skip_final_snapshot=skip_final_snapshot,
+                wait=wait,
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to delete DB instance {db_instance_identifier}: {e}")
+            return {"error": str(e)}
+
+
+class DeleteDbSubnetGroupTool(BaseTool):
+    """
+    Tool to delete an RDS DB subnet group.
+    """
+
+    def __init__(self, logger: logger, adapter: RdsAdapter):
+        """
+        Initializes the DeleteDbSubnetGroupTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "delete-db-subnet-group"
+        self.description = "Deletes an RDS DB subnet group that is not used by any DB instance."
+
+    def execute(self, db_subnet_group_name: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete a DB subnet group.
+
+        Args:
+            db_subnet_group_name (str): The name of the DB subnet group.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Executing DeleteDbSubnetGroupTool for group: {db_subnet_group_name}")
+        try:
+            self.adapter.delete_db_subnet_group(db_subnet_group_name=db_subnet_group_name)
+            return {"success": True, "db_subnet_group_name": db_subnet_group_name}
+        except Exception as e:
+            self.logger.error(f"Failed to delete DB subnet group {db_subnet_group_name}: {e}")
+            return {"error": str(e)}
@@ -69,3 +69,35 @@ class CreateS3BucketTool(BaseTool):
         except Exception as e:
             self.logger.error(f"Failed to create S3 bucket: {e}")
             return {"error": str(e)}
+
+
+class DeleteS3BucketTool(BaseTool):
+    """
+    Tool to delete an empty S3 bucket.
+    """
+
+    def __init__(self, logger: logger, adapter: S3Adapter):
+        """
+        Initializes the DeleteS3BucketTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "delete-s3-bucket"
+        self.description = "Deletes an empty S3 bucket."
+
+    def execute(self, bucket_name: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete an S3 bucket.
+
+        Args:
+            bucket_name (str): The name of the S3 bucket.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Executing DeleteS3BucketTool for bucket: {bucket_name}")
+        try:
+            self.adapter.delete_bucket(bucket_name=bucket_name)
+            return {"success": True, "bucket_name": bucket_name}
+        except Exception as e:
+            self.logger.error(f"Failed to delete S3 bucket '{bucket_name}': {e}")
+            return {"error": str(e)}
@@ -5,6 +5,32 @@ from ai_infra_agent.infrastructure.aws.adapters.security_group import SecurityGr
 from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
 
 
+def _rules_to_ip_permissions(rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Converts a list of rules in the single-rule tool format (protocol, from_port, to_port, cidr_block)
+    into IpPermissions entries, folding rules with the same protocol and port range into one entry
+    with several IpRanges.
+    """
+    permissions: Dict[tuple, Dict[str, Any]] = {}
+    for rule in rules:
+        protocol = rule.get("protocol")
+        cidr_block = rule.get("cidr_block")
+        if not protocol or not cidr_block:
+            raise ValueError(f"Each rule requires 'protocol' and 'cidr_block': {rule}")
+        from_port = rule.get("from_port")
+        to_port = rule.get("to_port")
+        key = (protocol, from_port, to_port)
+        if key not in permissions:
+            permission = {"IpProtocol": protocol, "IpRanges": []}
+            if from_port is not None and to_port is not None:
+                permission["FromPort"] = from_port
+                permission["ToPort"] = to_port
+            permissions[key] = permission
+        if not any(r["CidrIp"] == cidr_block for r in permissions[key]["IpRanges"]):
+            permissions[key]["IpRanges"].append({"CidrIp": cidr_block})
+    return list(permissions.values())
+
+
 class CreateSecurityGroupTool(BaseTool):
     """
     Tool to create a new EC2 security group.
@@ -88,6 +114,43 @@ class AddSecurityGroupIngressRuleTool(BaseTool):
             return {"error": str(e)}
 
 
+class AddSecurityGroupIngressRulesTool(BaseTool):
+    """
+    Tool to add several ingress rules to an existing EC2 security group in one API call.
+    """
+
+    def __init__(self, logger: logger, adapter: SecurityGroupAdapter):
+        """
+        Initializes the AddSecurityGroupIngressRulesTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "add-security-group-ingress-rules"
+        self.description = "Adds several ingress rules to an existing EC2 security group in a single request."
+
+    def execute(self, group_id: str, rules: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to add ingress rules.
+
+        Args:
+            group_id (str): The ID of the security group.
+            rules (List[Dict[str, Any]]): The rules to add. Each rule has 'protocol', 'from_port',
+                                          'to_port' and 'cidr_block', like add-security-group-ingress-rule.
+
+        Returns:
+            Dict[str, Any]: The response from the authorize_security_group_ingress call.
+        """
+        self.logger.info(f"Adding {len(rules)} ingress rule(s) to security group '{group_id}'...")
+        try:
+            response = self.adapter.add_security_group_ingress_rules(
+                group_id=group_id,
+                ip_permissions=_rules_to_ip_permissions(rules)
+            )
+            return {"success": True, "response": response}
+        except Exception as e:
+            self.logger.error(f"Failed to add ingress rules to security group '{group_id}': {e}")
+            return {"error": str(e)}
+
+
 class ListSecurityGroupsTool(BaseTool):
     """
     Tool to list all EC2 security groups, optionally filtered by a list of group IDs.
@@ -113,34 +176,46 @@ class ListSecurityGroupsTool(BaseTool):
         """
         self.logger.info("Listing security groups...")
         try:
-            response = self.adapter.list_security_groups()
-            all_security_groups = response.get("SecurityGroups", [])
-
-            if vpc_id:
-                filtered_security_groups = [sg for sg in all_security_groups if sg.get("VpcId") == vpc_id]
-            else:
-                filtered_security_groups = all_security_groups
-
-            # We need to serialize the response to be JSON-friendly
-            result = [
-                {
-                    "group_id": sg.get("GroupId"),
-                    "group_name": sg.get("GroupName"),
-                    "description": sg.get("Description"),
-                    "vpc_id": sg.get("VpcId"),
-                    "ingress_rules": sg.get("IpPermissions", []),
-                    "egress_rules": sg.get("IpPermissionsEgress", []),
-                }
-                for sg in filtered_security_groups
-            ]
-
-            self.logger.info(f"Found {len(result)} security groups.")
-            return {"security_groups": result}
+            return self._format(self.adapter.list_security_groups(), vpc_id)
+        except Exception as e:
+            self.logger.error(f"Failed to list security groups: {e}")
+            return {"error": str(e)}
 
+    async def aexecute(self, vpc_id: str = None, **kwargs) -> Dict[str, Any]:
+        """
+        Lists security groups without blocking the event loop.
+        """
+        self.logger.info("Listing security groups...")
+        try:
+            return self._format(await self.adapter.alist_security_groups(), vpc_id)
         except Exception as e:
             self.logger.error(f"Failed to list security groups: {e}")
             return {"error": str(e)}
 
+    def _format(self, response: Dict[str, Any], vpc_id: str = None) -> Dict[str, Any]:
+        all_security_groups = response.get("SecurityGroups", [])
+
+        if vpc_id:
+            filtered_security_groups = [sg for sg in all_security_groups if sg.get("VpcId") == vpc_id]
+        else:
+            filtered_security_groups = all_security_groups
+
+        # We need to serialize the response to be JSON-friendly
+        result = [
+            {
+                "group_id": sg.get("GroupId"),
+                "group_name": sg.get("GroupName"),
+                "description": sg.get("Description"),
+                "vpc_id": sg.get("VpcId"),
+                "ingress_rules": sg.get("IpPermissions", []),
+                "egress_rules": sg.get("IpPermissionsEgress", []),
+            }
+            for sg in filtered_security_groups
+        ]
+
+        self.logger.info(f"Found {len(result)} security groups.")
+        return {"security_groups": result}
+
 
 class AddSecurityGroupEgressRuleTool(BaseTool):
     """
@@ -185,6 +260,43 @@ class AddSecurityGroupEgressRuleTool(BaseTool):
             return {"error": str(e)}
 
 
+class AddSecurityGroupEgressRulesTool(BaseTool):
+    """
+    Tool to add several egress rules to an existing EC2 security group in one API call.
+    """
+
+    def __init__(self, logger: logger, adapter: SecurityGroupAdapter):
+        """
+        Initializes the AddSecurityGroupEgressRulesTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "add-security-group-egress-rules"
+        self.description = "Adds several egress rules to an existing EC2 security group in a single request."
+
+    def execute(self, group_id: str, rules: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to add egress rules.
+
+        Args:
+            group_id (str): The ID of the security group.
+            rules (List[Dict[str, Any]]): The rules to add. Each rule has 'protocol', 'cidr_block' and
+                                          optionally 'from_port' and 'to_port', like add-security-group-egress-rule.
+
+        Returns:
+            Dict[str, Any]: The response from the authorize_security_group_egress call.
+        """
+        self.logger.info(f"Adding {len(rules)} egress rule(s) to security group '{group_id}'...")
+        try:
+            response = self.adapter.add_security_group_egress_rules(
+                group_id=group_id,
+                ip_permissions=_rules_to_ip_permissions(rules)
+            )
+            return {"success": True, "response": response}
+        except Exception as e:
+            self.logger.error(f"Failed to add egress rules to security group '{group_id}': {e}")
+            return {"error": str(e)}
+
+
 class DeleteSecurityGroupTool(BaseTool):
     """
     Tool to delete an EC2 security group.
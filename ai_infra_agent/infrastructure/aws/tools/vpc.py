@@ -118,24 +118,37 @@ class ListVpcsTool(BaseTool):
         """
         self.logger.info("Executing ListVpcsTool...")
         try:
-            response = self.adapter.list_vpcs()
-            # Basic formatting, can be enhanced later
-            vpcs = response.get('Vpcs', [])
-            formatted_vpcs = [
-                {
-                    "vpc_id": vpc.get("VpcId"),
-                    "is_default": vpc.get("IsDefault"),
-                    "cidr_block": vpc.get("CidrBlock"),
-                    "state": vpc.get("State"),
-                    "tags": vpc.get("Tags", [])
-                }
-                for vpc in vpcs
-            ]
-            return {"vpcs": formatted_vpcs}
+            return self._format(self.adapter.list_vpcs())
         except Exception as e:
             self.logger.error(f"Failed to list VPCs: {e}")
             return {"error": str(e)}
 
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        """
+        Lists VPCs without blocking the event loop.
+        """
+        self.logger.info("Executing ListVpcsTool...")
+        try:
+            return self._format(await self.adapter.alist_vpcs())
+        except Exception as e:
+            self.logger.error(f"Failed to list VPCs: {e}")
+            return {"error": str(e)}
+
+    def _format(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        # Basic formatting, can be enhanced later
+        vpcs = response.get('Vpcs', [])
+        formatted_vpcs = [
+            {
+                "vpc_id": vpc.get("VpcId"),
+                "is_default": vpc.get("IsDefault"),
+                "cidr_block": vpc.get("CidrBlock"),
+                "state": vpc.get("State"),
+                "tags": vpc.get("Tags", [])
+            }
+            for vpc in vpcs
+        ]
+        return {"vpcs": formatted_vpcs}
+
 class CreateVpcTool(BaseTool):
     """
     Tool to create a new VPC.
@@ -293,23 +306,21 @@ class CreatePublicSubnetTool(BaseTool):
         self.name = "create-public-subnet"
         self.description = "Creates a new public subnet in a VPC and enables auto-assign public IP."
 
-    def execute(self, vpc_id: str, cidr_block: str, name: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+    def execute(self, vpc_id: str, cidr_block: str, availability_zone: str, name: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
         Executes the tool to create a public subnet.
 
         Args:
             vpc_id (str): The ID of the VPC to create the subnet in.
             cidr_block (str): The CIDR block for the subnet.
+            availability_zone (str): The Availability Zone for the subnet.
             name (Optional[str]): A name tag for the subnet.
-            availability_zone (str): The Availability Zone for the subnet (passed via kwargs).
 
         Returns:
             Dict[str, Any]: A dictionary containing the details of the created subnet.
         """
         self.logger.info(f"Executing tool: {self.name}")
-        
-        # Extract availability_zone from kwargs, as it's a required parameter for the adapter
-        availability_zone = kwargs.get("availability_zone")
+
         if not availability_zone:
             raise ValueError("availability_zone is a required parameter for creating a public subnet.")
 
@@ -336,4 +347,119 @@ class CreatePublicSubnetTool(BaseTool):
             return {"subnet_id": subnet_id, "details": subnet_response}
         except Exception as e:
             self.logger.error(f"Failed to create public subnet: {e}")
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
+
+class DeleteVpcTool(BaseTool):
+    """
+    Tool to delete a VPC.
+    """
+
+    def __init__(self, logger: logger, adapter: VpcAdapter):
+        """
+        Initializes the DeleteVpcTool.
+        """
+        super().__init__(logger, adapter)
+        self.name = "delete-vpc"
+        self.description = "Deletes a VPC. Its subnets, gateways and security groups must be deleted first."
+
+    def execute(self, vpc_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete a VPC.
+
+        Args:
+            vpc_id (str): The ID of the VPC to delete.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Executing DeleteVpcTool for VPC: {vpc_id}")
+        try:
+            self.adapter.delete_vpc(vpc_id=vpc_id)
+            return {"success": True, "vpc_id": vpc_id}
+        except Exception as e:
+            self.logger.error(f"Failed to delete VPC {vpc_id}: {e}")
+            return {"error": str(e)}
+
+class DetachInternetGatewayTool(BaseTool):
+    """
+    Tool to detach an Internet Gateway from a VPC.
+    """
+
+    def __init__(self, logger: logger, adapter: VpcAdapter):
+        super().__init__(logger, adapter)
+        self.name = "detach-internet-gateway"
+        self.description = "Detaches an Internet Gateway from a VPC."
+
+    def execute(self, internet_gateway_id: str, vpc_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to detach an Internet Gateway.
+
+        Args:
+            internet_gateway_id (str): The ID of the Internet Gateway.
+            vpc_id (str): The ID of the VPC.
+
+        Returns:
+            Dict[str, Any]: A status dictionary or an error.
+        """
+        self.logger.info(f"Executing DetachInternetGatewayTool for IGW {internet_gateway_id} and VPC {vpc_id}")
+        try:
+            return self.adapter.detach_internet_gateway(internet_gateway_id=internet_gateway_id, vpc_id=vpc_id)
+        except Exception as e:
+            self.logger.error(f"Failed to detach Internet Gateway {internet_gateway_id}: {e}")
+            return {"error": str(e)}
+
+class DeleteInternetGatewayTool(BaseTool):
+    """
+    Tool to delete an Internet Gateway.
+    """
+
+    def __init__(self, logger: logger, adapter: VpcAdapter):
+        super().__init__(logger, adapter)
+        self.name = "delete-internet-gateway"
+        self.description = "Deletes an Internet Gateway that is not attached to a VPC."
+
+    def execute(self, internet_gateway_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete an Internet Gateway.
+
+        Args:
+            internet_gateway_id (str): The ID of the Internet Gateway.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Executing DeleteInternetGatewayTool for IGW: {internet_gateway_id}")
+        try:
+            self.adapter.delete_internet_gateway(internet_gateway_id=internet_gateway_id)
+            return {"success": True, "internet_gateway_id": internet_gateway_id}
+        except Exception as e:
+            self.logger.error(f"Failed to delete Internet Gateway {internet_gateway_id}: {e}")
+            return {"error": str(e)}
+
+class DeleteSubnetTool(BaseTool):
+    """
+    Tool to delete a subnet.
+    """
+
+    def __init__(self, logger: logger, adapter: VpcAdapter):
+        super().__init__(logger, adapter)
+        self.name = "delete-subnet"
+        self.description = "Deletes a subnet that has no running resources."
+
+    def execute(self, subnet_id: str, **kwargs) -> Dict[str, Any]:
+        """
+        Executes the tool to delete a subnet.
+
+        Args:
+            subnet_id (str): The ID of the subnet.
+
+        Returns:
+            Dict[str, Any]: A success message or an error.
+        """
+        self.logger.info(f"Executing DeleteSubnetTool for subnet: {subnet_id}")
+        try:
+            self.adapter.delete_subnet(subnet_id=subnet_id)
+            return {"success": True, "subnet_id": subnet_id}
+        except Exception as e:
+            self.logger.error(f"Failed to delete subnet {subnet_id}: {e}")
+            return {"error": str(e)}
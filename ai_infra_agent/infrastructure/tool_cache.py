@@ -0,0 +1,170 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Set, Tuple
+
+from ai_infra_agent.infrastructure.aws.client_pool import credential_fingerprint
+from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
+
+
+def cache_scope(aws_config: Dict[str, Any]) -> Tuple[str, str]:
+    """Returns the (credential fingerprint, region) a cached result belongs to."""
+    return credential_fingerprint(aws_config), aws_config.get("region") or ""
+
+
+def normalize_params(params: Dict[str, Any]) -> str:
+    """
+    Returns a canonical form of tool parameters, so calls differing only in key order,
+    list order of ID filters, or parameters left at None share a cache entry.
+    """
+    def normalize(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {k: normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple, set)):
+            items = [normalize(v) for v in value]
+            if all(isinstance(v, (str, int, float)) for v in items):
+                return sorted(items, key=str)
+            return items
+        return value
+
+    return json.dumps(normalize(params), sort_keys=True, default=str)
+
+
+class ToolResultCache:
+    """
+    A bounded, thread-safe cache of read-only tool results.
+
+    Entries are keyed by the user's credential fingerprint, the region, the tool name and
+    its normalized parameters, and expire after the TTL of their tool. Each entry carries
+    tags naming the kind of resource it describes (e.g. 'subnets'), so a mutating tool can
+    invalidate every cached lookup of that kind for the same user and region.
+    """
+
+    CacheKey = Tuple[Tuple[str, str], str, str]  # scope, tool_name, normalized params
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Args:
+            max_entries (int): The maximum number of cached results; the least recently used are evicted first.
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[ToolResultCache.CacheKey, Tuple[Any, float, Set[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """Returns (True, a copy of the result) on a hit, or (False, None)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[0]
+        # Callers may mutate results (e.g. when resolving placeholders), so they get their own copy.
+        return True, copy.deepcopy(result)
+
+    def put(self, key: CacheKey, result: Any, ttl_seconds: float, tags: Iterable[str] = ()) -> None:
+        """Caches a copy of a result for ttl_seconds."""
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = (stored, time.monotonic() + ttl_seconds, set(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, scope: Tuple[str, str], tags: Iterable[str]) -> int:
+        """
+        Drops the cached results of a user and region that carry any of the given tags.
+
+        Returns:
+            int: The number of entries dropped.
+        """
+        tags = set(tags)
+        with self._lock:
+            stale = [key for key, (_, _, entry_tags) in self._entries.items() if key[0] == scope and entry_tags & tags]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses,
+                    "invalidations": self.invalidations}
+
+
+class CachedTool(BaseTool):
+    """
+    Wraps a tool so that its results are served from a ToolResultCache (read-only tools),
+    or so that it invalidates cached results after it succeeds (mutating tools).
+    """
+
+    def __init__(self, tool: BaseTool, cache: ToolResultCache, tool_name: str, scope: Tuple[str, str],
+                 ttl_seconds: Optional[float] = None, tags: Iterable[str] = (), invalidates: Iterable[str] = ()):
+        """
+        Args:
+            tool (BaseTool): The wrapped tool.
+            cache (ToolResultCache): The shared result cache.
+            tool_name (str): The registered name of the tool.
+            scope (Tuple[str, str]): The user's (credential fingerprint, region).
+            ttl_seconds (float, optional): How long results are cached. None means results are not cached.
+            tags (Iterable[str]): The kinds of resources the cached results describe.
+            invalidates (Iterable[str]): The kinds of resources whose cached results this tool makes stale.
+        """
+        super().__init__(tool.logger, tool.adapter)
+        self.tool = tool
+        self.cache = cache
+        self.name = tool.name
+        self.description = tool.description
+        self.tool_name = tool_name
+        self.scope = scope
+        self.ttl_seconds = ttl_seconds
+        self.tags = tuple(tags)
+        self.invalidates = tuple(invalidates)
+
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        key = self._key(kwargs)
+        if key is not None:
+            hit, result = self.cache.get(key)
+            if hit:
+                self.logger.debug(f"Serving '{self.tool_name}' from the tool result cache.")
+                return result
+        return self._finish(key, self.tool.execute(**kwargs))
+
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        key = self._key(kwargs)
+        if key is not None:
+            hit, result = self.cache.get(key)
+            if hit:
+                self.logger.debug(f"Serving '{self.tool_name}' from the tool result cache.")
+                return result
+        return self._finish(key, await self.tool.aexecute(**kwargs))
+
+    def _key(self, params: Dict[str, Any]) -> Optional[ToolResultCache.CacheKey]:
+        if self.ttl_seconds is None:
+            return None
+        return self.scope, self.tool_name, normalize_params(params)
+
+    def _finish(self, key: Optional[ToolResultCache.CacheKey], result: Any) -> Any:
+        """Caches a successful read, or invalidates after a successful mutation. Errors are never cached."""
+        if isinstance(result, dict) and "error" in result:
+            return result
+        if key is not None:
+            self.cache.put(key, result, self.ttl_seconds, self.tags)
+        if self.invalidates:
+            dropped = self.cache.invalidate(self.scope, self.invalidates)
+            if dropped:
+                self.logger.debug(f"'{self.tool_name}' invalidated {dropped} cached result(s).")
+        return result
@@ -1,4 +1,4 @@
-from typing import Dict, List, Any, Type, Tuple
+from typing import Dict, List, Any, Optional, Type, Tuple
 from loguru import logger
 
 # Adapter Imports (these are now just class references)
@@ -9,20 +9,28 @@ from ai_infra_agent.infrastructure.aws.adapters.rds import RdsAdapter
 from ai_infra_agent.infrastructure.aws.adapters.security_group import SecurityGroupAdapter
 from ai_infra_agent.infrastructure.aws.adapters.elb import ElbAdapter
 from ai_infra_agent.infrastructure.aws.adapters.s3 import S3Adapter
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
+from ai_infra_agent.infrastructure.tool_cache import CachedTool, ToolResultCache, cache_scope
 
 # Tool Imports (these are now just class references)
 from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
 from ai_infra_agent.infrastructure.aws.tools.ec2 import (
     CreateEC2InstanceTool,
+    LaunchEC2FleetTool,
     ListEC2InstancesTool,
     TerminateEC2InstanceTool,
     StartInstanceTool,
     StopInstanceTool,
     CreateVolumeTool,
+    DeleteVolumeTool,
     ListAvailabilityZonesTool,
+    BulkStartInstancesTool,
+    BulkStopInstancesTool,
+    BulkTerminateInstancesTool,
+    BulkTagResourcesTool,
 )
-from ai_infra_agent.infrastructure.aws.tools.ami import GetLatestAmazonLinuxAMITool, GetLatestUbuntuAmiTool
-from ai_infra_agent.infrastructure.aws.tools.keypair import CreateKeyPairTool, ListKeyPairsTool
+from ai_infra_agent.infrastructure.aws.tools.ami import GetLatestAmazonLinuxAMITool, GetLatestUbuntuAmiTool, GetLatestAmiTool
+from ai_infra_agent.infrastructure.aws.tools.keypair import CreateKeyPairTool, ListKeyPairsTool, DeleteKeyPairTool
 from ai_infra_agent.infrastructure.aws.tools.vpc import (
     GetDefaultVPCTool,
     ListSubnetsTool,
@@ -32,18 +40,31 @@ from ai_infra_agent.infrastructure.aws.tools.vpc import (
     CreateInternetGatewayTool,
     AttachInternetGatewayTool,
     CreatePublicSubnetTool,
+    DeleteVpcTool,
+    DetachInternetGatewayTool,
+    DeleteInternetGatewayTool,
+    DeleteSubnetTool,
+)
+from ai_infra_agent.infrastructure.aws.tools.rds import (
+    ListRDSInstancesTool,
+    CreateDbSubnetGroupTool,
+    CreateDbInstanceTool,
+    ListDbSubnetGroupsTool,
+    DeleteDbInstanceTool,
+    DeleteDbSubnetGroupTool,
 )
-from ai_infra_agent.infrastructure.aws.tools.rds import ListRDSInstancesTool, CreateDbSubnetGroupTool, CreateDbInstanceTool, ListDbSubnetGroupsTool
 from ai_infra_agent.infrastructure.aws.tools.security_group import (
     CreateSecurityGroupTool,
     AddSecurityGroupIngressRuleTool,
     ListSecurityGroupsTool,
     AddSecurityGroupEgressRuleTool,
+    AddSecurityGroupIngressRulesTool,
+    AddSecurityGroupEgressRulesTool,
     DeleteSecurityGroupTool,
     GetSecurityGroupRulesTool,
 )
-from ai_infra_agent.infrastructure.aws.tools.elb import CreateLoadBalancerTool
-from ai_infra_agent.infrastructure.aws.tools.s3 import CreateS3BucketTool
+from ai_infra_agent.infrastructure.aws.tools.elb import CreateLoadBalancerTool, DeleteLoadBalancerTool
+from ai_infra_agent.infrastructure.aws.tools.s3 import CreateS3BucketTool, DeleteS3BucketTool
 
 
 class ToolFactory:
@@ -57,14 +78,23 @@ class ToolFactory:
     # Type alias for the tool registry entry
     ToolRegistryEntry = Tuple[Type[BaseTool], Type[Any], str, str] # ToolClass, AdapterClass, service_name, description
 
-    def __init__(self, logger: logger):
+    def __init__(self, logger: logger, result_cache: Optional[ToolResultCache] = None):
         """
         Initializes the ToolFactory and registers all available tool classes.
+
+        Args:
+            logger: The logger instance.
+            result_cache (ToolResultCache, optional): Cache for the results of read-only tools.
+                                                      If None, every call goes to AWS.
         """
         self.logger = logger
+        self.result_cache = result_cache
         self._tool_registry: Dict[str, ToolRegistryEntry] = {}
+        self._read_only_tools: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+        self._invalidations: Dict[str, Tuple[str, ...]] = {}
         self.logger.info("ToolFactory initialized. Registering tool classes...")
         self._init_tool_registry()
+        self._init_cache_policies()
 
     def _init_tool_registry(self):
         """
@@ -73,20 +103,28 @@ class ToolFactory:
         """
         # --- EC2 Tools ---
         self._register_tool_class("create-ec2-instance", CreateEC2InstanceTool, EC2Adapter, "ec2", "Creates a new EC2 instance.")
+        self._register_tool_class("launch-ec2-fleet", LaunchEC2FleetTool, EC2Adapter, "ec2", "Launches many identical EC2 instances in one step, spread across Availability Zones.")
         self._register_tool_class("list-ec2-instances", ListEC2InstancesTool, EC2Adapter, "ec2", "Lists EC2 instances.")
         self._register_tool_class("terminate-ec2-instance", TerminateEC2InstanceTool, EC2Adapter, "ec2", "Terminates one or more EC2 instances.")
         self._register_tool_class("start-ec2-instance", StartInstanceTool, EC2Adapter, "ec2", "Starts an EC2 instance.")
         self._register_tool_class("stop-instance", StopInstanceTool, EC2Adapter, "ec2", "Stops one or more EC2 instances.")
         self._register_tool_class("create-volume", CreateVolumeTool, EC2Adapter, "ec2", "Creates a new EBS volume.")
+        self._register_tool_class("delete-volume", DeleteVolumeTool, EC2Adapter, "ec2", "Deletes an EBS volume.")
         self._register_tool_class("list-availability-zones", ListAvailabilityZonesTool, EC2Adapter, "ec2", "Lists all Availability Zones.")
+        self._register_tool_class("bulk-start-instances", BulkStartInstancesTool, EC2Adapter, "ec2", "Starts many EC2 instances in parallel chunks.")
+        self._register_tool_class("bulk-stop-instances", BulkStopInstancesTool, EC2Adapter, "ec2", "Stops many EC2 instances in parallel chunks.")
+        self._register_tool_class("bulk-terminate-instances", BulkTerminateInstancesTool, EC2Adapter, "ec2", "Terminates many EC2 instances in parallel chunks.")
+        self._register_tool_class("bulk-tag-resources", BulkTagResourcesTool, EC2Adapter, "ec2", "Tags many EC2 resources in parallel chunks.")
 
         # --- AMI Tools ---
         self._register_tool_class("get-latest-amazon-linux-ami", GetLatestAmazonLinuxAMITool, EC2Adapter, "ec2", "Gets the latest Amazon Linux AMI.")
         self._register_tool_class("get-latest-ubuntu-ami", GetLatestUbuntuAmiTool, EC2Adapter, "ec2", "Gets the latest Ubuntu AMI.")
+        self._register_tool_class("get-latest-ami", GetLatestAmiTool, EC2Adapter, "ec2", "Gets the latest AMI of an OS family from the AMI catalog.")
 
         # --- KeyPair Tools ---
         self._register_tool_class("create-key-pair", CreateKeyPairTool, KeyPairAdapter, "ec2", "Creates a new EC2 key pair.")
         self._register_tool_class("list-key-pairs", ListKeyPairsTool, KeyPairAdapter, "ec2", "Lists all EC2 key pairs.")
+        self._register_tool_class("delete-key-pair", DeleteKeyPairTool, KeyPairAdapter, "ec2", "Deletes an EC2 key pair.")
         
         # --- VPC Tools ---
         self._register_tool_class("get-default-vpc", GetDefaultVPCTool, VpcAdapter, "ec2", "Gets the default VPC.")
@@ -97,29 +135,73 @@ class ToolFactory:
         self._register_tool_class("create-internet-gateway", CreateInternetGatewayTool, VpcAdapter, "ec2", "Creates a new Internet Gateway.")
         self._register_tool_class("attach-internet-gateway", AttachInternetGatewayTool, VpcAdapter, "ec2", "Attaches an Internet Gateway to a VPC.")
         self._register_tool_class("create-public-subnet", CreatePublicSubnetTool, VpcAdapter, "ec2", "Creates a public subnet.")
+        self._register_tool_class("delete-vpc", DeleteVpcTool, VpcAdapter, "ec2", "Deletes a VPC.")
+        self._register_tool_class("detach-internet-gateway", DetachInternetGatewayTool, VpcAdapter, "ec2", "Detaches an Internet Gateway from a VPC.")
+        self._register_tool_class("delete-internet-gateway", DeleteInternetGatewayTool, VpcAdapter, "ec2", "Deletes an Internet Gateway.")
+        self._register_tool_class("delete-subnet", DeleteSubnetTool, VpcAdapter, "ec2", "Deletes a subnet.")
 
         # --- RDS Tools ---
         self._register_tool_class("list-rds-instances", ListRDSInstancesTool, RdsAdapter, "rds", "Lists all RDS instances.")
         self._register_tool_class("list-db-subnet-groups", ListDbSubnetGroupsTool, RdsAdapter, "rds", "Lists all RDS DB Subnet Groups.")
         self._register_tool_class("create-db-subnet-group", CreateDbSubnetGroupTool, RdsAdapter, "rds", "Creates a new DB subnet group.")
         self._register_tool_class("create-db-instance", CreateDbInstanceTool, RdsAdapter, "rds", "Creates a new DB instance.")
+        self._register_tool_class("delete-db-instance", DeleteDbInstanceTool, RdsAdapter, "rds", "Deletes a DB instance.")
+        self._register_tool_class("delete-db-subnet-group", DeleteDbSubnetGroupTool, RdsAdapter, "rds", "Deletes a DB subnet group.")
 
         # --- Security Group Tools ---
         self._register_tool_class("create-security-group", CreateSecurityGroupTool, SecurityGroupAdapter, "ec2", "Creates a new EC2 security group.")
         self._register_tool_class("add-security-group-ingress-rule", AddSecurityGroupIngressRuleTool, SecurityGroupAdapter, "ec2", "Adds an ingress rule to a security group.")
         self._register_tool_class("list-security-groups", ListSecurityGroupsTool, SecurityGroupAdapter, "ec2", "Lists all EC2 security groups.")
         self._register_tool_class("add-security-group-egress-rule", AddSecurityGroupEgressRuleTool, SecurityGroupAdapter, "ec2", "Adds an egress rule to a security group.")
+        self._register_tool_class("add-security-group-ingress-rules", AddSecurityGroupIngressRulesTool, SecurityGroupAdapter, "ec2", "Adds several ingress rules to a security group in one call.")
+        self._register_tool_class("add-security-group-egress-rules", AddSecurityGroupEgressRulesTool, SecurityGroupAdapter, "ec2", "Adds several egress rules to a security group in one call.")
         self._register_tool_class("delete-security-group", DeleteSecurityGroupTool, SecurityGroupAdapter, "ec2", "Deletes an EC2 security group.")
         self._register_tool_class("get-security-group-rules", GetSecurityGroupRulesTool, SecurityGroupAdapter, "ec2", "Retrieves the rules of a security group.")
 
         # --- ELB Tools ---
         self._register_tool_class("create-load-balancer", CreateLoadBalancerTool, ElbAdapter, "elbv2", "Creates a new Application or Network Load Balancer.")
+        self._register_tool_class("delete-load-balancer", DeleteLoadBalancerTool, ElbAdapter, "elbv2", "Deletes an Application or Network Load Balancer.")
 
         # --- S3 Tools ---
         self._register_tool_class("create-s3-bucket", CreateS3BucketTool, S3Adapter, "s3", "Creates a new S3 bucket.")
+        self._register_tool_class("delete-s3-bucket", DeleteS3BucketTool, S3Adapter, "s3", "Deletes an empty S3 bucket.")
 
         self.logger.info(f"Registered {len(self._tool_registry)} tool classes.")
 
+    def _init_cache_policies(self):
+        """
+        Marks the read-only tools whose results may be cached, with a TTL and the kinds of
+        resources they describe, and the mutating tools that make those results stale.
+        """
+        # --- Read-only tools: TTL in seconds, resource tags ---
+        self._register_read_only("list-availability-zones", 3600, ("availability-zones",))
+        self._register_read_only("get-latest-amazon-linux-ami", 3600, ("amis",))
+        self._register_read_only("get-latest-ubuntu-ami", 3600, ("amis",))
+        self._register_read_only("get-latest-ami", 3600, ("amis",))
+        self._register_read_only("get-default-vpc", 600, ("vpcs",))
+        self._register_read_only("list-key-pairs", 300, ("key-pairs",))
+        self._register_read_only("list-subnets", 300, ("subnets",))
+        self._register_read_only("list-subnets-for-alb", 300, ("subnets",))
+
+        # --- Mutating tools: resource tags they invalidate ---
+        self._register_invalidation("create-key-pair", ("key-pairs",))
+        self._register_invalidation("delete-key-pair", ("key-pairs",))
+        self._register_invalidation("create-vpc", ("vpcs", "subnets"))
+        self._register_invalidation("delete-vpc", ("vpcs", "subnets"))
+        self._register_invalidation("create-public-subnet", ("subnets",))
+        self._register_invalidation("delete-subnet", ("subnets",))
+        # Whether a subnet is public depends on the VPC's internet gateway.
+        self._register_invalidation("attach-internet-gateway", ("subnets",))
+        self._register_invalidation("detach-internet-gateway", ("subnets",))
+
+    def _register_read_only(self, name: str, ttl_seconds: float, tags: Tuple[str, ...]):
+        """Helper to mark a registered tool as read-only and cacheable."""
+        self._read_only_tools[name] = (ttl_seconds, tags)
+
+    def _register_invalidation(self, name: str, tags: Tuple[str, ...]):
+        """Helper to declare which cached resource tags a mutating tool invalidates."""
+        self._invalidations[name] = tags
+
     def _register_tool_class(self, name: str, tool_class: Type[BaseTool], adapter_class: Type[Any], service_name: str, description: str):
         """Helper to register a tool class."""
         self.logger.debug(f"Registering tool class: {name}")
@@ -138,13 +220,20 @@ class ToolFactory:
             tool_info_list.append({"name": tool_name, "description": description})
         return tool_info_list
 
-    def get_tool(self, tool_name: str, user_aws_config: Dict[str, Any]) -> BaseTool:
+    def get_tool_classes(self) -> List[Tuple[str, Type[BaseTool], str]]:
+        """Returns the name, tool class and description of every registered tool."""
+        return [(name, tool_class, description) for name, (tool_class, _, _, description) in self._tool_registry.items()]
+
+    def get_tool(self, tool_name: str, user_aws_config: Dict[str, Any],
+                 connection: Optional[AWSConnectionContext] = None) -> BaseTool:
         """
         Retrieves and instantiates a tool with user-specific AWS credentials.
 
         Args:
             tool_name (str): The name of the tool to retrieve.
             user_aws_config (Dict[str, Any]): The AWS configuration specific to the user.
+            connection (AWSConnectionContext, optional): The user's connection context, shared by every
+                                                         tool of the same plan or request.
 
         Returns:
             BaseTool: An instantiated tool configured with the user's credentials.
@@ -162,11 +251,24 @@ class ToolFactory:
 
         try:
             # Instantiate the adapter with the user's AWS config
-            adapter_instance = adapter_class(logger=self.logger, aws_config=user_aws_config)
+            adapter_instance = adapter_class(logger=self.logger, aws_config=user_aws_config, connection=connection)
             
             # Instantiate the tool with the adapter
             tool_instance = tool_class(self.logger, adapter_instance)
-            
+
+            # Route read-only tools through the result cache, and let mutating tools invalidate it
+            if self.result_cache is not None and (tool_name in self._read_only_tools or tool_name in self._invalidations):
+                ttl_seconds, tags = self._read_only_tools.get(tool_name, (None, ()))
+                tool_instance = CachedTool(
+                    tool_instance,
+                    self.result_cache,
+                    tool_name,
+                    scope=cache_scope(user_aws_config),
+                    ttl_seconds=ttl_seconds,
+                    tags=tags,
+                    invalidates=self._invalidations.get(tool_name, ()),
+                )
+
             self.logger.debug(f"Successfully created tool '{tool_name}' for user.")
             return tool_instance
         except ValueError as ve:
@@ -0,0 +1,218 @@
+import inspect
+import json
+import re
+import typing
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Type
+
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
+from ai_infra_agent.infrastructure.tool_factory import ToolFactory
+
+_JSON_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean", dict: "object", list: "array"}
+
+# Matches an entry of a Google-style "Args:" section: "name (type): description" or "name: description".
+_ARG_LINE = re.compile(r"^\s*(\*{0,2}\w+)\s*(?:\([^)]*\))?\s*:\s*(.*)$")
+
+
+def json_type(annotation: Any) -> Dict[str, Any]:
+    """
+    Converts a parameter annotation into a JSON schema fragment.
+    Unknown or missing annotations map to {}, which accepts any value.
+    """
+    if annotation is inspect.Parameter.empty or annotation is Any:
+        return {}
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if origin is typing.Union:
+        if len(args) == 1:
+            return json_type(args[0])
+        return {"anyOf": [json_type(arg) for arg in args]}
+    if origin in (list, tuple, set):
+        schema: Dict[str, Any] = {"type": "array"}
+        if args and args[0] is not Ellipsis and json_type(args[0]):
+            schema["items"] = json_type(args[0])
+        return schema
+    if origin is dict:
+        return {"type": "object"}
+    json_name = _JSON_TYPES.get(annotation)
+    return {"type": json_name} if json_name else {}
+
+
+def docstring_arg_descriptions(docstring: Optional[str]) -> Dict[str, str]:
+    """Extracts the parameter descriptions of a Google-style "Args:" section."""
+    descriptions: Dict[str, str] = {}
+    if not docstring:
+        return descriptions
+    current = None
+    in_args = False
+    args_indent = descriptions_indent = 0
+    for line in inspect.cleandoc(docstring).splitlines():
+        stripped = line.strip()
+        indent = len(line) - len(line.lstrip())
+        if stripped in ("Args:", "Arguments:", "Parameters:"):
+            in_args, args_indent, current = True, indent, None
+            continue
+        if not in_args:
+            continue
+        if stripped and indent <= args_indent:
+            # Next section (e.g. "Returns:") or the end of the Args block.
+            break
+        match = _ARG_LINE.match(line)
+        if match and (current is None or indent <= descriptions_indent):
+            current = match.group(1).lstrip("*")
+            descriptions_indent = indent
+            descriptions[current] = match.group(2).strip()
+        elif current and stripped:
+            descriptions[current] = f"{descriptions[current]} {stripped}".strip()
+    return descriptions
+
+
+def tool_parameters_schema(tool_class: Type[BaseTool]) -> Dict[str, Any]:
+    """
+    Derives the JSON schema of a tool's parameters from the signature of its execute method.
+
+    Parameters without a default are required. **kwargs is not a parameter, but it means the
+    tool tolerates parameters it does not declare.
+
+    Args:
+        tool_class (Type[BaseTool]): The tool class.
+
+    Returns:
+        Dict[str, Any]: A JSON schema object with "properties", "required" and "additionalProperties".
+    """
+    execute = tool_class.execute
+    signature = inspect.signature(execute)
+    try:
+        hints = typing.get_type_hints(execute)
+    except Exception:
+        hints = {}
+    descriptions = docstring_arg_descriptions(execute.__doc__)
+
+    properties: Dict[str, Any] = {}
+    required: List[str] = []
+    accepts_extra = False
+    for name, parameter in signature.parameters.items():
+        if name == "self":
+            continue
+        if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+            accepts_extra = True
+            continue
+        if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            continue
+        schema = dict(json_type(hints.get(name, parameter.annotation)))
+        if name in descriptions:
+            schema["description"] = descriptions[name]
+        if parameter.default is inspect.Parameter.empty:
+            required.append(name)
+        elif parameter.default is not None:
+            schema["default"] = parameter.default
+        properties[name] = schema
+    return {"type": "object", "properties": properties, "required": required, "additionalProperties": accepts_extra}
+
+
+class ToolSchemaRegistry:
+    """
+    The typed schemas of every registered tool, derived once from the tools' execute signatures.
+
+    The same schemas are used to describe the tools in the LLM prompt (serialized once and
+    reused for every request), to validate the parameters of plan steps, and to document the
+    tools over the API.
+    """
+
+    def __init__(self, logger: logger, tool_factory: ToolFactory):
+        """
+        Args:
+            logger: The logger instance.
+            tool_factory (ToolFactory): The factory whose registered tools are described.
+        """
+        self.logger = logger
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        for name, tool_class, description in tool_factory.get_tool_classes():
+            try:
+                parameters = tool_parameters_schema(tool_class)
+            except (TypeError, ValueError) as e:
+                self.logger.warning(f"Could not derive the parameter schema of tool '{name}': {e}")
+                parameters = {"type": "object", "properties": {}, "required": [], "additionalProperties": True}
+            self._schemas[name] = {"name": name, "description": description, "parameters": parameters}
+        # One compact line per tool keeps the prompt readable at about two thirds of the indented size.
+        self._serialized = "[\n" + ",\n".join(
+            json.dumps(schema, separators=(",", ":"), default=str) for schema in self._schemas.values()
+        ) + "\n]"
+        self.logger.info(f"Derived parameter schemas for {len(self._schemas)} tools.")
+
+    def schemas(self) -> List[Dict[str, Any]]:
+        """Returns the schemas of all tools, in registration order."""
+        return list(self._schemas.values())
+
+    def get(self, tool_name: str) -> Optional[Dict[str, Any]]:
+        """Returns the schema of a tool, or None if it is not registered."""
+        return self._schemas.get(tool_name)
+
+    def serialized(self) -> str:
+        """Returns the JSON form of all schemas, as injected into the prompt."""
+        return self._serialized
+
+    def validate_params(self, tool_name: str, params: Dict[str, Any]) -> List[str]:
+        """
+        Checks tool parameters against the tool's schema.
+
+        Values that are still '{{step-id.field}}' placeholders are only checked for presence,
+        since their type is known once the referenced step has run.
+
+        Args:
+            tool_name (str): The name of the tool.
+            params (Dict[str, Any]): The parameters of the call.
+
+        Returns:
+            List[str]: The problems found; empty if the parameters are valid.
+        """
+        schema = self._schemas.get(tool_name)
+        if schema is None:
+            return [f"Tool '{tool_name}' not found."]
+        parameters = schema["parameters"]
+        properties = parameters["properties"]
+        errors = [
+            f"Missing required parameter '{name}' for tool '{tool_name}'."
+            for name in parameters["required"] if params.get(name) is None
+        ]
+        for name, value in params.items():
+            if name not in properties:
+                if not parameters["additionalProperties"]:
+                    errors.append(f"Unknown parameter '{name}' for tool '{tool_name}'.")
+                continue
+            if value is None or (isinstance(value, str) and "{{" in value):
+                continue
+            if not _matches(properties[name], value):
+                errors.append(
+                    f"Parameter '{name}' of tool '{tool_name}' should be {_describe(properties[name])}, "
+                    f"got {type(value).__name__}."
+                )
+        return errors
+
+
+def _matches(schema: Dict[str, Any], value: Any) -> bool:
+    if "anyOf" in schema:
+        return any(_matches(option, value) for option in schema["anyOf"])
+    expected = schema.get("type")
+    if expected is None:
+        return True
+    if expected == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if expected == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    python_type = {"string": str, "boolean": bool, "object": dict, "array": list}[expected]
+    return isinstance(value, python_type)
+
+
+def _describe(schema: Dict[str, Any]) -> str:
+    if "anyOf" in schema:
+        return " or ".join(_describe(option) for option in schema["anyOf"])
+    return f"of type {schema.get('type', 'any')}"
+
+
+@lru_cache(maxsize=None)
+def get_tool_schema_registry() -> ToolSchemaRegistry:
+    """Provide the process-wide ToolSchemaRegistry singleton."""
+    return ToolSchemaRegistry(logger=logger, tool_factory=ToolFactory(logger=logger))
@@ -7,9 +7,14 @@ import asyncio
 from ai_infra_agent.api.v1 import agent_router
 
 # Import the core components that will be injected via dependencies
-from ai_infra_agent.api.dependencies import get_agent, get_tool_factory, get_logger, get_user_credentials
+from ai_infra_agent.api.dependencies import get_agent, get_tool_factory, get_logger, get_user_credentials, get_result_store, get_prompt_builder, get_plan_validator, get_structured_plan_output
 from ai_infra_agent.agent.plan_executor import PlanExecutor
-from ai_infra_agent.core.supabase_client import verify_user_token, get_user_aws_credentials, get_user_google_credentials
+from ai_infra_agent.agent.progress import PROTOCOL_LEGACY
+from ai_infra_agent.agent.plan_validator import summarize as summarize_validation
+from ai_infra_agent.core.config import settings
+from ai_infra_agent.infrastructure.aws.client_pool import get_client_pool
+from ai_infra_agent.infrastructure.tool_schemas import get_tool_schema_registry
+from ai_infra_agent.core.supabase_client import verify_user_token, get_user_cloud_credentials
 from fastapi import Query
 
 # --- FastAPI App Initialization ---
@@ -29,9 +34,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# --- Startup ---
+@app.on_event("startup")
+async def prewarm_aws_service_models():
+    """Loads the AWS service models once so the first requests do not pay for parsing them."""
+    await asyncio.to_thread(get_client_pool().prewarm, settings.aws.prewarm_services)
+
+
+@app.on_event("startup")
+async def build_tool_schemas():
+    """Derives the tool parameter schemas, the plan output schema and the static prompt prefix once, before the first request needs them."""
+    get_tool_schema_registry()
+    get_structured_plan_output()
+    get_prompt_builder()
+
 # --- WebSocket Endpoint for Plan Execution ---
 @app.websocket("/ws/v1/agent/execute")
-async def websocket_execute_plan(websocket: WebSocket, token: str = Query(None), user_id: str = Query(None, alias="user_id")):
+async def websocket_execute_plan(
+    websocket: WebSocket,
+    token: str = Query(None),
+    user_id: str = Query(None, alias="user_id"),
+    protocol: str = Query(PROTOCOL_LEGACY),
+):
     """
     Handles the execution of an infrastructure plan over a WebSocket connection.
 
@@ -39,6 +63,11 @@ async def websocket_execute_plan(websocket: WebSocket, token: str = Query(None),
     step-by-step, providing real-time status updates back to the client.
     
     Authentication: Accepts either a Supabase JWT token or user_id as query parameter.
+
+    Progress protocol: "legacy" (default) sends the full result of every step;
+    "compact" sends projected step deltas, and full results can be fetched from
+    GET /api/v1/agent/executions/{executionId}/steps/{stepId}/result, with the
+    executionId the server reports when execution starts.
     """
     log = get_logger()
     await websocket.accept()
@@ -77,9 +106,8 @@ async def websocket_execute_plan(websocket: WebSocket, token: str = Query(None),
 
     # Fetch user credentials
     try:
-        aws_creds = get_user_aws_credentials(user_id_from_token)
-        google_creds = get_user_google_credentials(user_id_from_token)
-        user_creds = {"user_id": user_id_from_token, "email": user_email, "aws": aws_creds, "google": google_creds}
+        credentials = await asyncio.to_thread(get_user_cloud_credentials, user_id_from_token)
+        user_creds = {"user_id": user_id_from_token, "email": user_email, "aws": credentials["aws"], "google": credentials["google"]}
     except Exception as e:
         log.error(f"Credential fetch failed for user {user_id_from_token}: {e}", exc_info=True)
         await websocket.send_json({"status": "error", "message": f"Unable to fetch user credentials: {str(e)}"})
@@ -88,7 +116,6 @@ async def websocket_execute_plan(websocket: WebSocket, token: str = Query(None),
 
     # Create a per-connection agent bound to this user's credentials
     agent = get_agent(user_creds)
-    executor = PlanExecutor(agent=agent, websocket=websocket, logger=log)
 
     log.info(f"WebSocket connection accepted for user {user_id}")
 
@@ -99,6 +126,32 @@ async def websocket_execute_plan(websocket: WebSocket, token: str = Query(None),
         if not execution_plan or not isinstance(execution_plan, list):
             await websocket.send_json({"status": "error", "message": "Invalid or missing 'executionPlan'"})
             return
+        # Broken plans are rejected before any AWS call is made.
+        plan_validator = get_plan_validator()
+        invalid_steps = plan_validator.validate(plan_data) if plan_validator is not None else []
+        if invalid_steps:
+            await websocket.send_json({
+                "status": "error",
+                "message": f"Plan failed validation: {summarize_validation(invalid_steps)}",
+                "invalidSteps": invalid_steps,
+            })
+            return
+        # The plan message can request a simulation explicitly; otherwise the configured default applies.
+        dry_run = plan_data.get("dryRun")
+        if dry_run is None and plan_data.get("mode"):
+            dry_run = plan_data.get("mode") == "dry-run"
+        if dry_run is None:
+            dry_run = settings.agent.dry_run
+        executor = PlanExecutor(
+            agent=agent,
+            websocket=websocket,
+            logger=log,
+            # Execution IDs are generated by the executor, never taken from the client, so a
+            # client cannot claim or overwrite the stored results of another execution.
+            protocol=protocol,
+            result_store=get_result_store(),
+            dry_run=bool(dry_run),
+        )
         await executor.execute_plan(execution_plan)
     except WebSocketDisconnect:
         log.warning("WebSocket disconnected by client during execution.")
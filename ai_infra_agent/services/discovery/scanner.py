@@ -1,7 +1,9 @@
+import asyncio
 from typing import List, Dict, Any
 from ai_infra_agent.state.schemas import ResourceState, InfrastructureState
 from ai_infra_agent.core.logging import logger
 from ai_infra_agent.infrastructure.tool_factory import ToolFactory
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
 
 # Import specific tools that the scanner will use
 from ai_infra_agent.infrastructure.aws.tools.ec2 import ListEC2InstancesTool, ListAvailabilityZonesTool # Needed for region
@@ -24,6 +26,9 @@ class DiscoveryScanner:
         if not self.user_aws_config.get("region"):
             raise ValueError("user_aws_config must contain a 'region' key for DiscoveryScanner.")
 
+        # Every scanner tool shares one client per service for the lifetime of the scanner.
+        self.connection = AWSConnectionContext(self.logger, self.user_aws_config)
+
     async def scan_aws_resources(self) -> InfrastructureState:
         """
         Scans various AWS resources and returns them as an InfrastructureState object.
@@ -34,32 +39,23 @@ class DiscoveryScanner:
         aws_region = self.user_aws_config["region"]
         self.logger.info(f"Starting AWS resource discovery in region: {aws_region}...")
 
-        # Scan EC2 instances
-        ec2_resources = await self._scan_ec2_instances()
-        for res in ec2_resources:
-            discovered_resources[res.id] = res
-
-        # Scan VPCs
-        vpc_resources = await self._scan_vpcs()
-        for res in vpc_resources:
-            discovered_resources[res.id] = res
-
-        # Scan Security Groups
-        sg_resources = await self._scan_security_groups()
-        for res in sg_resources:
-            discovered_resources[res.id] = res
-
-        # Scan RDS DB Subnet Groups
-        rds_db_subnet_group_resources = await self._scan_rds_db_subnet_groups()
-        for res in rds_db_subnet_group_resources:
-            discovered_resources[res.id] = res
-
-        # Scan RDS DB Instances
-        rds_db_instance_resources = await self._scan_rds_db_instances()
-        for res in rds_db_instance_resources:
-            discovered_resources[res.id] = res
+        # The scans are independent, so they run concurrently. Each one returns an empty list on error.
+        try:
+            scan_results = await asyncio.gather(
+                self._scan_ec2_instances(),
+                self._scan_vpcs(),
+                self._scan_security_groups(),
+                self._scan_rds_db_subnet_groups(),
+                self._scan_rds_db_instances(),
+            )
+        finally:
+            await self.connection.aclose()
+        for resources in scan_results:
+            for res in resources:
+                discovered_resources[res.id] = res
 
         self.logger.info(f"Finished AWS resource discovery. Found {len(discovered_resources)} resources.")
+        self.logger.debug(f"AWS calls made during discovery: {self.connection.stats()}")
         return InfrastructureState(resources=discovered_resources)
 
     async def _scan_rds_db_subnet_groups(self) -> List[ResourceState]:
@@ -69,8 +65,8 @@ class DiscoveryScanner:
         resources: List[ResourceState] = []
         try:
             # Get the RDS adapter from the tool factory
-            describe_db_subnet_groups_tool = self.tool_factory.get_tool("list-db-subnet-groups", self.user_aws_config) # Assuming such a tool exists or RDSAdapter has this directly
-            response = describe_db_subnet_groups_tool.execute() # Assuming execute method
+            describe_db_subnet_groups_tool = self.tool_factory.get_tool("list-db-subnet-groups", self.user_aws_config, connection=self.connection) # Assuming such a tool exists or RDSAdapter has this directly
+            response = await describe_db_subnet_groups_tool.aexecute() # Assuming execute method
             self.logger.debug(f"Raw RDS describe_db_subnet_groups response: {response}")
 
             for db_subnet_group in response.get('DBSubnetGroups', []):
@@ -95,8 +91,8 @@ class DiscoveryScanner:
         resources: List[ResourceState] = []
         try:
             # Get the RDS adapter from the tool factory
-            list_rds_instances_tool = self.tool_factory.get_tool("list-rds-instances", self.user_aws_config)
-            response = list_rds_instances_tool.execute() # Assuming execute method
+            list_rds_instances_tool = self.tool_factory.get_tool("list-rds-instances", self.user_aws_config, connection=self.connection)
+            response = await list_rds_instances_tool.aexecute() # Assuming execute method
             self.logger.debug(f"Raw RDS describe_db_instances response: {response}")
 
             for db_instance in response.get('DBInstances', []):
@@ -129,8 +125,8 @@ class DiscoveryScanner:
         resources: List[ResourceState] = []
         try:
             # Get the ListEC2InstancesTool from the tool factory
-            list_ec2_tool = self.tool_factory.get_tool("list-ec2-instances", self.user_aws_config)
-            response = list_ec2_tool.execute() # Assuming execute method
+            list_ec2_tool = self.tool_factory.get_tool("list-ec2-instances", self.user_aws_config, connection=self.connection)
+            response = await list_ec2_tool.aexecute() # Assuming execute method
             self.logger.debug(f"Raw EC2 describe_instances response: {response}")
 
             for reservation in response.get('Reservations', []):
@@ -162,8 +158,8 @@ class DiscoveryScanner:
         resources: List[ResourceState] = []
         try:
             # Get the ListVpcsTool from the tool factory
-            list_vpcs_tool = self.tool_factory.get_tool("list-vpcs", self.user_aws_config)
-            response = list_vpcs_tool.execute() # Assuming execute method
+            list_vpcs_tool = self.tool_factory.get_tool("list-vpcs", self.user_aws_config, connection=self.connection)
+            response = await list_vpcs_tool.aexecute() # Assuming execute method
             self.logger.debug(f"Raw VPC describe_vpcs response: {response}")
 
             for vpc in response.get('vpcs', []):
@@ -194,8 +190,8 @@ class DiscoveryScanner:
         resources: List[ResourceState] = []
         try:
             # Get the ListSecurityGroupsTool from the tool factory
-            list_sg_tool = self.tool_factory.get_tool("list-security-groups", self.user_aws_config)
-            response = list_sg_tool.execute() # Assuming execute method
+            list_sg_tool = self.tool_factory.get_tool("list-security-groups", self.user_aws_config, connection=self.connection)
+            response = await list_sg_tool.aexecute() # Assuming execute method
             self.logger.debug(f"Raw Security Group describe_security_groups response: {response}")
 
             for sg in response.get('security_groups', []):
@@ -1,4 +1,6 @@
-from typing import Optional, Dict
+import time
+from collections import OrderedDict
+from typing import Optional, Hashable, Tuple
 
 from .schemas import InfrastructureState, ResourceState
 from ai_infra_agent.core.logging import logger
@@ -8,17 +10,54 @@ class StateManager:
     Manages the dynamically discovered state from AWS.
     """
 
-    def __init__(self, logger):
+    def __init__(self, logger, fallback_max_age: float = 900, max_fallback_scopes: int = 256):
+        """
+        Args:
+            logger: The logger instance.
+            fallback_max_age (float): How long a scope's last discovered state is kept as a fallback, in seconds.
+            max_fallback_scopes (int): The maximum number of scopes whose last discovered state is kept.
+        """
         self.logger = logger
         self.state: InfrastructureState = InfrastructureState() # This will now hold the discovered state
+        # The last discovered state per user scope, the fallback when a fresh discovery is too slow.
+        # Oldest first: entries are moved to the end whenever they are refreshed.
+        self.fallback_max_age = fallback_max_age
+        self.max_fallback_scopes = max(1, max_fallback_scopes)
+        self._last_discovered: "OrderedDict[Hashable, Tuple[InfrastructureState, float]]" = OrderedDict()
 
-    def set_discovered_state(self, discovered_infra_state: InfrastructureState):
+    def set_discovered_state(self, discovered_infra_state: InfrastructureState, scope: Optional[Hashable] = None):
         """
         Sets the dynamically discovered infrastructure state.
+        With a scope, it is also remembered as that scope's last discovered state.
         """
         self.state = discovered_infra_state
+        if scope is not None:
+            self.remember_discovered_state(scope, discovered_infra_state)
         self.logger.info(f"Set discovered state with {len(self.state.resources)} resources.")
 
+    def remember_discovered_state(self, scope: Hashable, discovered_infra_state: InfrastructureState):
+        """
+        Remembers the state discovered for a scope (e.g. a user's account and region) without making it current.
+        Expired states, and the oldest states beyond max_fallback_scopes, are dropped.
+        """
+        now = time.monotonic()
+        self._last_discovered[scope] = (discovered_infra_state, now)
+        self._last_discovered.move_to_end(scope)
+        while self._last_discovered:
+            oldest_scope, (_, discovered_at) = next(iter(self._last_discovered.items()))
+            if now - discovered_at <= self.fallback_max_age and len(self._last_discovered) <= self.max_fallback_scopes:
+                break
+            del self._last_discovered[oldest_scope]
+
+    def last_discovered_state(self, scope: Hashable, max_age: float) -> Optional[InfrastructureState]:
+        """
+        Returns the state last discovered for a scope, if it is at most max_age seconds old.
+        """
+        entry = self._last_discovered.get(scope)
+        if entry is None or time.monotonic() - entry[1] > max_age:
+            return None
+        return entry[0]
+
     def add_resource(self, resource: ResourceState):
         """
         Adds a new resource to the current state.
@@ -28,6 +67,13 @@ class StateManager:
         self.state.resources[resource.id] = resource
         self.logger.info(f"Added/updated resource '{resource.id}' to the state.")
 
+    def remove_resource(self, resource_id: str):
+        """
+        Removes a resource from the current state, e.g. after it was deleted.
+        """
+        if self.state.resources.pop(resource_id, None) is not None:
+            self.logger.info(f"Removed resource '{resource_id}' from the state.")
+
     def get_current_state_formatted(self) -> str:
         """
         Returns a formatted string representation of the current discovered state for the LLM prompt.
@@ -0,0 +1,68 @@
+import asyncio
+
+from loguru import logger
+
+from ai_infra_agent.agent.compensation import CompensationEngine
+from ai_infra_agent.agent.tool_pool import ToolPoolRejectedError
+
+
+def _engine_with_vpc_stack():
+    engine = CompensationEngine(logger, max_attempts=3, retry_delay=0)
+    engine.record({"id": "vpc"}, "create-vpc", {}, {"vpc_id": "vpc-1"})
+    engine.record({"id": "igw"}, "create-internet-gateway", {}, {"internet_gateway_id": "igw-1"})
+    engine.record({"id": "attach"}, "attach-internet-gateway", {"internet_gateway_id": "igw-1", "vpc_id": "vpc-1"}, {})
+    engine.record({"id": "sg"}, "create-security-group", {}, {"groupId": "sg-1"})
+    return engine
+
+
+DEPENDENCIES = {
+    "vpc": set(),
+    "igw": set(),
+    "attach": {"vpc", "igw"},
+    "sg": {"vpc"},
+    "rule": {"sg"},
+}
+
+
+def test_waves_follow_reverse_dependency_order():
+    waves = _engine_with_vpc_stack().plan_waves(DEPENDENCIES)
+
+    assert [sorted(a.tool_name for a in wave) for wave in waves] == [
+        ["delete-security-group", "detach-internet-gateway"],
+        ["delete-internet-gateway", "delete-vpc"],
+    ]
+
+
+def test_dependency_violations_are_retried_and_failures_block_dependencies():
+    engine = _engine_with_vpc_stack()
+    calls = []
+
+    async def run_tool(tool_name, params):
+        calls.append(tool_name)
+        if tool_name == "delete-security-group" and calls.count(tool_name) == 1:
+            raise ValueError("An error occurred (DependencyViolation) when calling the DeleteSecurityGroup operation")
+        if tool_name == "detach-internet-gateway":
+            raise ValueError("An error occurred (UnauthorizedOperation)")
+        return {"success": True}
+
+    actions = asyncio.run(engine.compensate(DEPENDENCIES, run_tool))
+    status = {a.step_id: a.status for a in actions}
+
+    assert calls.count("delete-security-group") == 2
+    assert status == {"sg": "completed", "attach": "failed", "igw": "skipped", "vpc": "skipped"}
+
+
+def test_pool_rejections_are_retried():
+    engine = _engine_with_vpc_stack()
+    calls = []
+
+    async def run_tool(tool_name, params):
+        calls.append(tool_name)
+        if tool_name == "delete-vpc" and calls.count(tool_name) == 1:
+            raise ToolPoolRejectedError("Tool call waited more than 30s for an execution slot. Please retry later.")
+        return {"success": True}
+
+    actions = asyncio.run(engine.compensate(DEPENDENCIES, run_tool))
+
+    assert calls.count("delete-vpc") == 2
+    assert all(a.status == "completed" for a in actions)
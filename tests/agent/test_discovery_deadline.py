@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+
+from loguru import logger
+
+from ai_infra_agent.agent.agent import StateAwareAgent
+from ai_infra_agent.state.manager import StateManager
+from ai_infra_agent.state.schemas import InfrastructureState, ResourceState
+
+AWS = {"access_key_id": "AKIA", "secret_access_key": "secret", "region": "us-east-1"}
+
+
+class SlowScanner:
+    def __init__(self, delay, resource_id):
+        self.delay = delay
+        self.resource_id = resource_id
+
+    async def scan_aws_resources(self):
+        await asyncio.sleep(self.delay)
+        resource = ResourceState(id=self.resource_id, name=self.resource_id, type="vpc", status="available")
+        return InfrastructureState(resources={self.resource_id: resource})
+
+
+def make_agent(state_manager, scanner):
+    settings = SimpleNamespace(provider="mock", model="mock", discovery_deadline_seconds=0.05,
+                               discovery_fallback_max_age_seconds=60)
+    return StateAwareAgent(settings=settings, state_manager=state_manager, tool_factory=object(), logger=logger,
+                           scanner=scanner, user_credentials={"aws": AWS}, llm=object(), prompt_builder=object())
+
+
+def test_slow_discovery_falls_back_to_the_last_discovered_state():
+    state_manager = StateManager(logger)
+
+    async def main():
+        # Without a previous discovery there is nothing to fall back to, so the scan is awaited.
+        await make_agent(state_manager, SlowScanner(0.1, "vpc-old"))._discover_state()
+        assert list(state_manager.state.resources) == ["vpc-old"]
+
+        await make_agent(state_manager, SlowScanner(0.1, "vpc-new"))._discover_state()
+        assert list(state_manager.state.resources) == ["vpc-old"]
+
+        # The late discovery refreshes the fallback for the next request.
+        await asyncio.sleep(0.1)
+        await make_agent(state_manager, SlowScanner(1, "vpc-newer"))._discover_state()
+        assert list(state_manager.state.resources) == ["vpc-new"]
+
+    asyncio.run(main())
+
+
+def test_stalled_llm_stream_hits_the_llm_deadline():
+    class StalledLLM:
+        async def astream(self, llm_input, **kwargs):
+            yield SimpleNamespace(content='{"executionPlan": [')
+            await asyncio.sleep(10)
+
+    settings = SimpleNamespace(provider="mock", model="mock", prompt_cache_enabled=False, llm_deadline_seconds=0.1)
+    agent = StateAwareAgent(settings=settings, state_manager=StateManager(logger), tool_factory=object(), logger=logger,
+                            scanner=object(), llm=StalledLLM(), prompt_builder=object())
+
+    async def prepared(request):
+        return None, None, "PREFIX", "SUFFIX"
+
+    agent._prepare_request = prepared
+
+    async def collect():
+        return [event async for event in agent.stream_request("create a vpc")]
+
+    events = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+    assert events[-1]["type"] == "error"
+    assert "did not finish streaming" in events[-1]["error"]["error"]
+
+
+def test_fallback_states_are_evicted_by_age_and_count():
+    state_manager = StateManager(logger, fallback_max_age=60, max_fallback_scopes=2)
+    for account in ("a", "b", "c"):
+        state_manager.remember_discovered_state((account, "us-east-1"), InfrastructureState())
+    assert list(state_manager._last_discovered) == [("b", "us-east-1"), ("c", "us-east-1")]
+
+    state_manager._last_discovered[("b", "us-east-1")] = (InfrastructureState(), 0.0)
+    state_manager._last_discovered.move_to_end(("b", "us-east-1"), last=False)
+    state_manager.remember_discovered_state(("d", "us-east-1"), InfrastructureState())
+    assert list(state_manager._last_discovered) == [("c", "us-east-1"), ("d", "us-east-1")]
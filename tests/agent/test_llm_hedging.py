@@ -0,0 +1,73 @@
+import asyncio
+
+from ai_infra_agent.agent.llm_hedging import LatencyTracker, hedged
+
+
+def plan_after(delay, plan):
+    async def call():
+        await asyncio.sleep(delay)
+        return plan
+    return call
+
+
+def is_valid(plan):
+    return "error" not in plan
+
+
+def test_fast_primary_is_not_hedged():
+    secondary_calls = []
+
+    async def secondary():
+        secondary_calls.append(1)
+        return {"plan": "secondary"}
+
+    result = asyncio.run(hedged(plan_after(0, {"plan": "primary"}), secondary, 0.5, is_valid))
+    assert result == ({"plan": "primary"}, "primary")
+    assert not secondary_calls
+
+
+def test_slow_primary_is_hedged_and_the_first_valid_plan_wins():
+    result = asyncio.run(hedged(plan_after(1, {"plan": "primary"}), plan_after(0.01, {"plan": "secondary"}), 0.05, is_valid))
+    assert result == ({"plan": "secondary"}, "secondary")
+
+
+def test_failed_primary_falls_back_to_the_secondary():
+    result = asyncio.run(hedged(plan_after(0, {"error": "boom"}), plan_after(0, {"plan": "secondary"}), 5, is_valid))
+    assert result == ({"plan": "secondary"}, "secondary")
+    both_failed = asyncio.run(hedged(plan_after(0, {"error": "boom"}), plan_after(0, {"error": "bad"}), 5, is_valid))
+    assert both_failed == ({"error": "boom"}, "primary")
+
+
+def test_cancelling_the_caller_cancels_the_primary():
+    started = asyncio.Event()
+    cancelled = []
+
+    async def primary():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("primary")
+            raise
+        return {"plan": "primary"}
+
+    async def main():
+        caller = asyncio.ensure_future(hedged(primary, plan_after(0, {"plan": "secondary"}), 5, is_valid))
+        await started.wait()
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        await asyncio.sleep(0)
+        # Checked before asyncio.run cancels leftover tasks on exit.
+        assert cancelled == ["primary"]
+
+    asyncio.run(main())
+
+
+def test_latency_percentiles_and_histogram():
+    tracker = LatencyTracker(window=100)
+    for seconds in range(1, 101):
+        tracker.record("gemini:flash", seconds / 10)
+    assert tracker.percentile("gemini:flash", 0.95) == 9.6
+    assert tracker.percentile("gemini:flash", 0.95, min_samples=101) is None
+    histogram = tracker.snapshot()["gemini:flash"]["histogram"]
+    assert histogram["le_0.5s"] == 5 and sum(histogram.values()) == 100
@@ -0,0 +1,68 @@
+import asyncio
+
+from loguru import logger
+
+from ai_infra_agent.agent.llm_limiter import LLMConcurrencyLimiter, is_rate_limited
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_calls_are_bounded_per_key():
+    limiter = LLMConcurrencyLimiter(logger, per_provider=4, per_key=2)
+    running = peak = 0
+
+    async def call():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return "ok"
+
+    async def main():
+        return await asyncio.gather(*(limiter.invoke("openai", "key", call) for _ in range(6)))
+
+    assert asyncio.run(main()) == ["ok"] * 6
+    assert peak == 2
+    assert limiter.metrics()["completed"] == 6
+
+
+def test_throttled_calls_are_retried_with_backoff():
+    limiter = LLMConcurrencyLimiter(logger, base_delay=0.01, max_delay=0.02, max_retries=3)
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RateLimitError("Too Many Requests")
+        return "ok"
+
+    assert asyncio.run(limiter.invoke("claude", "key", call)) == "ok"
+    assert len(attempts) == 3
+    assert limiter.metrics()["throttled"] == 2
+
+
+def test_streams_are_retried_only_before_the_first_chunk():
+    limiter = LLMConcurrencyLimiter(logger, base_delay=0.01, max_delay=0.01)
+    opened = []
+
+    async def stream():
+        opened.append(1)
+        if len(opened) == 1:
+            raise RateLimitError("429")
+        for chunk in ("a", "b"):
+            yield chunk
+
+    async def main():
+        return [chunk async for chunk in limiter.stream("gemini", "key", stream)]
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert len(opened) == 2
+
+
+def test_rate_limit_detection():
+    assert is_rate_limited(RateLimitError())
+    assert is_rate_limited(Exception("ThrottlingException: Rate exceeded"))
+    assert not is_rate_limited(ValueError("invalid model"))
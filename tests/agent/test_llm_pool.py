@@ -0,0 +1,31 @@
+from loguru import logger
+
+from ai_infra_agent.agent.llm_pool import LLMClientPool, api_key_fingerprint
+
+
+def test_clients_are_shared_per_key_and_evicted_when_idle():
+    pool = LLMClientPool(logger, max_clients=2, idle_ttl_seconds=60)
+    created = []
+
+    def create():
+        created.append(object())
+        return created[-1]
+
+    key = ("openai", "gpt-4o", 0.1, 1000, None, api_key_fingerprint("sk-one"))
+    first = pool.get(key, create)
+    assert pool.get(key, create) is first
+    other = pool.get(key[:-1] + (api_key_fingerprint("sk-two"),), create)
+    assert other is not first
+    assert pool.stats() == {"size": 2, "hits": 1, "misses": 2}
+
+    pool.idle_ttl_seconds = -1
+    assert pool.get(key, create) is not first
+    assert pool.stats()["size"] == 1
+
+
+def test_least_recently_used_client_is_evicted_beyond_the_limit():
+    pool = LLMClientPool(logger, max_clients=1)
+    first = pool.get(("a",), object)
+    pool.get(("b",), object)
+    assert pool.get(("a",), object) is not first
+    assert "sk-secret" not in api_key_fingerprint("sk-secret")
@@ -0,0 +1,47 @@
+from ai_infra_agent.agent.plan_cache import PlanCache, plan_cache_key
+from ai_infra_agent.state.schemas import InfrastructureState, ResourceState
+
+SCOPE = ("fingerprint", "us-east-1")
+
+
+def _state(free_ips: int, status: str = "available") -> InfrastructureState:
+    subnet = ResourceState(id="subnet-1", name="subnet-1", type="aws_subnet", status=status,
+                           properties={"CidrBlock": "10.0.0.0/24", "AvailableIpAddressCount": free_ips})
+    return InfrastructureState(resources={"subnet-1": subnet})
+
+
+def test_plans_are_reused_for_the_same_request_and_state():
+    cache = PlanCache()
+    plan = {"executionPlan": [{"id": "step-1", "parameters": {"key_name": "web-{{timestamp}}"}}]}
+    cache.put(plan_cache_key(SCOPE, "prompt", _state(250)), "Create a t3.micro EC2 instance.", plan)
+
+    hit = cache.get(plan_cache_key(SCOPE, "prompt", _state(249)), "create a  t3.micro ec2 instance")
+    assert hit == plan
+    hit["executionPlan"].clear()
+    assert cache.get(plan_cache_key(SCOPE, "prompt", _state(250)), "create a t3.micro ec2 instance") == plan
+
+    assert cache.get(plan_cache_key(SCOPE, "prompt", _state(250, "pending")), "create a t3.micro ec2 instance") is None
+    assert cache.get(plan_cache_key(SCOPE, "other-prompt", _state(250)), "create a t3.micro ec2 instance") is None
+
+
+def test_near_duplicates_must_share_values_and_actions():
+    cache = PlanCache(similarity_threshold=0.8)
+    key = plan_cache_key(SCOPE, "prompt", _state(250))
+    cache.put(key, "create a t3.micro ec2 instance", {"executionPlan": []})
+
+    assert cache.get(key, "please create an ec2 instance t3.micro") == {"executionPlan": []}
+    assert cache.get(key, "create a t3.large ec2 instance") is None
+    assert cache.get(key, "terminate a t3.micro ec2 instance") is None
+    assert cache.stats()["near_hits"] == 1
+
+
+def test_near_duplicates_must_share_plain_word_names():
+    cache = PlanCache(similarity_threshold=0.85)
+    key = plan_cache_key(SCOPE, "prompt", _state(250))
+    request = ("create a private s3 bucket named {} with versioning enabled and server side encryption "
+               "and block public access")
+    cache.put(key, request.format("finance"), {"executionPlan": [{"toolParameters": {"bucket_name": "finance"}}]})
+
+    assert cache.get(key, request.format("marketing")) is None
+    assert cache.get(key, "please " + request.format("finance")) is not None
+    assert cache.get(key, "create an s3 bucket called marketing") is None
@@ -0,0 +1,71 @@
+from loguru import logger
+
+from ai_infra_agent.agent.plan_optimizer import PlanOptimizer
+from ai_infra_agent.infrastructure.aws.tools.security_group import _rules_to_ip_permissions
+
+
+def _ingress_step(step_id, port, group_id="{{step-create-sg.groupId}}", depends_on=None):
+    return {
+        "id": step_id,
+        "action": "create",
+        "mcpTool": "add-security-group-ingress-rule",
+        "toolParameters": {
+            "group_id": group_id,
+            "protocol": "tcp",
+            "from_port": port,
+            "to_port": port,
+            "cidr_block": "0.0.0.0/0",
+        },
+        "dependsOn": depends_on or ["step-create-sg"],
+    }
+
+
+def test_adjacent_ingress_rules_are_merged():
+    plan = [
+        {"id": "step-create-sg", "mcpTool": "create-security-group", "toolParameters": {}},
+        _ingress_step("step-http", 80),
+        _ingress_step("step-ssh", 22),
+        _ingress_step("step-https", 443),
+    ]
+
+    optimized = PlanOptimizer(logger).optimize(plan)
+
+    assert len(optimized) == 2
+    batch = optimized[1]
+    assert batch["mcpTool"] == "add-security-group-ingress-rules"
+    assert batch["toolParameters"]["group_id"] == "{{step-create-sg.groupId}}"
+    assert [r["from_port"] for r in batch["toolParameters"]["rules"]] == [80, 22, 443]
+    assert [s["id"] for s in batch["coalescedSteps"]] == ["step-http", "step-ssh", "step-https"]
+    assert batch["dependsOn"] == ["step-create-sg"]
+
+
+def test_steps_for_different_groups_or_non_adjacent_are_not_merged():
+    plan = [
+        _ingress_step("step-a", 80, group_id="sg-1"),
+        _ingress_step("step-b", 80, group_id="sg-2"),
+        {"id": "step-other", "mcpTool": "list-vpcs", "toolParameters": {}},
+        _ingress_step("step-c", 22, group_id="sg-2"),
+    ]
+
+    assert PlanOptimizer(logger).optimize(plan) == plan
+
+
+def test_dependent_steps_are_not_merged():
+    dependent = _ingress_step("step-b", 22, depends_on=["step-a"])
+    plan = [_ingress_step("step-a", 80), dependent]
+
+    assert PlanOptimizer(logger).optimize(plan) == plan
+
+
+def test_rules_with_same_port_range_share_one_permission():
+    permissions = _rules_to_ip_permissions([
+        {"protocol": "tcp", "from_port": 22, "to_port": 22, "cidr_block": "10.0.0.0/16"},
+        {"protocol": "tcp", "from_port": 22, "to_port": 22, "cidr_block": "10.1.0.0/16"},
+        {"protocol": "-1", "cidr_block": "0.0.0.0/0"},
+    ])
+
+    assert permissions == [
+        {"IpProtocol": "tcp", "FromPort": 22, "ToPort": 22,
+         "IpRanges": [{"CidrIp": "10.0.0.0/16"}, {"CidrIp": "10.1.0.0/16"}]},
+        {"IpProtocol": "-1", "IpRanges": [{"CidrIp": "0.0.0.0/0"}]},
+    ]
@@ -0,0 +1,37 @@
+from ai_infra_agent.agent.plan_references import prune_to_paths, referenced_result_paths
+
+
+def test_referenced_result_paths_are_collected_per_step():
+    plan = [
+        {"id": "step-vpc", "toolParameters": {}},
+        {"id": "step-sg", "toolParameters": {"vpc_id": "{{step-vpc.vpc_id}}", "name": "web-{{timestamp}}"}},
+        {"id": "step-ec2", "toolParameters": {"subnet_id": "{{step-subnets.subnets[1].subnet_id}}",
+                                              "security_group_ids": ["{{step-sg.groupId}}"]}},
+    ]
+
+    assert referenced_result_paths(plan) == {
+        "step-vpc": [["vpc_id"]],
+        "step-subnets": [["subnets", "1", "subnet_id"]],
+        "step-sg": [["groupId"]],
+    }
+
+
+def test_prune_keeps_only_referenced_fields():
+    result = {
+        "Subnets": [
+            {"SubnetId": "subnet-a", "CidrBlock": "10.0.0.0/24"},
+            {"SubnetId": "subnet-b", "CidrBlock": "10.0.1.0/24"},
+            {"SubnetId": "subnet-c", "CidrBlock": "10.0.2.0/24"},
+        ],
+        "ResponseMetadata": {"RequestId": "abc"},
+    }
+
+    pruned = prune_to_paths(result, [["subnets", "1", "subnet_id"]])
+
+    assert pruned == {"Subnets": [None, {"SubnetId": "subnet-b"}]}
+
+
+def test_prune_keeps_whole_result_when_step_itself_is_referenced():
+    result = {"vpc_id": "vpc-1", "details": {"State": "available"}}
+
+    assert prune_to_paths(result, [["vpc_id"], []]) == result
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from loguru import logger
+
+from ai_infra_agent.agent.agent import StateAwareAgent
+from ai_infra_agent.agent.plan_stream import IncrementalPlanParser, chunk_text
+
+
+PLAN = {
+    "action": "create",
+    "reasoning": "Needs a {vpc} with \"quoted\" text and ] brackets",
+    "confidence": 0.9,
+    "executionPlan": [
+        {"id": "step-1", "action": "create", "mcpTool": "create-vpc",
+         "toolParameters": {"cidrBlock": "10.0.0.0/16", "tags": {"Name": "a}b"}}, "dependsOn": []},
+        {"id": "step-2", "action": "create", "mcpTool": "create-subnet",
+         "toolParameters": {"vpcId": "{{step-1.resourceId}}"}, "dependsOn": ["step-1"]},
+    ],
+}
+
+
+def test_steps_are_emitted_as_soon_as_they_are_complete():
+    text = "```json\n" + json.dumps(PLAN, indent=2) + "\n```"
+    parser = IncrementalPlanParser(logger)
+
+    emitted = []
+    for start in range(0, len(text), 7):
+        for step in parser.feed(text[start:start + 7]):
+            emitted.append((step, len(parser.text)))
+
+    assert [step for step, _ in emitted] == PLAN["executionPlan"]
+    # The first step is available long before the response is complete.
+    assert emitted[0][1] < text.index("step-2")
+    assert parser.steps_emitted == 2
+    assert parser.text == text
+
+
+def test_nested_arrays_outside_the_plan_are_ignored():
+    parser = IncrementalPlanParser(logger)
+    steps = parser.feed(json.dumps({"other": [{"id": "x"}], "executionPlan": [{"id": "y", "dependsOn": [{"id": "z"}]}]}))
+    assert steps == [{"id": "y", "dependsOn": [{"id": "z"}]}]
+
+
+def test_chunk_text_joins_content_blocks():
+    assert chunk_text("abc") == "abc"
+    assert chunk_text([{"type": "text", "text": "ab"}, "c", {"type": "tool_use"}]) == "abc"
+    assert chunk_text(None) == ""
+
+
+def test_stream_request_indexes_steps_completed_by_the_same_chunk():
+    class OneChunkLLM:
+        async def astream(self, llm_input, **kwargs):
+            yield SimpleNamespace(content=json.dumps(PLAN))
+
+    agent = StateAwareAgent(settings=SimpleNamespace(provider="mock", model="mock", prompt_cache_enabled=False),
+                            state_manager=object(), tool_factory=object(), logger=logger, scanner=object(),
+                            llm=OneChunkLLM(), prompt_builder=object())
+
+    async def prepared(request):
+        return None, None, "PREFIX", "SUFFIX"
+
+    agent._prepare_request = prepared
+
+    async def collect():
+        return [event async for event in agent.stream_request("create a vpc")]
+
+    events = asyncio.run(collect())
+
+    assert [(event["index"], event["step"]["id"]) for event in events if event["type"] == "step"] == [(0, "step-1"), (1, "step-2")]
+    assert events[-1]["type"] == "plan"
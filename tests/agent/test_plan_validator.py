@@ -0,0 +1,71 @@
+from typing import Dict, Optional
+
+from loguru import logger
+
+from ai_infra_agent.agent.plan_validator import PlanValidator
+from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
+from ai_infra_agent.infrastructure.tool_schemas import ToolSchemaRegistry
+
+
+class _CreateVpcTool(BaseTool):
+    def execute(self, cidr_block: str, name: Optional[str] = None) -> Dict:
+        """Creates a VPC."""
+
+
+class _CreateSubnetTool(BaseTool):
+    def execute(self, vpc_id: str, cidr_block: str, user_data: Optional[str] = None) -> Dict:
+        """Creates a subnet."""
+
+
+class _FakeFactory:
+    def get_tool_classes(self):
+        return [("create-vpc", _CreateVpcTool, "Creates a VPC."), ("create-subnet", _CreateSubnetTool, "Creates a subnet.")]
+
+
+def make_validator():
+    return PlanValidator(logger, ToolSchemaRegistry(logger, _FakeFactory()))
+
+
+def step(step_id, tool, params, depends_on=()):
+    return {"id": step_id, "mcpTool": tool, "toolParameters": params, "dependsOn": list(depends_on)}
+
+
+def test_valid_plan_passes():
+    plan = {"executionPlan": [
+        step("vpc", "create-vpc", {"cidr_block": "10.0.0.0/16", "name": "app-{{timestamp}}"}),
+        step("subnet", "create-subnet", {"vpc_id": "{{vpc.vpc_id}}", "cidr_block": "10.0.1.0/24",
+                                         "user_data": "echo ${HOME} {not-a-step}"}, ["vpc"]),
+    ]}
+    assert make_validator().validate(plan) == []
+
+
+def test_invalid_steps_are_reported_individually():
+    plan = {"executionPlan": [
+        step("subnet", "create-subnet", {"vpc_id": "{{vpc.vpc_id}}", "cidr_block": 24}),
+        step("vpc", "create-vpc", {"cidr_block": "10.0.0.0/16"}),
+        step("gateway", "create-gateway", {}, ["missing"]),
+    ]}
+    invalid = make_validator().validate(plan)
+
+    assert [entry["stepId"] for entry in invalid] == ["subnet", "gateway"]
+    assert any("runs after it" in error for error in invalid[0]["errors"])
+    assert any("cidr_block" in error for error in invalid[0]["errors"])
+    assert "Tool 'create-gateway' not found." in invalid[1]["errors"]
+    assert any("'missing', which does not exist" in error for error in invalid[1]["errors"])
+
+
+def test_repair_prompt_contains_only_invalid_steps_and_repairs_are_merged():
+    validator = make_validator()
+    plan = {"executionPlan": [
+        step("vpc", "create-vpc", {"cidr_block": "10.0.0.0/16"}),
+        step("subnet", "create-subnets", {"vpc_id": "{{vpc.vpc_id}}"}),
+    ]}
+    invalid = validator.validate(plan)
+    prompt = validator.repair_prompt(plan, invalid)
+    assert "create-subnets" in prompt and "10.0.0.0/16" not in prompt
+    assert "REGISTERED TOOLS" in prompt
+
+    repaired = {"executionPlan": [step("subnet", "create-subnet", {"vpc_id": "{{vpc.vpc_id}}", "cidr_block": "10.0.1.0/24"})]}
+    merged = validator.merge_repaired_steps(plan, repaired)
+    assert validator.validate(merged) == []
+    assert merged["executionPlan"][0] is plan["executionPlan"][0]
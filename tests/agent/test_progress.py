@@ -0,0 +1,52 @@
+import asyncio
+import json
+
+from loguru import logger
+
+from ai_infra_agent.agent.progress import ProgressChannel, project_result
+
+
+class _SlowWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text):
+        await asyncio.sleep(0.01)
+        self.sent.append(json.loads(text))
+
+
+def test_ec2_result_is_projected_to_instance_summary():
+    result = {
+        "Instances": [{"InstanceId": "i-1", "InstanceType": "t3.micro", "State": {"Name": "pending"},
+                       "BlockDeviceMappings": [{"DeviceName": "/dev/xvda"}]}],
+        "ResponseMetadata": {"RequestId": "abc"},
+    }
+
+    projected = project_result("create-ec2-instance", result)
+
+    assert projected["instance_ids"] == ["i-1"]
+    assert projected["instances"][0]["state"] == "pending"
+    assert "BlockDeviceMappings" not in json.dumps(projected)
+
+
+def test_generic_projection_drops_metadata_and_summarizes_nested_lists():
+    projected = project_result("list-vpcs", {"Vpcs": [{"VpcId": "vpc-1"}], "ResponseMetadata": {}})
+
+    assert projected == {"Vpcs": {"count": 1}}
+
+
+def test_slow_client_only_receives_latest_status_per_step():
+    async def run():
+        websocket = _SlowWebSocket()
+        channel = ProgressChannel(websocket, logger, max_pending=2)
+        await channel.publish({"n": 0})
+        for i in range(5):
+            await channel.publish({"stepId": "a", "status": "running", "n": i}, coalesce_key="step:a", droppable=True)
+        await channel.publish({"stepId": "a", "status": "completed"}, coalesce_key="step:a")
+        await channel.close()
+        return websocket.sent
+
+    sent = asyncio.run(run())
+
+    assert sent[-1] == {"stepId": "a", "status": "completed"}
+    assert len(sent) < 7
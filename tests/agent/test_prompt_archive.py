@@ -0,0 +1,61 @@
+import os
+import time
+
+from loguru import logger
+
+from ai_infra_agent.agent.prompt_archive import PromptArchive
+
+
+def test_prefix_is_stored_once_and_prompts_are_reassembled(tmp_path):
+    archive = PromptArchive(logger, str(tmp_path), sample_rate=1.0)
+
+    first = archive.record("STATIC PREFIX ", "request one", {"model": "m"})
+    second = archive.record("STATIC PREFIX ", "request two")
+    assert archive.record("STATIC PREFIX ", "request one") == first
+    archive.flush()
+
+    assert len(list((tmp_path / "prefixes").iterdir())) == 1
+    assert len(list((tmp_path / "prompts").rglob("*.json.gz"))) == 2
+    record = archive.load(first)
+    assert record["prompt"] == "STATIC PREFIX request one"
+    assert record["model"] == "m"
+    assert archive.load(second)["prompt"] == "STATIC PREFIX request two"
+
+
+def test_unsampled_prompts_are_not_archived(tmp_path):
+    archive = PromptArchive(logger, str(tmp_path), sample_rate=0)
+    assert archive.record("prefix", "suffix") is None
+    assert not tmp_path.joinpath("prompts").exists()
+
+
+def test_prune_deletes_expired_and_oldest_prompts(tmp_path):
+    archive = PromptArchive(logger, str(tmp_path), sample_rate=1.0, max_age_seconds=3600, max_bytes=None)
+    expired = archive.record("PREFIX ", "old request")
+    kept = archive.record("PREFIX ", "new request")
+    archive.flush()
+    old = time.time() - 7200
+    os.utime(archive._prompt_path(expired), (old, old))
+
+    assert archive.prune() == 1
+    assert archive.load(expired) is None
+    assert archive.load(kept)["prompt"] == "PREFIX new request"
+
+    archive.max_bytes = 0
+    assert archive.prune() == 1
+    assert archive.load(kept) is None
+
+
+def test_prefix_written_before_a_restart_is_kept_while_in_use(tmp_path):
+    before_restart = PromptArchive(logger, str(tmp_path), sample_rate=1.0)
+    before_restart.record("PREFIX ", "old request")
+    before_restart.flush()
+    prefix_path = next((tmp_path / "prefixes").iterdir())
+    old = time.time() - 7200
+    os.utime(prefix_path, (old, old))
+
+    restarted = PromptArchive(logger, str(tmp_path), sample_rate=1.0, max_age_seconds=3600)
+    prompt_id = restarted.record("PREFIX ", "new request")
+    restarted.flush()
+    restarted.prune()
+
+    assert restarted.load(prompt_id)["prompt"] == "PREFIX new request"
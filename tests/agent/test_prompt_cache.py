@@ -0,0 +1,37 @@
+from ai_infra_agent.agent import prompt_cache
+from ai_infra_agent.agent.prompt_builder import PromptBuilder
+from ai_infra_agent.agent.prompt_cache import cache_hinted_input, prefix_cache_key
+
+
+def test_prompts_share_a_static_prefix_and_keep_request_text_verbatim():
+    builder = PromptBuilder()
+
+    first_prefix, first_suffix = builder.build_parts("create a {vpc}", "no resources")
+    second_prefix, second_suffix = builder.build_parts("delete bucket", "bucket: logs")
+
+    assert first_prefix == second_prefix
+    assert "create a {vpc}" in first_suffix and "no resources" in first_suffix
+    assert "create a {vpc}" not in first_prefix
+    assert builder.build("create a {vpc}", "no resources") == first_prefix + first_suffix
+
+
+def test_provider_cache_hints(monkeypatch):
+    monkeypatch.setattr(prompt_cache, "bedrock_supports_cache_points", lambda: True)
+
+    messages, kwargs = cache_hinted_input("claude", "claude-sonnet", "PREFIX", "SUFFIX")
+    assert messages[0].content[0] == {"type": "text", "text": "PREFIX", "cache_control": {"type": "ephemeral"}}
+    assert kwargs == {}
+
+    prompt, kwargs = cache_hinted_input("openai", "gpt-4o", "PREFIX", "SUFFIX")
+    assert prompt == "PREFIXSUFFIX"
+    assert kwargs == {"prompt_cache_key": prefix_cache_key("PREFIX")}
+
+    messages, _ = cache_hinted_input("bedrock", "us.anthropic.claude-3-7-sonnet", "PREFIX", "SUFFIX")
+    assert messages[0].content[1] == {"cachePoint": {"type": "default"}}
+    assert cache_hinted_input("bedrock", "meta.llama3", "PREFIX", "SUFFIX") == ("PREFIXSUFFIX", {})
+
+
+def test_bedrock_hint_is_skipped_when_botocore_lacks_cache_points(monkeypatch):
+    monkeypatch.setattr(prompt_cache, "bedrock_supports_cache_points", lambda: False)
+
+    assert cache_hinted_input("bedrock", "us.anthropic.claude-3-7-sonnet", "PREFIX", "SUFFIX") == ("PREFIXSUFFIX", {})
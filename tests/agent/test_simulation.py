@@ -0,0 +1,35 @@
+import pytest
+from loguru import logger
+
+from ai_infra_agent.agent.simulation import PlanSimulator
+from ai_infra_agent.state.schemas import InfrastructureState, ResourceState
+
+
+def _state_with_default_vpc():
+    vpc = ResourceState(id="vpc-1", name="default", type="aws_vpc", status="available",
+                        properties={"vpc_id": "vpc-1", "is_default": True, "cidr_block": "172.31.0.0/16"})
+    return InfrastructureState(resources={"vpc-1": vpc})
+
+
+def test_created_resources_get_synthetic_ids_usable_by_later_steps():
+    simulator = PlanSimulator(_state_with_default_vpc(), logger)
+
+    vpc_id = simulator.simulate("get-default-vpc", {})["vpc_id"]
+    group = simulator.simulate("create-security-group", {"group_name": "web", "description": "web", "vpc_id": vpc_id})
+    instances = simulator.simulate("create-ec2-instance", {
+        "image_id": "ami-123", "instance_type": "t3.micro", "security_group_ids": [group["groupId"]],
+    })
+
+    assert group["groupId"].startswith("sg-")
+    assert instances["Instances"][0]["InstanceId"].startswith("i-")
+    assert instances["Instances"][0]["InstanceId"] in simulator.synthetic_ids
+
+
+def test_reference_to_missing_resource_fails_and_state_is_untouched():
+    state = _state_with_default_vpc()
+    simulator = PlanSimulator(state, logger)
+    simulator.simulate("create-vpc", {"cidr_block": "10.0.0.0/16"})
+
+    with pytest.raises(ValueError, match="does not exist"):
+        simulator.simulate("create-security-group", {"group_name": "web", "description": "web", "vpc_id": "vpc-404"})
+    assert list(state.resources) == ["vpc-1"]
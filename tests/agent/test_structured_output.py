@@ -0,0 +1,66 @@
+from typing import Dict
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, AIMessageChunk
+from loguru import logger
+
+from ai_infra_agent.agent.plan_stream import IncrementalPlanParser
+from ai_infra_agent.agent.structured_output import PLAN_TOOL_NAME, StructuredPlanOutput
+from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
+from ai_infra_agent.infrastructure.tool_schemas import ToolSchemaRegistry
+
+
+class _CreateVpcTool(BaseTool):
+    def execute(self, cidr_block: str) -> Dict:
+        """Creates a VPC."""
+
+
+class _FakeFactory:
+    def get_tool_classes(self):
+        return [("create-vpc", _CreateVpcTool, "Creates a VPC."), ("list-vpcs", _CreateVpcTool, "Lists VPCs.")]
+
+
+def make_output():
+    return StructuredPlanOutput(logger, ToolSchemaRegistry(logger, _FakeFactory()))
+
+
+def test_plan_tool_schema_allows_only_registered_tools():
+    output = make_output()
+    step = output.tool("openai")["parameters"]["properties"]["executionPlan"]["items"]
+
+    assert step["properties"]["mcpTool"]["enum"] == ["create-vpc", "list-vpcs"]
+    assert step["properties"]["toolParameters"]["type"] == "object"
+    assert output.tool("gemini")["parameters"]["properties"]["executionPlan"]["items"]["properties"]["toolParameters"]["type"] == "string"
+
+
+def test_bind_forces_the_plan_tool():
+    llm = ChatAnthropic(model="claude-3-5-sonnet-latest", anthropic_api_key="test-key")
+    planner = make_output().bind("claude", llm)
+
+    assert planner.kwargs["tool_choice"] == {"type": "tool", "name": PLAN_TOOL_NAME}
+    assert planner.kwargs["tools"][0]["name"] == PLAN_TOOL_NAME
+
+
+def test_extract_decodes_string_encoded_parameters():
+    plan = {"action": "create_infrastructure", "executionPlan": [
+        {"id": "vpc", "mcpTool": "create-vpc", "toolParameters": '{"cidr_block": "10.0.0.0/16"}', "dependsOn": []},
+    ]}
+    response = AIMessage(content="", tool_calls=[{"name": PLAN_TOOL_NAME, "args": plan, "id": "call-1"}])
+
+    extracted = StructuredPlanOutput.extract(response)
+
+    assert extracted["executionPlan"][0]["toolParameters"] == {"cidr_block": "10.0.0.0/16"}
+    assert StructuredPlanOutput.extract(AIMessage(content='{"executionPlan": []}')) is None
+
+
+def test_streamed_tool_call_arguments_yield_steps():
+    arguments = '{"action": "create_infrastructure", "executionPlan": [{"id": "vpc", "mcpTool": "create-vpc"}, {"id": "list"'
+    chunks = [
+        AIMessageChunk(content="", tool_call_chunks=[{"name": PLAN_TOOL_NAME, "args": arguments[:40], "id": "call-1", "index": 0}]),
+        AIMessageChunk(content="", tool_call_chunks=[{"name": None, "args": arguments[40:], "id": None, "index": 0}]),
+    ]
+    parser = IncrementalPlanParser(logger)
+
+    steps = [step for chunk in chunks for step in parser.feed(StructuredPlanOutput.chunk_text(chunk))]
+
+    assert steps == [{"id": "vpc", "mcpTool": "create-vpc"}]
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+from loguru import logger
+
+from ai_infra_agent.agent.tool_pool import ToolExecutionPool, ToolPoolRejectedError
+
+
+def test_one_user_cannot_take_every_slot():
+    async def scenario():
+        pool = ToolExecutionPool(logger, max_concurrent=3, per_user_limit=2, max_queue=10, queue_timeout=5)
+        release = asyncio.Event()
+        peak = {"alice": 0, "bob": 0}
+        active = {"alice": 0, "bob": 0}
+
+        async def call(user):
+            active[user] += 1
+            peak[user] = max(peak[user], active[user])
+            await release.wait()
+            active[user] -= 1
+            return user
+
+        tasks = [asyncio.create_task(pool.run("alice", lambda: call("alice"))) for _ in range(5)]
+        await asyncio.sleep(0)
+        bob = asyncio.create_task(pool.run("bob", lambda: call("bob")))
+        await asyncio.sleep(0.01)
+
+        assert active == {"alice": 2, "bob": 1}
+        assert pool.metrics()["queue_depth"] == 3
+        release.set()
+        await asyncio.gather(*tasks, bob)
+        return pool, peak
+
+    pool, peak = asyncio.run(scenario())
+    assert peak["alice"] == 2
+    assert pool.metrics()["completed"] == 6
+    assert pool.metrics()["active_users"] == 0
+
+
+def test_calls_are_rejected_when_the_queue_is_full():
+    async def scenario():
+        pool = ToolExecutionPool(logger, max_concurrent=1, per_user_limit=1, max_queue=0, queue_timeout=5)
+        release = asyncio.Event()
+        running = asyncio.create_task(pool.run("alice", release.wait))
+        await asyncio.sleep(0.01)
+        with pytest.raises(ToolPoolRejectedError):
+            await pool.run("bob", release.wait)
+        release.set()
+        await running
+        return pool
+
+    assert asyncio.run(scenario()).metrics()["rejected"] == 1
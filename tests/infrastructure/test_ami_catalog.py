@@ -0,0 +1,32 @@
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.ami_catalog import AmiCatalog
+
+
+class _FakeEC2:
+    def __init__(self):
+        self.calls = 0
+
+    def describe_images(self, **kwargs):
+        self.calls += 1
+        return {"Images": [
+            {"ImageId": "ami-old", "Name": "al2023-ami-1", "CreationDate": "2024-01-01T00:00:00.000Z"},
+            {"ImageId": "ami-new", "Name": "al2023-ami-2", "CreationDate": "2024-06-01T00:00:00.000Z"},
+        ]}
+
+
+def test_latest_images_are_answered_from_the_persisted_catalog(tmp_path):
+    client = _FakeEC2()
+    path = tmp_path / "ami-catalog.json"
+    catalog = AmiCatalog(logger, path=str(path))
+
+    assert catalog.latest_for_family(client, "us-east-1", "amazon-linux-2023")["ImageId"] == "ami-new"
+    assert catalog.latest_for_family(client, "us-east-1", "amazon-linux-2023")["ImageId"] == "ami-new"
+    assert client.calls == 1
+
+    restarted = AmiCatalog(logger, path=str(path))
+    assert restarted.latest(client, "us-east-1", "amazon", "al2023-ami-*-x86_64")["ImageId"] == "ami-new"
+    assert client.calls == 1
+
+    restarted.latest_for_family(client, "eu-west-1", "amazon-linux-2023")
+    assert client.calls == 2
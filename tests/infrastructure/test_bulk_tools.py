@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.adapters.ec2 import EC2Adapter
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
+from ai_infra_agent.infrastructure.aws.tools.ec2 import BulkStopInstancesTool
+
+
+class _FakeEC2Client:
+    meta = SimpleNamespace(method_to_api_mapping={"stop_instances": "StopInstances"})
+
+    def __init__(self):
+        self.requests = []
+
+    def stop_instances(self, InstanceIds):
+        self.requests.append(list(InstanceIds))
+        if "i-missing" in InstanceIds:
+            raise RuntimeError("InvalidInstanceID.NotFound")
+        return {"StoppingInstances": [
+            {"InstanceId": i, "PreviousState": {"Name": "running"}, "CurrentState": {"Name": "stopping"}}
+            for i in InstanceIds
+        ]}
+
+
+class _FakePool:
+    def __init__(self, client):
+        self.client = client
+
+    def get_client(self, service_name, aws_config):
+        return self.client
+
+
+def _tool():
+    client = _FakeEC2Client()
+    aws_config = {"access_key_id": "AKIA1", "secret_access_key": "secret", "region": "us-east-1"}
+    connection = AWSConnectionContext(logger, aws_config, pool=_FakePool(client))
+    return BulkStopInstancesTool(logger, EC2Adapter(logger, aws_config, connection=connection)), client
+
+
+def test_bulk_stop_chunks_ids_and_isolates_a_failing_id():
+    tool, client = _tool()
+    ids = [f"i-{n}" for n in range(5)] + ["i-missing"]
+
+    result = tool.execute(instance_ids=ids, chunk_size=2, fail_on_partial=False)
+
+    assert result["failed"] == ["i-missing"]
+    assert sorted(result["succeeded"]) == sorted(ids[:5])
+    assert result["results"]["i-0"] == {"status": "succeeded", "previous_state": "running", "current_state": "stopping"}
+    # Three chunks of two, then the failed chunk retried one ID at a time.
+    assert len(client.requests) == 5
+    assert all(len(request) <= 2 for request in client.requests)
+
+    assert "error" in tool.execute(instance_ids=ids, chunk_size=2)
+
+
+def test_errors_not_caused_by_an_id_are_not_retried_per_id():
+    tool, client = _tool()
+
+    def throttled(InstanceIds):
+        client.requests.append(list(InstanceIds))
+        raise RuntimeError("An error occurred (RequestLimitExceeded) when calling the StopInstances operation")
+
+    client.stop_instances = throttled
+    result = tool.execute(instance_ids=[f"i-{n}" for n in range(4)], chunk_size=4)
+
+    assert "RequestLimitExceeded" in result["error"]
+    assert len(client.requests) == 1
+
+
+def test_string_false_does_not_fail_the_step_on_partial_failure():
+    tool, _ = _tool()
+
+    result = tool.execute(instance_ids=["i-0", "i-missing"], chunk_size=2, fail_on_partial="false")
+
+    assert result["failed"] == ["i-missing"]
@@ -0,0 +1,85 @@
+import threading
+import time
+
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.client_pool import AWSClientPool
+
+
+class _FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _CountingPool(AWSClientPool):
+    def _create_client(self, service_name, aws_config):
+        return _FakeClient()
+
+
+CREDS = {"access_key_id": "AKIA1", "secret_access_key": "secret", "region": "us-east-1"}
+
+
+def test_clients_are_reused_per_credentials_service_and_region():
+    pool = _CountingPool(logger, max_size=8)
+
+    client = pool.get_client("ec2", CREDS)
+
+    assert pool.get_client("ec2", dict(CREDS)) is client
+    assert pool.get_client("s3", CREDS) is not client
+    assert pool.get_client("ec2", {**CREDS, "region": "eu-west-1"}) is not client
+    assert pool.get_client("ec2", {**CREDS, "secret_access_key": "other"}) is not client
+    assert pool.stats()["hits"] == 1
+
+
+def test_least_recently_used_and_expired_clients_are_evicted():
+    pool = _CountingPool(logger, max_size=2)
+    ec2 = pool.get_client("ec2", CREDS)
+    pool.get_client("s3", CREDS)
+    pool.get_client("ec2", CREDS)
+    pool.get_client("rds", CREDS)
+
+    assert pool.get_client("ec2", CREDS) is ec2
+    assert pool.stats()["size"] == 2
+
+    expired = _CountingPool(logger, ttl_seconds=0)
+    assert expired.get_client("ec2", CREDS) is not expired.get_client("ec2", CREDS)
+
+
+def test_evicted_clients_are_closed():
+    pool = _CountingPool(logger, max_size=1)
+    ec2 = pool.get_client("ec2", CREDS)
+    s3 = pool.get_client("s3", CREDS)
+
+    assert ec2.closed and not s3.closed
+
+    expired = _CountingPool(logger, ttl_seconds=0)
+    first = expired.get_client("ec2", CREDS)
+    expired.get_client("ec2", CREDS)
+    assert first.closed
+
+
+def test_a_slow_client_creation_does_not_block_pooled_clients():
+    started, release = threading.Event(), threading.Event()
+
+    class _SlowPool(_CountingPool):
+        def _create_client(self, service_name, aws_config):
+            if service_name == "s3":
+                started.set()
+                release.wait(5)
+            return super()._create_client(service_name, aws_config)
+
+    pool = _SlowPool(logger)
+    ec2 = pool.get_client("ec2", CREDS)
+    creating = threading.Thread(target=pool.get_client, args=("s3", CREDS))
+    creating.start()
+    try:
+        assert started.wait(5)
+        looked_up_at = time.monotonic()
+        assert pool.get_client("ec2", CREDS) is ec2
+        assert time.monotonic() - looked_up_at < 1
+    finally:
+        release.set()
+        creating.join()
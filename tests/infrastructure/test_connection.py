@@ -0,0 +1,56 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
+
+
+class _FakeClient:
+    meta = SimpleNamespace(method_to_api_mapping={"describe_vpcs": "DescribeVpcs", "delete_vpc": "DeleteVpc"})
+
+    def describe_vpcs(self):
+        return {"Vpcs": []}
+
+    def delete_vpc(self, VpcId):
+        raise RuntimeError("DependencyViolation")
+
+
+class _FakePool:
+    def __init__(self):
+        self.requests = []
+
+    def get_client(self, service_name, aws_config):
+        self.requests.append(service_name)
+        return _FakeClient()
+
+
+def test_adapters_share_one_client_per_service_and_calls_are_counted():
+    pool = _FakePool()
+    connection = AWSConnectionContext(logger, {"region": "us-east-1"}, pool=pool)
+
+    assert connection.client("ec2") is connection.client("ec2")
+    connection.client("ec2").describe_vpcs()
+    connection.client("ec2").describe_vpcs()
+    with pytest.raises(RuntimeError):
+        connection.client("ec2").delete_vpc(VpcId="vpc-1")
+
+    assert pool.requests == ["ec2"]
+    stats = connection.stats()["ec2"]
+    assert stats["describe_vpcs"]["calls"] == 2
+    assert stats["delete_vpc"]["errors"] == 1
+    assert connection.summary()["calls"] == 3
+
+
+def test_async_tools_fall_back_to_the_aws_thread_pool():
+    from ai_infra_agent.infrastructure.aws.adapters.vpc import VpcAdapter
+    from ai_infra_agent.infrastructure.aws.tools.vpc import ListVpcsTool
+
+    connection = AWSConnectionContext(logger, {}, pool=_FakePool())
+    connection.supports_async = False
+    aws_config = {"access_key_id": "AKIA1", "secret_access_key": "secret", "region": "us-east-1"}
+    tool = ListVpcsTool(logger, VpcAdapter(logger, aws_config, connection=connection))
+
+    assert asyncio.run(tool.aexecute()) == {"vpcs": []}
+    assert connection.stats()["ec2"]["describe_vpcs"]["calls"] == 1
@@ -0,0 +1,67 @@
+import itertools
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.adapters.ec2 import EC2Adapter
+from ai_infra_agent.infrastructure.aws.connection import AWSConnectionContext
+
+
+class _FakeEC2Client:
+    meta = SimpleNamespace(method_to_api_mapping={})
+
+    def __init__(self, capacity):
+        self.capacity = dict(capacity)
+        self.terminated = []
+        self._ids = itertools.count()
+
+    def describe_subnets(self, **kwargs):
+        return {"Subnets": [
+            {"SubnetId": "subnet-a1", "AvailabilityZone": "us-east-1a", "AvailableIpAddressCount": 10},
+            {"SubnetId": "subnet-a2", "AvailabilityZone": "us-east-1a", "AvailableIpAddressCount": 200},
+            {"SubnetId": "subnet-b", "AvailabilityZone": "us-east-1b", "AvailableIpAddressCount": 200},
+            {"SubnetId": "subnet-c", "AvailabilityZone": "us-east-1c", "AvailableIpAddressCount": 200},
+        ]}
+
+    def run_instances(self, SubnetId, MinCount, MaxCount, **kwargs):
+        launched = min(MaxCount, self.capacity[SubnetId])
+        if launched < MinCount:
+            raise RuntimeError("InsufficientInstanceCapacity")
+        self.capacity[SubnetId] -= launched
+        return {"Instances": [{"InstanceId": f"i-{next(self._ids)}", "SubnetId": SubnetId} for _ in range(launched)]}
+
+    def terminate_instances(self, InstanceIds):
+        self.terminated.extend(InstanceIds)
+
+
+class _FakePool:
+    def __init__(self, client):
+        self.client = client
+
+    def get_client(self, service_name, aws_config):
+        return self.client
+
+
+def _adapter(client):
+    aws_config = {"access_key_id": "AKIA1", "secret_access_key": "secret", "region": "us-east-1"}
+    return EC2Adapter(logger, aws_config, connection=AWSConnectionContext(logger, aws_config, pool=_FakePool(client)))
+
+
+def test_fleet_is_spread_across_azs_and_refills_a_short_az():
+    client = _FakeEC2Client({"subnet-a2": 100, "subnet-b": 100, "subnet-c": 0})
+
+    result = _adapter(client).launch_fleet("ami-1", "t3.micro", count=10)
+
+    assert len(result["InstanceIds"]) == 10
+    launched = {entry["subnet_id"]: entry["launched"] for entry in result["placement"]}
+    # One subnet per AZ, the one with the most free IPs; AZ c's share goes to a and b.
+    assert launched == {"subnet-a2": 6, "subnet-b": 4, "subnet-c": 0}
+
+
+def test_fleet_below_min_count_is_terminated():
+    client = _FakeEC2Client({"subnet-a2": 1, "subnet-b": 0, "subnet-c": 0})
+
+    with pytest.raises(ValueError):
+        _adapter(client).launch_fleet("ami-1", "t3.micro", count=6, min_count=3)
+    assert client.terminated == ["i-0"]
@@ -0,0 +1,44 @@
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
+from ai_infra_agent.infrastructure.tool_cache import CachedTool, ToolResultCache
+
+SCOPE = ("fingerprint", "us-east-1")
+
+
+class _ListSubnetsTool(BaseTool):
+    def __init__(self):
+        super().__init__(logger, adapter=None)
+        self.calls = 0
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        return {"subnets": [{"subnet_id": f"subnet-{self.calls}"}]}
+
+
+class _CreateSubnetTool(BaseTool):
+    def __init__(self):
+        super().__init__(logger, adapter=None)
+
+    def execute(self, **kwargs):
+        return {"subnet_id": "subnet-new"}
+
+
+def test_read_only_results_are_cached_per_normalized_params_and_invalidated():
+    cache = ToolResultCache()
+    inner = _ListSubnetsTool()
+    tool = CachedTool(inner, cache, "list-subnets", SCOPE, ttl_seconds=300, tags=("subnets",))
+
+    first = tool.execute(vpc_id="vpc-1", subnet_ids=["b", "a"])
+    first["subnets"].clear()
+    assert tool.execute(subnet_ids=["a", "b"], vpc_id="vpc-1", az=None) == {"subnets": [{"subnet_id": "subnet-1"}]}
+    assert inner.calls == 1
+
+    other_user = CachedTool(inner, cache, "list-subnets", ("other", "us-east-1"), ttl_seconds=300, tags=("subnets",))
+    other_user.execute(vpc_id="vpc-1", subnet_ids=["a", "b"])
+    assert inner.calls == 2
+
+    CachedTool(_CreateSubnetTool(), cache, "create-public-subnet", SCOPE, invalidates=("subnets",)).execute()
+    tool.execute(vpc_id="vpc-1", subnet_ids=["a", "b"])
+    assert inner.calls == 3
+    assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,58 @@
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from ai_infra_agent.infrastructure.aws.tools.base import BaseTool
+from ai_infra_agent.infrastructure.tool_schemas import ToolSchemaRegistry, tool_parameters_schema
+
+
+class _ResizeVolumeTool(BaseTool):
+    def execute(self, volume_id: str, size: int, tags: Optional[List[Dict[str, str]]] = None,
+                wait: bool = False) -> Dict:
+        """
+        Resizes a volume.
+
+        Args:
+            volume_id (str): The ID of the volume.
+            size (int): The new size in GiB,
+                        at least the current size.
+
+        Returns:
+            Dict: The modification.
+        """
+
+
+class _FakeFactory:
+    def get_tool_classes(self):
+        return [("resize-volume", _ResizeVolumeTool, "Resizes a volume.")]
+
+
+def test_schema_is_derived_from_the_execute_signature_and_docstring():
+    schema = tool_parameters_schema(_ResizeVolumeTool)
+
+    assert schema["required"] == ["volume_id", "size"]
+    assert schema["additionalProperties"] is False
+    assert schema["properties"]["size"] == {
+        "type": "integer", "description": "The new size in GiB, at least the current size.",
+    }
+    assert schema["properties"]["tags"] == {"type": "array", "items": {"type": "object"}}
+    assert schema["properties"]["wait"] == {"type": "boolean", "default": False}
+
+
+def test_params_are_validated_against_the_schema():
+    registry = ToolSchemaRegistry(logger, _FakeFactory())
+
+    assert registry.validate_params("resize-volume", {"volume_id": "{{vol.VolumeId}}", "size": 20}) == []
+    errors = registry.validate_params("resize-volume", {"size": "20", "force": True})
+    assert len(errors) == 3
+    assert registry.validate_params("missing-tool", {}) == ["Tool 'missing-tool' not found."]
+
+
+def test_registered_tools_declare_their_required_parameters():
+    from ai_infra_agent.infrastructure.tool_schemas import get_tool_schema_registry
+
+    registry = get_tool_schema_registry()
+
+    assert registry.validate_params("create-key-pair", {}) == ["Missing required parameter 'key_name' for tool 'create-key-pair'."]
+    assert "availability_zone" in registry.get("create-public-subnet")["parameters"]["required"]
+    assert registry.validate_params("list-vpcs", {}) == []